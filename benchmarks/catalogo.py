@@ -0,0 +1,124 @@
+"""
+# -------------------------------
+# Benchmark do snapshot do catálogo
+# -------------------------------
+
+Uso: ``python -m benchmarks.catalogo [--produtos 10000]``
+
+Compara a memória retida e o tempo de consulta do snapshot em memória com os
+mesmos produtos carregados como objetos ORM.
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+
+# O banco do benchmark precisa estar definido antes de importar a aplicação.
+_tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp.name}"
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import lazyload  # noqa: E402
+
+from config.config_model import Base  # noqa: E402
+from config.database import SessionLocal, engine  # noqa: E402
+from src.catalogo import carregar  # noqa: E402
+from src.models import CategoriaModel, ProdutoModel  # noqa: E402
+
+
+def popular(quantidade: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(insert(CategoriaModel), [{"id": 1, "categoria": "Doces"}])
+        db.execute(
+            insert(ProdutoModel),
+            [
+                {
+                    "nome_produto": f"Produto {i}",
+                    "data_validade": date(2030, 1, 1),
+                    "marca": "Casa",
+                    "codigo_barras": f"789{i:010d}",
+                    "preco_unidade": Decimal(i % 5000) / 100,
+                    "unidade": "un",
+                    "quantidade": float(i % 100),
+                    "categoria_id": 1,
+                }
+                for i in range(quantidade)
+            ],
+        )
+        db.commit()
+
+
+def memoria(carga) -> tuple[object, int]:
+    """Executa ``carga`` e retorna o resultado e os bytes que ele retém."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    resultado = carga()
+    gc.collect()
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retido = sum(s.size_diff for s in depois.compare_to(antes, "filename"))
+    return resultado, retido
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--produtos", type=int, default=10_000)
+    parser.add_argument("--consultas", type=int, default=10_000)
+    args = parser.parse_args()
+    popular(args.produtos)
+
+    def carregar_orm(db):
+        return db.scalars(select(ProdutoModel).options(lazyload("*"))).all()
+
+    # Tempo de carga medido sem o tracemalloc, que distorce os números.
+    with SessionLocal() as db:
+        inicio = time.perf_counter()
+        carregar(db, 1)
+        carga_snapshot = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        carregar_orm(db)
+        carga_orm = time.perf_counter() - inicio
+
+    with SessionLocal() as db:
+        catalogo, bytes_snapshot = memoria(lambda: carregar(db, 1))
+    orm_db = SessionLocal()
+    objetos, bytes_orm = memoria(lambda: carregar_orm(orm_db))
+
+    ids = [p.id for p in catalogo.produtos]
+    inicio = time.perf_counter()
+    for i in range(args.consultas):
+        catalogo.produto_por_id[ids[i % len(ids)]]
+    consulta_snapshot = (time.perf_counter() - inicio) / args.consultas
+
+    with SessionLocal() as db:
+        inicio = time.perf_counter()
+        for i in range(args.consultas):
+            db.scalar(select(ProdutoModel).where(ProdutoModel.id == ids[i % len(ids)]))
+            db.expunge_all()
+        consulta_db = (time.perf_counter() - inicio) / args.consultas
+
+    por_10k = 10_000 / args.produtos
+    print(f"produtos: {len(objetos)}")
+    print(
+        f"snapshot: {bytes_snapshot * por_10k / 2**20:.2f} MiB por 10k produtos, "
+        f"carga {carga_snapshot * 1000:.1f} ms, "
+        f"consulta {consulta_snapshot * 1e6:.2f} µs"
+    )
+    print(
+        f"ORM:      {bytes_orm * por_10k / 2**20:.2f} MiB por 10k produtos, "
+        f"carga {carga_orm * 1000:.1f} ms, "
+        f"consulta {consulta_db * 1e6:.2f} µs"
+    )
+    orm_db.close()
+    os.unlink(_tmp.name)
+
+
+if __name__ == "__main__":
+    main()
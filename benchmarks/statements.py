@@ -0,0 +1,128 @@
+"""
+# -------------------------------
+# Benchmark do cache de SQL compilado
+# -------------------------------
+
+Uso: ``python -m benchmarks.statements [--consultas 5000]``
+
+Mede o CPU por busca de pedido por id (com as opções de carregamento do
+``PedidoScherma``, como no ``GET /pedidos/{id}``) montando a consulta de formas
+diferentes, e o mesmo comando pré-montado num engine sem cache de SQL.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+# O banco do benchmark precisa estar definido antes de importar a aplicação.
+_tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp.name}"
+
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from config.config_model import Base  # noqa: E402
+from config.database import SessionLocal, engine  # noqa: E402
+from config.projection import load_options  # noqa: E402
+from config.queries import get_by_id  # noqa: E402
+from src.models import ClienteModel, PedidoModel  # noqa: E402
+from src.schermas.pedido_scherma import PedidoScherma  # noqa: E402
+
+
+def popular(quantidade: int) -> None:
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(
+            insert(ClienteModel),
+            [
+                {
+                    "id": 1,
+                    "nome": "Cliente",
+                    "telefone": "11999998888",
+                    "endereco": "Rua",
+                }
+            ],
+        )
+        db.execute(
+            insert(PedidoModel),
+            [
+                {
+                    "cliente_id": 1,
+                    "quantidade": 1,
+                    "preco_total": Decimal("10.00"),
+                }
+                for _ in range(quantidade)
+            ],
+        )
+        db.commit()
+
+
+def legado(db: Session, id_: int) -> PedidoModel | None:
+    return (
+        db.query(PedidoModel)
+        .options(*load_options(PedidoModel, PedidoScherma))
+        .filter(PedidoModel.id == id_)
+        .first()
+    )
+
+
+def select_por_chamada(db: Session, id_: int) -> PedidoModel | None:
+    stmt = (
+        select(PedidoModel)
+        .options(*load_options(PedidoModel, PedidoScherma))
+        .where(PedidoModel.id == id_)
+    )
+    return db.scalars(stmt).first()
+
+
+def pre_montado(db: Session, id_: int) -> PedidoModel | None:
+    return get_by_id(db, PedidoModel, id_, PedidoScherma)
+
+
+def medir(bind, busca, consultas: int, ids: list[int]) -> tuple[float, float]:
+    """Retorna (µs de relógio, µs de CPU) por busca."""
+    with Session(bind) as db:
+        for id_ in ids[:50]:  # aquece o cache e o pool
+            busca(db, id_)
+            db.expunge_all()
+        relogio, cpu = time.perf_counter(), time.process_time()
+        for i in range(consultas):
+            busca(db, ids[i % len(ids)])
+            db.expunge_all()
+        relogio = time.perf_counter() - relogio
+        cpu = time.process_time() - cpu
+    return relogio / consultas * 1e6, cpu / consultas * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pedidos", type=int, default=1_000)
+    parser.add_argument("--consultas", type=int, default=5_000)
+    args = parser.parse_args()
+    popular(args.pedidos)
+    ids = list(range(1, args.pedidos + 1))
+    sem_cache = create_engine(engine.url, query_cache_size=0)
+
+    cenarios = [
+        ("Query legada", engine, legado),
+        ("select() por chamada", engine, select_por_chamada),
+        ("pré-montado", engine, pre_montado),
+        ("pré-montado, sem cache", sem_cache, pre_montado),
+    ]
+    resultados = {
+        nome: medir(bind, busca, args.consultas, ids) for nome, bind, busca in cenarios
+    }
+    base = resultados["pré-montado"][1]
+    for nome, (relogio, cpu) in resultados.items():
+        print(
+            f"{nome:<24} {relogio:8.1f} µs/req  CPU {cpu:8.1f} µs/req  "
+            f"({cpu - base:+.1f} µs vs pré-montado)"
+        )
+    sem_cache.dispose()
+    os.unlink(_tmp.name)
+
+
+if __name__ == "__main__":
+    main()
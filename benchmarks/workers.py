@@ -0,0 +1,103 @@
+"""
+# -------------------------------
+# Benchmark de throughput por número de workers
+# -------------------------------
+
+Uso: ``python -m benchmarks.workers [--workers 1 2 4] [--segundos 10]``
+
+Sobe o Gunicorn com ``gunicorn.conf.py`` para cada quantidade de workers e
+mede requisições por segundo e latência em ``--rota``. Sem ``--database-url``
+usa um SQLite temporário; para comparar com PostgreSQL, passe a URL dele.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+
+def subir(workers: int, porta: int, database_url: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_BIND": f"127.0.0.1:{porta}",
+    }
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "src.main:app", "-c", "gunicorn.conf.py"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{porta}"
+    limite = time.monotonic() + 30
+    while time.monotonic() < limite:
+        try:
+            if httpx.get(f"{base}/openapi.json").status_code == 200:
+                return processo
+        except httpx.TransportError:
+            time.sleep(0.2)
+    processo.terminate()
+    raise RuntimeError(f"Gunicorn com {workers} workers não respondeu.")
+
+
+def carga(url: str, segundos: float, clientes: int) -> list[float]:
+    """Dispara requisições em ``clientes`` threads e retorna as latências."""
+
+    def cliente() -> list[float]:
+        latencias = []
+        fim = time.monotonic() + segundos
+        with httpx.Client() as http:
+            while time.monotonic() < fim:
+                inicio = time.perf_counter()
+                http.get(url).raise_for_status()
+                latencias.append(time.perf_counter() - inicio)
+        return latencias
+
+    with ThreadPoolExecutor(clientes) as executor:
+        resultados = list(executor.map(lambda _: cliente(), range(clientes)))
+    return [latencia for lista in resultados for latencia in lista]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--clientes", type=int, default=32)
+    parser.add_argument("--rota", default="/pedidos")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.database_url is None:
+        tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        args.database_url = f"sqlite:///{tmp.name}"
+
+    print(f"{'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for workers in args.workers:
+        processo = subir(workers, args.porta, args.database_url)
+        try:
+            url = f"http://127.0.0.1:{args.porta}{args.rota}"
+            latencias = carga(url, args.segundos, args.clientes)
+        finally:
+            processo.terminate()
+            processo.wait()
+        p95 = statistics.quantiles(latencias, n=20)[-1]
+        print(
+            f"{workers:>7} {len(latencias) / args.segundos:>9.1f} "
+            f"{statistics.median(latencias) * 1000:>8.2f} {p95 * 1000:>8.2f}"
+        )
+
+    if tmp is not None:
+        os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,38 @@
 import os  # pode trocar para PostgreSQL se quiser
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./test.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Conexões mantidas abertas e extras permitidas sob pico; juntas limitam quantas
+# threads podem usar o banco ao mesmo tempo (ver config/threadpool.py).
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_CAPACIDADE = DB_POOL_SIZE + DB_MAX_OVERFLOW
+# Comandos distintos mantidos no cache de SQL compilado (padrão do SQLAlchemy).
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _ativar_foreign_keys(dbapi_connection, _connection_record):
+        # O SQLite só aplica FOREIGN KEY / ON DELETE com o pragma ativo, e ele
+        # vale por conexão.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,9 +1,26 @@
+import hmac
+import os
+
+from fastapi import Header, HTTPException, Request, status
+
 from .database import SessionLocal
+from .memoria import sessao_aberta, sessao_encerrada
+
+# Protege as rotas de /diagnostico; vazio as deixa fechadas para todos.
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
 
-def get_db():
+def get_db(request: Request):
     db = SessionLocal()
+    sessao_aberta(db)
     try:
         yield db
     finally:
+        endpoint = request.scope.get("endpoint")
+        sessao_encerrada(db, getattr(endpoint, "__name__", request.url.path))
         db.close()
+
+
+def exigir_admin(x_admin_token: str = Header("")) -> None:
+    if not ADMIN_TOKEN or not hmac.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
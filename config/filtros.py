@@ -0,0 +1,220 @@
+"""
+# -------------------------------
+# Filtros, ordenação e cursor das listagens
+# -------------------------------
+
+Cada router declara os filtros e as ordenações aceitos com :class:`ListaFiltros`.
+Só entram colunas que lideram algum índice (ou a chave primária), verificado na
+importação: um filtro sem índice vira varredura da tabela e não é aceito.
+
+A dependência gerada expõe os filtros como query params (visíveis no OpenAPI),
+mais ``ordem`` (``campo`` ou ``-campo``) e ``apos`` (cursor). O cursor da
+próxima página vai no header ``X-Proximo-Cursor``.
+"""
+
+import base64
+import binascii
+import inspect
+import json
+import operator
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Column, Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+NEXT_CURSOR_HEADER = "X-Proximo-Cursor"
+
+OPERADORES: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ge": operator.ge,
+    "le": operator.le,
+    "lt": operator.lt,
+}
+
+
+@dataclass(frozen=True)
+class Filtro:
+    campo: str
+    tipo: type
+    op: str = "eq"
+    descricao: str | None = None
+
+
+def _coluna(atributo: InstrumentedAttribute) -> Column:
+    return atributo.property.columns[0]
+
+
+def _indexada(coluna: Column) -> bool:
+    """Se a coluna é a primeira de algum índice, unique ou da chave primária."""
+    if coluna.primary_key or coluna.unique:
+        return True
+    return any(next(iter(idx.columns)) is coluna for idx in coluna.table.indexes)
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+class ListaFiltros:
+    """
+    Filtros e ordenações permitidos para a listagem de ``model``.
+
+    ``ordens`` mapeia o nome da coluna ao tipo Python do seu valor, usado para
+    reconstruir o cursor; ``id`` é sempre aceito e é a ordem padrão. As colunas
+    de ordenação não podem ser nulas, para que a comparação do cursor seja
+    sempre definida.
+    """
+
+    def __init__(
+        self,
+        model: type,
+        filtros: dict[str, Filtro],
+        ordens: dict[str, type],
+    ) -> None:
+        self.model = model
+        self.filtros = filtros
+        self.ordens = {"id": int, **ordens}
+        for nome, filtro in filtros.items():
+            if filtro.op not in OPERADORES:
+                raise ValueError(f"{nome}: operador {filtro.op!r} desconhecido.")
+            self._exigir_indice(nome, filtro.campo)
+        for campo in self.ordens:
+            self._exigir_indice(f"ordem={campo}", campo)
+            if _coluna(getattr(model, campo)).nullable:
+                raise ValueError(f"ordem={campo}: coluna anulável não serve de cursor.")
+        self.dependency = self._dependencia()
+
+    def _exigir_indice(self, nome: str, campo: str) -> None:
+        coluna = _coluna(getattr(self.model, campo))
+        if not _indexada(coluna):
+            raise ValueError(f"{nome}: {coluna.table.name}.{campo} não tem índice.")
+
+    def _dependencia(self) -> Callable[..., "Listagem"]:
+        parametros = [
+            inspect.Parameter(
+                nome,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(None, description=filtro.descricao),
+                annotation=filtro.tipo | None,
+            )
+            for nome, filtro in self.filtros.items()
+        ]
+        campos = ", ".join(self.ordens)
+        parametros += [
+            inspect.Parameter(
+                "ordem",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(
+                    None,
+                    description=f"Um de: {campos}. Prefixo `-` para decrescente.",
+                ),
+                annotation=str | None,
+            ),
+            inspect.Parameter(
+                "apos",
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Query(None, description="Cursor do header X-Proximo-Cursor."),
+                annotation=str | None,
+            ),
+        ]
+
+        def dependencia(**valores: Any) -> Listagem:
+            ordem = valores.pop("ordem")
+            apos = valores.pop("apos")
+            return Listagem(self, valores, ordem, apos)
+
+        dependencia.__signature__ = inspect.Signature(parametros)
+        return dependencia
+
+
+class Listagem:
+    """Filtros, ordenação e cursor de uma requisição, prontos para o ``select``."""
+
+    def __init__(
+        self,
+        spec: ListaFiltros,
+        valores: dict[str, Any],
+        ordem: str | None,
+        apos: str | None,
+    ) -> None:
+        self.spec = spec
+        self.valores = {k: v for k, v in valores.items() if v is not None}
+        self.ordem = ordem
+        campo = (ordem or "id").removeprefix("-")
+        if campo not in spec.ordens:
+            raise _bad_request(f"ordem deve ser um de: {', '.join(spec.ordens)}.")
+        self.campo = campo
+        self.desc = bool(ordem) and ordem.startswith("-")
+        self.cursor = self._ler_cursor(apos) if apos else None
+
+    @property
+    def ativa(self) -> bool:
+        """Se a requisição usou algum filtro, ordenação ou cursor."""
+        return bool(self.valores) or self.ordem is not None or self.cursor is not None
+
+    def _ler_cursor(self, apos: str) -> tuple[Any, int]:
+        try:
+            dados = json.loads(base64.urlsafe_b64decode(apos.encode()))
+            if dados["ordem"] != (self.ordem or "id"):
+                raise _bad_request("Cursor gerado para outra ordenação.")
+            valor = TypeAdapter(self.spec.ordens[self.campo]).validate_python(
+                dados["valor"]
+            )
+            return valor, int(dados["id"])
+        except (binascii.Error, ValueError, KeyError, TypeError, ValidationError):
+            raise _bad_request("Cursor inválido.") from None
+
+    def _escrever_cursor(self, obj: Any) -> str:
+        valor = TypeAdapter(self.spec.ordens[self.campo]).dump_python(
+            getattr(obj, self.campo), mode="json"
+        )
+        dados = {"ordem": self.ordem or "id", "valor": valor, "id": obj.id}
+        return base64.urlsafe_b64encode(json.dumps(dados).encode()).decode()
+
+    def aplicar(self, stmt: Select, page: int, page_size: int) -> Select:
+        """
+        Acrescenta filtros, ordenação e paginação a ``stmt``.
+
+        Com cursor a página continua do último registro visto (keyset); sem ele
+        vale o ``OFFSET`` de ``page``. Busca um registro a mais para saber se
+        existe próxima página.
+        """
+        model = self.spec.model
+        for nome, valor in self.valores.items():
+            filtro = self.spec.filtros[nome]
+            stmt = stmt.where(
+                OPERADORES[filtro.op](getattr(model, filtro.campo), valor)
+            )
+
+        coluna, id_ = getattr(model, self.campo), model.id
+        depois = operator.lt if self.desc else operator.gt
+        if self.cursor is not None:
+            valor, ultimo_id = self.cursor
+            if self.campo == "id":
+                stmt = stmt.where(depois(id_, ultimo_id))
+            else:
+                stmt = stmt.where(
+                    or_(
+                        depois(coluna, valor),
+                        and_(coluna == valor, depois(id_, ultimo_id)),
+                    )
+                )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+
+        ordem = [coluna] if self.campo == "id" else [coluna, id_]
+        if self.desc:
+            ordem = [c.desc() for c in ordem]
+        return stmt.order_by(*ordem).limit(page_size + 1)
+
+    def pagina(self, response: Response, rows: Sequence, page_size: int) -> list:
+        """Corta o registro extra e publica o cursor da próxima página."""
+        if len(rows) > page_size:
+            response.headers[NEXT_CURSOR_HEADER] = self._escrever_cursor(
+                rows[page_size - 1]
+            )
+        return list(rows[:page_size])
@@ -0,0 +1,77 @@
+"""
+# -------------------------------
+# Load shedding (limite de concorrência)
+# -------------------------------
+"""
+
+import asyncio
+import os
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.logger_custom import logger as log
+
+# Requisições atendidas ao mesmo tempo; 0 desliga o limitador. Deve acompanhar
+# o pool do banco (pool_size + max_overflow) para que a fila fique aqui, onde
+# tem prazo, e não na espera por uma conexão.
+MAX_CONCURRENCIA = int(os.getenv("MAX_CONCURRENCIA", "0"))
+# Tempo máximo aguardando uma vaga antes de recusar com 503.
+ESPERA_MAXIMA = float(os.getenv("CONCURRENCIA_ESPERA_MAXIMA", "0.5"))
+RETRY_AFTER = int(os.getenv("CONCURRENCIA_RETRY_AFTER", "1"))
+
+
+def _sobrecarga() -> JSONResponse:
+    return JSONResponse(
+        {"detail": "Servidor sobrecarregado, tente novamente."},
+        status_code=503,
+        headers={"Retry-After": str(RETRY_AFTER)},
+    )
+
+
+class ConcurrencyLimitMiddleware:
+    """
+    Limita as requisições em andamento neste worker.
+
+    Quem não consegue uma vaga em ``espera`` segundos recebe ``503`` com
+    ``Retry-After``, mantendo a latência das demais estável sob sobrecarga.
+    Rotas de streaming/long-poll (``exempt``) ficam fora do limite, já que
+    seguram a vaga por muito tempo.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limite: int,
+        espera: float = ESPERA_MAXIMA,
+        exempt: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.limite = limite
+        self.espera = espera
+        self.exempt = exempt
+        self._vagas = asyncio.Semaphore(limite)
+        self.recusadas = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await asyncio.wait_for(self._vagas.acquire(), self.espera)
+        except TimeoutError:
+            self.recusadas += 1
+            log.warning("Load shedding: %s recusada (503).", scope["path"])
+            await _sobrecarga()(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._vagas.release()
+
+
+async def pool_timeout_handler(_request: Request, _exc: Exception) -> Response:
+    """Converte o timeout do pool do SQLAlchemy em 503 com ``Retry-After``."""
+    return _sobrecarga()
@@ -0,0 +1,156 @@
+"""
+# -------------------------------
+# Diagnóstico de memória
+# -------------------------------
+
+RSS do processo, maiores alocações do ``tracemalloc`` (e a diferença para um
+snapshot de referência) e o tamanho do identity map das sessões por rota.
+
+Um vazamento aparece como RSS e diff crescendo entre snapshots com o mesmo
+tráfego; excesso de carga aparece como identity map grande na rota, com as
+sessões fechando normalmente.
+"""
+
+import gc
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+try:  # sem o psutil instalado o RSS vem do pico informado pelo resource
+    import psutil
+except ImportError:  # pragma: no cover
+    psutil = None
+
+# Liga o tracemalloc na subida, guardando N frames por alocação; 0 desliga.
+MEMORIA_TRACEMALLOC = int(os.getenv("MEMORIA_TRACEMALLOC", "0"))
+
+_FILTROS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+_referencia: tracemalloc.Snapshot | None = None
+
+
+def rss() -> dict[str, Any]:
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return {"rss_bytes": info.rss, "vms_bytes": info.vms}
+    # ru_maxrss é o pico, em KiB no Linux e em bytes no macOS.
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"rss_pico_bytes": pico if sys.platform == "darwin" else pico * 1024}
+
+
+def iniciar_tracemalloc(frames: int = MEMORIA_TRACEMALLOC) -> None:
+    if frames and not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def parar_tracemalloc() -> None:
+    global _referencia
+    _referencia = None
+    tracemalloc.stop()
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_FILTROS)
+
+
+def _formatar(stat: tracemalloc.Statistic | tracemalloc.StatisticDiff) -> dict:
+    frame = stat.traceback[0]
+    item = {
+        "origem": f"{frame.filename}:{frame.lineno}",
+        "bytes": stat.size,
+        "blocos": stat.count,
+    }
+    if isinstance(stat, tracemalloc.StatisticDiff):
+        item["bytes_diff"] = stat.size_diff
+        item["blocos_diff"] = stat.count_diff
+    return item
+
+
+def top_alocacoes(limite: int = 20) -> list[dict]:
+    """Linhas de código que mais retêm memória agora."""
+    if not tracemalloc.is_tracing():
+        return []
+    return [_formatar(s) for s in _snapshot().statistics("lineno")[:limite]]
+
+
+def marcar_referencia() -> None:
+    """Guarda o snapshot usado como base por :func:`diff_alocacoes`."""
+    global _referencia
+    _referencia = _snapshot()
+
+
+def diff_alocacoes(limite: int = 20) -> list[dict] | None:
+    """Maiores crescimentos desde :func:`marcar_referencia`."""
+    if _referencia is None or not tracemalloc.is_tracing():
+        return None
+    diff = _snapshot().compare_to(_referencia, "lineno")
+    return [_formatar(s) for s in diff[:limite]]
+
+
+@dataclass
+class IdentityMapStats:
+    sessoes: int = 0
+    total: int = 0
+    maximo: int = 0
+
+    @property
+    def media(self) -> float:
+        return self.total / self.sessoes if self.sessoes else 0.0
+
+
+_por_rota: dict[str, IdentityMapStats] = {}
+_sessoes_abertas: "weakref.WeakSet[Session]" = weakref.WeakSet()
+_lock = threading.Lock()
+
+
+def sessao_aberta(db: Session) -> None:
+    _sessoes_abertas.add(db)
+
+
+def sessao_encerrada(db: Session, rota: str) -> None:
+    """Registra quantos objetos a sessão da requisição manteve no identity map."""
+    tamanho = len(db.identity_map)
+    _sessoes_abertas.discard(db)
+    with _lock:
+        stats = _por_rota.setdefault(rota, IdentityMapStats())
+        stats.sessoes += 1
+        stats.total += tamanho
+        stats.maximo = max(stats.maximo, tamanho)
+
+
+def identity_maps() -> dict[str, Any]:
+    with _lock:
+        por_rota = {
+            rota: {
+                "sessoes": s.sessoes,
+                "media": round(s.media, 1),
+                "maximo": s.maximo,
+            }
+            for rota, s in sorted(_por_rota.items())
+        }
+    # Sessões de requisições em andamento ou nunca fechadas (vazamento).
+    abertas = [len(db.identity_map) for db in list(_sessoes_abertas)]
+    return {"por_rota": por_rota, "abertas": len(abertas), "objetos": sum(abertas)}
+
+
+def resumo(limite: int = 20) -> dict[str, Any]:
+    return {
+        "processo": rss(),
+        "gc": {"contagens": gc.get_count(), "objetos": len(gc.get_objects())},
+        "tracemalloc": {
+            "ativo": tracemalloc.is_tracing(),
+            "memoria_rastreada": tracemalloc.get_traced_memory(),
+            "top": top_alocacoes(limite),
+        },
+        "identity_map": identity_maps(),
+    }
@@ -0,0 +1,52 @@
+"""
+# -------------------------------
+# Dimensionamento dos workers
+# -------------------------------
+
+Usado pelo ``gunicorn.conf.py``. Cada worker é um processo com o próprio pool
+de conexões, então o total de conexões abertas é ``workers * POOL_CAPACIDADE``.
+"""
+
+import os
+
+from sqlalchemy.engine import make_url
+
+from config.database import DATABASE_URL, POOL_CAPACIDADE
+
+# Conexões que o servidor do banco aceita para esta aplicação.
+DB_MAX_CONEXOES = int(os.getenv("DB_MAX_CONEXOES", "100"))
+
+
+def cpus_disponiveis() -> int:
+    """CPUs que este processo pode usar (respeita ``taskset``/cpuset)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def workers_recomendados(
+    cpus: int,
+    backend: str,
+    pool_por_worker: int = POOL_CAPACIDADE,
+    max_conexoes: int = DB_MAX_CONEXOES,
+) -> int:
+    """
+    Calcula quantos workers subir.
+
+    Com SQLite há um único escritor por arquivo: mais processos só disputam o
+    lock e devolvem ``database is locked``, então fica um worker e a
+    concorrência vem do thread pool. Nos demais bancos usa ``2 * cpus + 1``,
+    limitado para que a soma dos pools caiba em ``max_conexoes``.
+    """
+    if backend == "sqlite":
+        return 1
+    por_conexoes = max(1, max_conexoes // max(1, pool_por_worker))
+    return max(1, min(2 * cpus + 1, por_conexoes))
+
+
+def workers_configurados() -> int:
+    """``WEB_CONCURRENCY`` tem prioridade sobre o cálculo automático."""
+    if valor := os.getenv("WEB_CONCURRENCY"):
+        return int(valor)
+    backend = make_url(DATABASE_URL).get_backend_name()
+    return workers_recomendados(cpus_disponiveis(), backend)
@@ -0,0 +1,176 @@
+"""
+# -------------------------------
+# Profiling sob demanda
+# -------------------------------
+
+Desligado por padrão: sem ``PROFILER_TOKEN`` nem ``PROFILER_AMOSTRAGEM`` o
+middleware nem é adicionado à aplicação.
+
+- Requisições com ``X-Profile: <PROFILER_TOKEN>`` recebem o relatório no lugar
+  da resposta normal.
+- Uma fração ``PROFILER_AMOSTRAGEM`` (0 a 1) das demais é perfilada e o
+  relatório gravado em ``PROFILER_DIR``, com o nome do handler no arquivo.
+
+Usa o pyinstrument (relatório HTML com flame graph) quando instalado; senão o
+cProfile, gravando ``.prof`` para abrir no snakeviz. Os dois medem a thread do
+event loop: o trabalho enviado ao thread pool aparece como tempo de ``await``.
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.logger_custom import logger as log
+
+try:  # pyinstrument é opcional; sem ele o relatório vem do cProfile
+    from pyinstrument import Profiler as Pyinstrument
+except ImportError:  # pragma: no cover
+    Pyinstrument = None
+
+PROFILER_TOKEN = os.getenv("PROFILER_TOKEN", "")
+PROFILER_AMOSTRAGEM = float(os.getenv("PROFILER_AMOSTRAGEM", "0"))
+PROFILER_DIR = Path(
+    os.getenv("PROFILER_DIR", Path(tempfile.gettempdir()) / "doceteria-profiles")
+)
+PROFILE_HEADER = b"x-profile"
+
+
+def profiler_habilitado() -> bool:
+    return bool(PROFILER_TOKEN) or PROFILER_AMOSTRAGEM > 0
+
+
+class _PerfilPyinstrument:
+    extensao = "html"
+    media_type = "text/html"
+
+    def __init__(self) -> None:
+        self._profiler = Pyinstrument(async_mode="enabled")
+
+    def iniciar(self) -> None:
+        self._profiler.start()
+
+    def parar(self) -> None:
+        self._profiler.stop()
+
+    def relatorio(self) -> str:
+        return self._profiler.output_html()
+
+    def salvar(self, caminho: Path) -> None:
+        caminho.write_text(self.relatorio(), encoding="utf-8")
+
+
+class _PerfilCProfile:
+    extensao = "prof"
+    media_type = "text/plain"
+
+    def __init__(self) -> None:
+        self._profiler = cProfile.Profile()
+
+    def iniciar(self) -> None:
+        self._profiler.enable()
+
+    def parar(self) -> None:
+        self._profiler.disable()
+
+    def relatorio(self) -> str:
+        saida = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=saida)
+        stats.sort_stats("cumulative").print_stats(40)
+        return saida.getvalue()
+
+    def salvar(self, caminho: Path) -> None:
+        self._profiler.dump_stats(caminho)
+
+
+def novo_perfil() -> _PerfilPyinstrument | _PerfilCProfile:
+    return _PerfilPyinstrument() if Pyinstrument is not None else _PerfilCProfile()
+
+
+def _nome_rota(scope: Scope) -> str:
+    """Nome do handler resolvido pelo roteador, ou o path quando não houver."""
+    endpoint = scope.get("endpoint")
+    nome = getattr(endpoint, "__name__", None) or scope["path"]
+    return re.sub(r"[^\w-]+", "_", nome).strip("_") or "raiz"
+
+
+class ProfilerMiddleware:
+    """
+    Perfila requisições pedidas pelo header administrativo ou sorteadas.
+
+    Apenas uma requisição é perfilada por vez; as que chegam enquanto isso são
+    atendidas normalmente.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str = PROFILER_TOKEN,
+        amostragem: float = PROFILER_AMOSTRAGEM,
+        destino: Path = PROFILER_DIR,
+        exempt: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.token = token.encode()
+        self.amostragem = amostragem
+        self.destino = Path(destino)
+        self.exempt = exempt
+        self._ocupado = False
+
+    def _pedido_pelo_header(self, scope: Scope) -> bool:
+        if not self.token:
+            return False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+
+        pedido = self._pedido_pelo_header(scope)
+        sorteado = self.amostragem > 0 and random.random() < self.amostragem
+        if self._ocupado or not (pedido or sorteado):
+            await self.app(scope, receive, send)
+            return
+
+        async def descartar(_message: Message) -> None:
+            # A resposta do handler é substituída pelo relatório.
+            return None
+
+        self._ocupado = True
+        perfil = novo_perfil()
+        perfil.iniciar()
+        try:
+            await self.app(scope, receive, descartar if pedido else send)
+        finally:
+            perfil.parar()
+            self._ocupado = False
+            caminho = self._salvar(perfil, scope)
+
+        if pedido:
+            response = Response(
+                perfil.relatorio(),
+                media_type=perfil.media_type,
+                headers={"X-Profile-Arquivo": caminho.name},
+            )
+            await response(scope, receive, send)
+
+    def _salvar(self, perfil, scope: Scope) -> Path:
+        self.destino.mkdir(parents=True, exist_ok=True)
+        nome = f"{_nome_rota(scope)}-{time.strftime('%Y%m%d-%H%M%S')}"
+        caminho = self.destino / f"{nome}-{time.monotonic_ns()}.{perfil.extensao}"
+        perfil.salvar(caminho)
+        log.info("Profile de %s gravado em %s.", scope["path"], caminho)
+        return caminho
@@ -0,0 +1,95 @@
+"""
+# -------------------------------
+# Projeção de campos (?fields=)
+# -------------------------------
+"""
+
+from functools import cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import inspect
+from sqlalchemy.orm import lazyload, load_only, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> list[str] | None:
+    """
+    Converte o parâmetro ``fields`` (ex.: ``"cliente_id,preco_total"``) em uma
+    lista de campos do schema. Retorna ``None`` quando nenhum campo foi pedido.
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    invalid = [name for name in names if name not in schema.model_fields]
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campos inválidos: {', '.join(invalid)}.",
+        )
+    return names or None
+
+
+def _nested_schema(annotation: Any) -> type[BaseModel] | None:
+    """Extrai o schema aninhado de anotações como ``X``, ``list[X]`` ou ``X | None``."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) in (list, Union, UnionType):
+        for arg in get_args(annotation):
+            nested = _nested_schema(arg)
+            if nested is not None:
+                return nested
+    return None
+
+
+def load_options(
+    model: type, schema: type[BaseModel], fields: list[str] | None = None
+) -> list[LoaderOption]:
+    """
+    Monta as opções de carregamento para ``model`` contendo apenas o necessário
+    para serializar ``schema`` (ou somente ``fields``): colunas via ``load_only``,
+    relacionamentos pedidos via ``selectinload`` e os demais via ``lazyload``.
+    """
+    mapper = inspect(model)
+    names = fields or list(schema.model_fields)
+    columns = {
+        getattr(model, col.key) for col in mapper.column_attrs if col.key in names
+    }
+    options: list[LoaderOption] = []
+
+    for rel in mapper.relationships:
+        attr = getattr(model, rel.key)
+        if rel.key not in names:
+            options.append(lazyload(attr))
+            continue
+        # Colunas locais (FKs) são necessárias para resolver o relacionamento.
+        columns.update(
+            mapper.get_property_by_column(col).class_attribute
+            for col in rel.local_columns
+        )
+        loader = selectinload(attr)
+        nested = _nested_schema(schema.model_fields[rel.key].annotation)
+        if nested is not None:
+            loader = loader.options(*load_options(rel.mapper.class_, nested))
+        options.append(loader)
+
+    if columns:
+        options.insert(0, load_only(*columns))
+    return options
+
+
+@cache
+def _adapter(schema: type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(schema.model_fields[name].annotation)
+
+
+def project(obj: Any, schema: type[BaseModel], fields: list[str]) -> dict[str, Any]:
+    """Serializa apenas ``fields`` de um objeto ORM usando os tipos do schema."""
+    data = {}
+    for name in fields:
+        adapter = _adapter(schema, name)
+        value = adapter.validate_python(getattr(obj, name), from_attributes=True)
+        data[name] = adapter.dump_python(value, mode="json")
+    return data
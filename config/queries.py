@@ -0,0 +1,205 @@
+"""
+# -------------------------------
+# Consultas reutilizadas pelos routers
+# -------------------------------
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import Select, bindparam, delete, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from config.projection import load_options
+from config.soft_delete import INCLUIR_EXCLUIDOS, agora
+
+T = TypeVar("T")
+
+# Limite de parâmetros por ``IN (...)``; o SQLite antigo aceita no máximo 999.
+CHUNK_SIZE = 500
+# Ids pedidos em ``?ids=`` que não existem, separados por vírgula.
+MISSING_IDS_HEADER = "X-Ids-Nao-Encontrados"
+
+
+@lru_cache(maxsize=256)
+def select_by_id(
+    model: type,
+    schema: type[BaseModel] | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> Select:
+    """
+    ``SELECT`` por id montado uma vez e reaproveitado entre requisições.
+
+    O id entra pelo parâmetro ``id`` na execução, então o comando (e as opções
+    de carregamento do ``schema``) tem sempre a mesma chave no cache de SQL
+    compilado do SQLAlchemy e nenhum objeto é reconstruído por requisição.
+    """
+    stmt = select(model).where(model.id == bindparam("id"))
+    if schema is not None:
+        stmt = stmt.options(*load_options(model, schema, list(fields or ()) or None))
+    return stmt
+
+
+def get_by_id(
+    db: Session,
+    model: type[T],
+    id_: int,
+    schema: type[BaseModel] | None = None,
+    fields: Sequence[str] | None = None,
+) -> T | None:
+    """Busca ``id_`` com :func:`select_by_id`; ``fields`` restringe as colunas."""
+    chave = tuple(sorted(fields)) if fields else None
+    return db.scalars(select_by_id(model, schema, chave), {"id": id_}).first()
+
+
+def update_data(model: type, dados: BaseModel) -> dict[str, Any]:
+    """
+    Campos enviados no PATCH, inclusive os ``null`` que limpam uma coluna.
+
+    ``null`` em coluna ``NOT NULL`` responde ``422`` em vez de estourar no banco.
+    """
+    data = dados.model_dump(exclude_unset=True)
+    colunas = model.__table__.c
+    obrigatorios = sorted(
+        nome
+        for nome, valor in data.items()
+        if valor is None and not colunas[nome].nullable
+    )
+    if obrigatorios:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Campos não podem ser nulos: {', '.join(obrigatorios)}.",
+        )
+    return data
+
+
+def update_returning(
+    db: Session,
+    model: type[T],
+    id_: int,
+    data: dict[str, Any],
+    options: list[LoaderOption] | tuple[LoaderOption, ...] = (),
+) -> T | None:
+    """
+    Atualiza ``data`` no registro ``id_`` e retorna o objeto atualizado.
+
+    Usa ``UPDATE ... RETURNING`` (um único comando) quando o banco suporta; em
+    SQLite anterior à 3.35 cai para ``UPDATE`` seguido de ``SELECT``. ``options``
+    controla o que é carregado, evitando relacionamentos que a resposta não usa.
+    Retorna ``None`` quando nenhuma linha foi afetada. Serialize o objeto antes
+    do ``commit``, que expira os atributos e provocaria um novo ``SELECT``.
+    """
+    by_id = model.id == id_
+    if not data:
+        return db.scalars(select(model).options(*options).where(by_id)).first()
+
+    stmt = update(model).where(by_id).values(data)
+    no_sync = {"synchronize_session": False}
+    if db.get_bind().dialect.update_returning:
+        returning = stmt.returning(model).options(*options)
+        return db.scalars(returning, execution_options=no_sync).first()
+
+    if not db.execute(stmt, execution_options=no_sync).rowcount:
+        return None
+    return db.scalars(select(model).options(*options).where(by_id)).first()
+
+
+def parse_ids(ids: str) -> list[int]:
+    """Converte ``"1,2,3"`` em ``[1, 2, 3]``, sem repetições e mantendo a ordem."""
+    try:
+        valores = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids deve ser uma lista de inteiros separados por vírgula.",
+        ) from None
+    if not valores:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Informe ao menos um id."
+        )
+    return list(dict.fromkeys(valores))
+
+
+def chunked(values: Sequence[T], size: int = CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def fetch_ids(
+    db: Session,
+    model: type[T],
+    ids: Sequence[int],
+    options: list[LoaderOption] | tuple[LoaderOption, ...] = (),
+) -> dict[int, T]:
+    """Busca ``ids`` com ``SELECT ... WHERE id IN (...)`` em lotes, indexando por id."""
+    por_id: dict[int, T] = {}
+    for lote in chunked(ids):
+        stmt = select(model).options(*options).where(model.id.in_(lote))
+        por_id.update((obj.id, obj) for obj in db.scalars(stmt))
+    return por_id
+
+
+def in_request_order(
+    response: Response, por_id: Mapping[int, T], ids: Sequence[int]
+) -> list[T]:
+    """
+    Devolve os registros na ordem de ``ids`` e informa os que faltaram no header
+    ``X-Ids-Nao-Encontrados``.
+    """
+    if faltando := [i for i in ids if i not in por_id]:
+        response.headers[MISSING_IDS_HEADER] = ",".join(map(str, faltando))
+    return [por_id[i] for i in ids if i in por_id]
+
+
+def delete_ids(db: Session, model: type, ids: Sequence[int]) -> list[int]:
+    """
+    Remove os registros ``ids`` com ``DELETE ... WHERE id IN (...)`` em lotes e
+    retorna os ids realmente removidos.
+
+    Nenhum objeto é carregado: os dependentes são tratados pelo ``ON DELETE`` do
+    banco. Uma FK ``RESTRICT`` violada levanta ``IntegrityError``. Registros com
+    exclusão lógica também são removidos.
+    """
+    no_sync = {"synchronize_session": False, INCLUIR_EXCLUIDOS: True}
+    returning = db.get_bind().dialect.delete_returning
+    removidos: list[int] = []
+    for lote in chunked(ids):
+        stmt = delete(model).where(model.id.in_(lote))
+        if returning:
+            result = db.execute(stmt.returning(model.id), execution_options=no_sync)
+            removidos.extend(result.scalars())
+            continue
+        existentes = db.scalars(select(model.id).where(model.id.in_(lote))).all()
+        db.execute(stmt, execution_options=no_sync)
+        removidos.extend(existentes)
+    return removidos
+
+
+def soft_delete_ids(
+    db: Session, model: type, ids: Sequence[int], coluna: Any = None
+) -> list[int]:
+    """
+    Preenche ``excluido_em`` dos registros ``ids`` e retorna os ids afetados.
+
+    Com ``coluna`` (uma FK de ``model``) marca os registros que apontam para
+    ``ids``, ex.: as vendas dos pedidos excluídos.
+    """
+    coluna = model.id if coluna is None else coluna
+    no_sync = {"synchronize_session": False}
+    returning = db.get_bind().dialect.update_returning
+    momento = agora()
+    marcados: list[int] = []
+    for lote in chunked(ids):
+        stmt = update(model).where(coluna.in_(lote)).values(excluido_em=momento)
+        if returning:
+            result = db.execute(stmt.returning(model.id), execution_options=no_sync)
+            marcados.extend(result.scalars())
+            continue
+        existentes = db.scalars(select(model.id).where(coluna.in_(lote))).all()
+        db.execute(stmt, execution_options=no_sync)
+        marcados.extend(existentes)
+    return marcados
@@ -0,0 +1,171 @@
+"""
+# -------------------------------
+# Rate limiting (token bucket)
+# -------------------------------
+"""
+
+import math
+import os
+import threading
+import time
+from typing import Protocol
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.logger_custom import logger as log
+
+# Requisições por segundo por cliente; 0 desliga o limitador.
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "0"))
+# Rajada máxima aceita de uma vez (capacidade do balde).
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "0")) or max(
+    1, math.ceil(RATE_LIMIT_RPS * 2)
+)
+API_KEY_HEADER = b"x-api-key"
+# Tempo máximo, em segundos, que uma requisição espera pelo Redis.
+REDIS_TIMEOUT = float(os.getenv("RATE_LIMIT_REDIS_TIMEOUT", "0.5"))
+
+
+class TokenBucket(Protocol):
+    async def consume(self, key: str) -> float:
+        """Consome uma ficha; retorna 0 se permitido ou os segundos de espera."""
+        ...
+
+
+class MemoryTokenBucket:
+    """Baldes mantidos no processo; cada worker limita de forma independente."""
+
+    MAX_KEYS = 10_000
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                if len(self._buckets) > self.MAX_KEYS:
+                    self._prune(now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+    def _prune(self, now: float) -> None:
+        # Baldes que já estariam cheios equivalem a não ter balde.
+        cheio = self.burst / self.rate
+        for key, (_, last) in list(self._buckets.items()):
+            if now - last >= cheio:
+                del self._buckets[key]
+
+
+# Recarga e consumo atômicos no Redis, compartilhados por todos os workers.
+_REDIS_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisTokenBucket:
+    """
+    Baldes compartilhados no Redis.
+
+    Se o Redis cair ou demorar mais que ``REDIS_TIMEOUT`` o limite passa a ser
+    feito por ``MemoryTokenBucket`` neste processo, até o Redis voltar.
+    """
+
+    def __init__(self, url: str, rate: float, burst: int) -> None:
+        import redis.asyncio as redis
+        from redis import exceptions
+
+        self.rate = rate
+        self.burst = burst
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT
+        )
+        self._script = self._client.register_script(_REDIS_SCRIPT)
+        self._falhas = (exceptions.ConnectionError, exceptions.TimeoutError)
+        self._local = MemoryTokenBucket(rate, burst)
+        self._degradado = False
+
+    async def consume(self, key: str) -> float:
+        try:
+            wait = await self._script(
+                keys=[f"ratelimit:{key}"], args=[self.rate, self.burst, time.time()]
+            )
+        except self._falhas as exc:
+            if not self._degradado:
+                log.warning("Redis indisponível; rate limit apenas local: %s", exc)
+                self._degradado = True
+            return await self._local.consume(key)
+        if self._degradado:
+            log.info("Redis disponível de novo; rate limit compartilhado.")
+            self._degradado = False
+        return float(wait)
+
+
+def make_bucket(rate: float = RATE_LIMIT_RPS, burst: int = RATE_LIMIT_BURST):
+    """Usa o Redis quando ``REDIS_URL`` estiver configurado."""
+    if url := os.getenv("REDIS_URL"):
+        try:
+            return RedisTokenBucket(url, rate, burst)
+        except ImportError as exc:
+            raise RuntimeError(
+                "REDIS_URL definido, mas o pacote 'redis' não está instalado."
+            ) from exc
+    return MemoryTokenBucket(rate, burst)
+
+
+def client_key(scope: Scope) -> str:
+    """Identifica o cliente pelo header ``X-API-Key`` ou, na falta dele, pelo IP."""
+    for name, value in scope["headers"]:
+        if name == API_KEY_HEADER:
+            return f"key:{value.decode('latin-1')}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'desconhecido'}"
+
+
+class RateLimitMiddleware:
+    """Responde ``429 Too Many Requests`` quando o balde do cliente esvazia."""
+
+    def __init__(
+        self, app: ASGIApp, bucket: TokenBucket, exempt: tuple[str, ...] = ()
+    ) -> None:
+        self.app = app
+        self.bucket = bucket
+        self.exempt = exempt
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            await self.app(scope, receive, send)
+            return
+
+        wait = await self.bucket.consume(client_key(scope))
+        if wait > 0:
+            response = JSONResponse(
+                {"detail": "Limite de requisições excedido."},
+                status_code=429,
+                headers={"Retry-After": str(math.ceil(wait))},
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,55 @@
+"""
+# -------------------------------
+# Exclusão lógica (soft delete)
+# -------------------------------
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, event
+from sqlalchemy.orm import (
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+    with_loader_criteria,
+)
+
+# Opção de execução que desliga o filtro, ex.: para auditoria ou arquivamento.
+INCLUIR_EXCLUIDOS = "incluir_excluidos"
+
+
+class SoftDeleteMixin:
+    """
+    Adiciona ``excluido_em`` ao model.
+
+    Registros com ``excluido_em`` preenchido ficam fora de todo ``SELECT`` do ORM,
+    inclusive dos relacionamentos carregados a partir de outros models.
+    """
+
+    excluido_em: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
+
+
+def agora() -> datetime:
+    return datetime.now(UTC)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filtrar_excluidos(execute_state: ORMExecuteState) -> None:
+    # Vale também para UPDATE/DELETE em massa: um registro excluído não volta a
+    # ser alterado. Os relacionamentos herdam o critério do SELECT que os originou.
+    if (
+        (execute_state.is_select or execute_state.is_update or execute_state.is_delete)
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get(INCLUIR_EXCLUIDOS, False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.excluido_em.is_(None),
+                include_aliases=True,
+            )
+        )
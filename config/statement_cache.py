@@ -0,0 +1,53 @@
+"""
+# -------------------------------
+# Estatísticas do cache de SQL compilado
+# -------------------------------
+
+O SQLAlchemy guarda o SQL compilado de cada comando, indexado pela estrutura
+do ``select()`` e sem os valores dos parâmetros. Comandos montados com valores
+literais, ou com ``lazy="raise"``/opções que mudam a cada chamada, não se
+repetem e aparecem aqui como ``misses``.
+"""
+
+import threading
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+
+from config.database import DB_QUERY_CACHE_SIZE, engine
+
+_contagem: Counter = Counter()
+_lock = threading.Lock()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _registrar(_conn, _cursor, _statement, _parameters, context, _executemany):
+    if context is None:
+        return
+    resultado = context.cache_hit
+    if resultado is CACHE_HIT:
+        chave = "hits"
+    elif resultado is CACHE_MISS:
+        chave = "misses"
+    else:  # DDL, SQL textual ou cache desligado
+        chave = "sem_cache"
+    with _lock:
+        _contagem[chave] += 1
+
+
+def estatisticas() -> dict[str, Any]:
+    with _lock:
+        hits, misses = _contagem["hits"], _contagem["misses"]
+        sem_cache = _contagem["sem_cache"]
+    # O LRU do engine não tem API pública de tamanho.
+    cache = getattr(engine, "_compiled_cache", None)
+    return {
+        "hits": hits,
+        "misses": misses,
+        "sem_cache": sem_cache,
+        "taxa_acerto": round(hits / (hits + misses), 4) if hits + misses else None,
+        "entradas": len(cache) if cache is not None else 0,
+        "capacidade": DB_QUERY_CACHE_SIZE,
+    }
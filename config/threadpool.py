@@ -0,0 +1,129 @@
+"""
+# -------------------------------
+# Thread pool para trabalho bloqueante
+# -------------------------------
+
+Handlers ``def`` e dependências síncronas (como ``get_db``) rodam no thread
+pool do anyio, que por padrão tem 40 vagas por worker. Mais threads que
+conexões no pool do banco só trocam a fila do anyio pela espera do
+``QueuePool``, que é mais cara e termina em ``TimeoutError``.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, ParamSpec, TypeVar
+
+import anyio.to_thread
+from starlette.concurrency import run_in_threadpool as _run_in_threadpool
+
+from config.database import POOL_CAPACIDADE, engine
+from config.logger_custom import logger as log
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Vagas do thread pool; por padrão, a capacidade do pool de conexões.
+THREADPOOL_TOKENS = int(os.getenv("THREADPOOL_TOKENS", "0")) or POOL_CAPACIDADE
+
+
+@dataclass
+class ThreadpoolStats:
+    chamadas: int = 0
+    saturadas: int = 0
+    espera_total: float = 0.0
+    espera_maxima: float = 0.0
+    execucao_total: float = 0.0
+
+    @property
+    def espera_media(self) -> float:
+        return self.espera_total / self.chamadas if self.chamadas else 0.0
+
+
+_stats = ThreadpoolStats()
+_stats_lock = threading.Lock()
+
+
+def configurar_threadpool(tokens: int = THREADPOOL_TOKENS) -> None:
+    """
+    Ajusta as vagas do thread pool do event loop corrente.
+
+    O limitador padrão do anyio pertence ao loop, então a chamada precisa
+    acontecer dentro dele (no ``lifespan`` da aplicação).
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = tokens
+    log.info("Thread pool: %d vagas (pool do banco: %d).", tokens, POOL_CAPACIDADE)
+
+
+def _registrar(espera: float, execucao: float, saturada: bool) -> None:
+    with _stats_lock:
+        _stats.chamadas += 1
+        _stats.saturadas += saturada
+        _stats.espera_total += espera
+        _stats.espera_maxima = max(_stats.espera_maxima, espera)
+        _stats.execucao_total += execucao
+
+
+async def run_in_threadpool(
+    func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """
+    Executa ``func`` no thread pool, registrando espera e saturação.
+
+    Usada pelos handlers ``async def`` para o trabalho com a ``Session``, que é
+    bloqueante e, no loop, travaria todas as outras requisições do worker.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    saturada = limiter.borrowed_tokens >= limiter.total_tokens
+    enviada = time.perf_counter()
+    inicio = enviada
+
+    def executar() -> T:
+        nonlocal inicio
+        inicio = time.perf_counter()
+        return func(*args, **kwargs)
+
+    try:
+        return await _run_in_threadpool(executar)
+    finally:
+        fim = time.perf_counter()
+        _registrar(inicio - enviada, fim - inicio, saturada)
+
+
+def _pool_banco() -> dict[str, Any]:
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"tipo": type(pool).__name__}
+    return {
+        "tipo": type(pool).__name__,
+        "tamanho": pool.size(),
+        "em_uso": pool.checkedout(),
+        "livres": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "capacidade": POOL_CAPACIDADE,
+    }
+
+
+def metricas() -> dict[str, Any]:
+    """Ocupação do thread pool e do pool de conexões deste worker."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    estatisticas = limiter.statistics()
+    with _stats_lock:
+        offload = {
+            "chamadas": _stats.chamadas,
+            "saturadas": _stats.saturadas,
+            "espera_media_ms": round(_stats.espera_media * 1000, 3),
+            "espera_maxima_ms": round(_stats.espera_maxima * 1000, 3),
+            "execucao_total_s": round(_stats.execucao_total, 6),
+        }
+    return {
+        "threadpool": {
+            "vagas": estatisticas.total_tokens,
+            "em_uso": estatisticas.borrowed_tokens,
+            "aguardando": estatisticas.tasks_waiting,
+        },
+        "offload": offload,
+        "banco": _pool_banco(),
+    }
@@ -0,0 +1,54 @@
+"""
+# -------------------------------
+# Tipos de coluna customizados
+# -------------------------------
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.types import TypeDecorator
+
+CENT = Decimal("0.01")
+
+# O SQLite guarda datas como texto e o CURRENT_TIMESTAMP (``server_default``)
+# grava "AAAA-MM-DD HH:MM:SS", sem fração. Os parâmetros usam o mesmo formato
+# para que igualdade e ordem entre texto gravado e parâmetro coincidam.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format=(
+            "%(year)04d-%(month)02d-%(day)02d " "%(hour)02d:%(minute)02d:%(second)02d"
+        )
+    ),
+    "sqlite",
+)
+
+
+def to_money(value: Decimal | float | int | str) -> Decimal:
+    """Converte um valor para ``Decimal`` com duas casas (arredondamento comercial)."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class Cents(TypeDecorator):
+    """
+    Valor monetário armazenado como inteiro em centavos.
+
+    Na aplicação o valor é sempre um ``Decimal`` com duas casas; no banco é um
+    ``INTEGER``, então ``SUM`` e comparações são exatos e baratos.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(to_money(value) * 100)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)).scaleb(-2)
@@ -0,0 +1,190 @@
+"""
+# -------------------------------
+# Versionamento de tabelas (ETag / Last-Modified)
+# -------------------------------
+
+A versão de cada tabela fica no banco (tabela ``versoes``), e não na memória
+do processo: todos os workers enxergam a mesma versão e uma escrita em um
+deles invalida o cache HTTP dos clientes servidos pelos outros.
+
+Cada worker guarda a última leitura da tabela por até
+``VERSAO_CHECK_SEGUNDOS`` (:class:`VersionCache`), então a maior parte das
+requisições condicionais responde ``304`` sem ir ao banco. Escritas feitas
+neste worker invalidam a cópia local no ``commit``.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from types import MappingProxyType
+
+from fastapi import Request, Response, status
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    event,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from config.config_model import Base
+
+# Intervalo máximo (em segundos) em que um worker pode responder com versões
+# anteriores a alterações feitas em outro worker.
+CHECK_INTERVAL = float(os.getenv("VERSAO_CHECK_SEGUNDOS", "1"))
+
+versoes_table = Table(
+    "versoes",
+    Base.metadata,
+    Column("tabela", String(50), primary_key=True),
+    Column("versao", Integer, nullable=False),
+    Column("alterado_em", DateTime(timezone=True), nullable=False),
+)
+
+# Data informada para tabelas ainda sem versão registrada.
+_ORIGEM = datetime(2000, 1, 1, tzinfo=UTC)
+
+Versoes = Mapping[str, tuple[int, datetime]]
+
+
+def _now() -> datetime:
+    return datetime.now(UTC).replace(microsecond=0)
+
+
+def _utc(momento: datetime) -> datetime:
+    # O SQLite devolve a data sem fuso; ela foi gravada em UTC.
+    return momento.replace(tzinfo=momento.tzinfo or UTC, microsecond=0)
+
+
+def ler_versoes(db: Session) -> Versoes:
+    """Lê a versão e a data da última alteração de todas as tabelas."""
+    linhas = db.execute(
+        select(
+            versoes_table.c.tabela, versoes_table.c.versao, versoes_table.c.alterado_em
+        )
+    )
+    return MappingProxyType(
+        {tabela: (versao, _utc(alterado_em)) for tabela, versao, alterado_em in linhas}
+    )
+
+
+class VersionCache:
+    """Guarda a última leitura de ``versoes`` do processo."""
+
+    def __init__(self, intervalo: float = CHECK_INTERVAL) -> None:
+        self.intervalo = intervalo
+        self._versoes: Versoes = MappingProxyType({})
+        self._verificado_em: float | None = None
+        # Invalidações acontecidas durante uma leitura a anulam.
+        self._geracao = 0
+        self._lock = threading.Lock()
+
+    def invalidar(self) -> None:
+        """Força a próxima consulta a ler as versões do banco."""
+        with self._lock:
+            self._geracao += 1
+            self._verificado_em = None
+
+    def obter(self, db: Session) -> Versoes:
+        agora = time.monotonic()
+        verificado_em = self._verificado_em
+        if verificado_em is not None and agora - verificado_em < self.intervalo:
+            return self._versoes
+
+        geracao = self._geracao
+        versoes = ler_versoes(db)
+        with self._lock:
+            if geracao == self._geracao:
+                self._versoes = versoes
+                self._verificado_em = agora
+        return versoes
+
+
+version_cache = VersionCache()
+
+
+def get_version(db: Session, table: str) -> tuple[int, datetime]:
+    """Retorna a versão atual e a data da última alteração de uma tabela."""
+    return version_cache.obter(db).get(table, (0, _ORIGEM))
+
+
+def bump_version(db: Session, *tables: str) -> None:
+    """
+    Incrementa a versão das tabelas informadas na transação corrente.
+
+    Deve ser chamada pelos routers antes do ``commit`` de cada
+    create/update/delete, para que a versão mude junto com os dados. Após o
+    commit a cópia deste worker é invalidada; os demais percebem a nova versão
+    em até ``VERSAO_CHECK_SEGUNDOS``.
+    """
+    agora = _now()
+    for table in tables:
+        atualizado = db.execute(
+            update(versoes_table)
+            .where(versoes_table.c.tabela == table)
+            .values(versao=versoes_table.c.versao + 1, alterado_em=agora)
+        ).rowcount
+        if not atualizado:
+            db.execute(
+                insert(versoes_table).values(tabela=table, versao=1, alterado_em=agora)
+            )
+    event.listen(db, "after_commit", lambda _s: version_cache.invalidar(), once=True)
+
+
+def make_etag(tables: tuple[str, ...], versoes: Versoes) -> str:
+    partes = ".".join(f"{t}-{versoes.get(t, (0, _ORIGEM))[0]}" for t in tables)
+    return f'W/"{partes}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # Comparação fraca: ignora o prefixo W/ dos dois lados.
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def not_modified(
+    request: Request, response: Response, db: Session, *tables: str
+) -> Response | None:
+    """
+    Valida uma requisição condicional contra a versão das tabelas.
+
+    Define ``ETag`` e ``Last-Modified`` na resposta. Quando o cliente já possui a
+    versão atual retorna um ``304 Not Modified``; caso contrário retorna
+    ``None`` e o handler segue normalmente. Deve ser chamada antes de qualquer
+    consulta da resposta: as versões vêm de :data:`version_cache`.
+    """
+    versoes = version_cache.obter(db)
+    last_modified = max(versoes.get(t, (0, _ORIGEM))[1] for t in tables)
+    headers = {
+        "ETag": make_etag(tables, versoes),
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+    }
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return None
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        if last_modified <= since:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
@@ -0,0 +1,50 @@
+"""
+# -------------------------------
+# Configuração do Gunicorn
+# -------------------------------
+
+Uso: ``gunicorn src.main:app -c gunicorn.conf.py``
+
+Restart sem derrubar conexões: ``kill -HUP <master>`` sobe workers novos e
+encerra os antigos após terminarem as requisições em andamento. Como a app é
+pré-carregada no master, código novo exige ``kill -USR2 <master>`` (novo
+master) seguido de ``kill -TERM`` no master antigo.
+"""
+
+import os
+
+from config.processos import cpus_disponiveis, workers_configurados
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = workers_configurados()
+
+# Importa a aplicação uma vez no master; os workers herdam a memória por fork.
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+reload = os.getenv("GUNICORN_RELOAD", "0") == "1"
+
+# Reciclar workers periodicamente contém vazamentos de memória; o jitter evita
+# que todos reiniciem ao mesmo tempo.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    server.log.info("%d workers para %d CPUs.", workers, cpus_disponiveis())
+
+
+def post_fork(server, worker):
+    # Conexões abertas pelo master no preload (create_all, etc.) não podem ser
+    # compartilhadas entre processos. close=False descarta o pool herdado sem
+    # fechar os sockets, que ainda pertencem ao master.
+    from config.database import engine
+
+    engine.dispose(close=False)
+    server.log.info("Worker %s: pool de conexões reiniciado.", worker.pid)
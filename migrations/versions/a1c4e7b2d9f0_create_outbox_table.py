@@ -0,0 +1,47 @@
+"""create outbox table
+
+Revision ID: a1c4e7b2d9f0
+Revises: 3735e72715d2
+Create Date: 2026-10-18 10:12:41.208113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c4e7b2d9f0"
+down_revision: Union[str, Sequence[str], None] = "3735e72715d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entidade", sa.String(length=50), nullable=False),
+        sa.Column("entidade_id", sa.Integer(), nullable=False),
+        sa.Column("operacao", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column(
+            "criado_em",
+            sa.DateTime(),
+            server_default=sa.text("(CURRENT_TIMESTAMP)"),
+            nullable=False,
+        ),
+        sa.Column("despachado_em", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_outbox_despachado_em"), "outbox", ["despachado_em"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_outbox_despachado_em"), table_name="outbox")
+    op.drop_table("outbox")
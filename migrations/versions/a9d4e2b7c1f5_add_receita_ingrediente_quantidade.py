@@ -0,0 +1,62 @@
+"""add receita_ingrediente quantidade/posicao and ingredientes nome unique index
+
+Revision ID: a9d4e2b7c1f5
+Revises: f8a2c6e4b1d3
+Create Date: 2026-10-18 23:45:10.218734
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# Menor id de cada nome: o ingrediente que sobra quando há repetidos.
+_CANONICO = "SELECT MIN(id) FROM ingredientes GROUP BY nome"
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d4e2b7c1f5"
+down_revision: Union[str, Sequence[str], None] = "f8a2c6e4b1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("receita_ingrediente") as batch_op:
+        batch_op.add_column(sa.Column("quantidade", sa.Float(), nullable=True))
+        batch_op.add_column(sa.Column("posicao", sa.Integer(), nullable=True))
+    # Junta os ingredientes de mesmo nome antes de criar o índice único.
+    op.execute(
+        f"""
+        UPDATE receita_ingrediente SET ingrediente_id = (
+            SELECT MIN(i2.id) FROM ingredientes i1
+            JOIN ingredientes i2 ON i2.nome = i1.nome
+            WHERE i1.id = receita_ingrediente.ingrediente_id
+        )
+        WHERE ingrediente_id NOT IN ({_CANONICO})
+        AND NOT EXISTS (
+            SELECT 1 FROM receita_ingrediente r2
+            JOIN ingredientes i1 ON i1.id = receita_ingrediente.ingrediente_id
+            JOIN ingredientes i2 ON i2.nome = i1.nome
+            WHERE r2.receita_id = receita_ingrediente.receita_id
+            AND r2.ingrediente_id = i2.id
+            AND i2.id IN ({_CANONICO})
+        )
+        """
+    )
+    op.execute(
+        f"DELETE FROM receita_ingrediente WHERE ingrediente_id NOT IN ({_CANONICO})"
+    )
+    op.execute(f"DELETE FROM ingredientes WHERE id NOT IN ({_CANONICO})")
+    op.create_index(
+        op.f("ix_ingredientes_nome"), "ingredientes", ["nome"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_ingredientes_nome"), table_name="ingredientes")
+    with op.batch_alter_table("receita_ingrediente") as batch_op:
+        batch_op.drop_column("posicao")
+        batch_op.drop_column("quantidade")
@@ -0,0 +1,34 @@
+"""add versoes table
+
+Revision ID: b3e8f1c6d2a4
+Revises: a9d4e2b7c1f5
+Create Date: 2026-10-19 00:12:31.584219
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f1c6d2a4"
+down_revision: Union[str, Sequence[str], None] = "a9d4e2b7c1f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "versoes",
+        sa.Column("tabela", sa.String(length=50), nullable=False),
+        sa.Column("versao", sa.Integer(), nullable=False),
+        sa.Column("alterado_em", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("tabela"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("versoes")
@@ -0,0 +1,109 @@
+"""add ON DELETE rules and soft delete columns
+
+Revision ID: b9d4f7a2e6c1
+Revises: f2b6d8a4c9e1
+Create Date: 2026-10-18 14:02:11.540219
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9d4f7a2e6c1"
+down_revision: Union[str, Sequence[str], None] = "f2b6d8a4c9e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# As FKs foram criadas sem nome; no SQLite o modo batch as reflete com este nome.
+NAMING_CONVENTION = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+# tabela -> [(coluna, tabela referenciada, ON DELETE)]
+FOREIGN_KEYS = {
+    "produtos": [("categoria_id", "categorias", "CASCADE")],
+    "itens_pedido": [
+        ("produto_id", "produtos", "RESTRICT"),
+        ("pedido_id", "pedidos", "CASCADE"),
+    ],
+    "pedidos": [("cliente_id", "clientes", "RESTRICT")],
+    "vendas": [("pedido_id", "pedidos", "CASCADE")],
+    "receita_ingrediente": [
+        ("receita_id", "receitas", "CASCADE"),
+        ("ingrediente_id", "ingredientes", "CASCADE"),
+    ],
+}
+
+SOFT_DELETE_TABLES = ("pedidos", "vendas")
+
+
+def _fk_name(table: str, column: str, referred: str) -> str:
+    return NAMING_CONVENTION["fk"] % {
+        "table_name": table,
+        "column_0_name": column,
+        "referred_table_name": referred,
+    }
+
+
+def _replace_foreign_keys(with_rules: bool) -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        existing = {
+            fk["constrained_columns"][0]: fk["name"]
+            for fk in inspector.get_foreign_keys(table)
+        }
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            for column, referred, ondelete in foreign_keys:
+                name = _fk_name(table, column, referred)
+                if column in existing:
+                    batch_op.drop_constraint(
+                        existing[column] or name, type_="foreignkey"
+                    )
+                batch_op.create_foreign_key(
+                    name,
+                    referred,
+                    [column],
+                    ["id"],
+                    ondelete=ondelete if with_rules else None,
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in SOFT_DELETE_TABLES:
+        op.add_column(
+            table,
+            sa.Column("excluido_em", sa.DateTime(timezone=True), nullable=True),
+        )
+
+    _replace_foreign_keys(with_rules=True)
+
+    op.drop_index("ix_pedidos_cliente_historico", table_name="pedidos")
+    op.create_index(
+        "ix_pedidos_cliente_historico",
+        "pedidos",
+        ["cliente_id", "id", "preco_total", "excluido_em"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_pedidos_cliente_historico", table_name="pedidos")
+    op.create_index(
+        "ix_pedidos_cliente_historico",
+        "pedidos",
+        ["cliente_id", "id", "preco_total"],
+        unique=False,
+    )
+
+    _replace_foreign_keys(with_rules=False)
+
+    for table in SOFT_DELETE_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column("excluido_em")
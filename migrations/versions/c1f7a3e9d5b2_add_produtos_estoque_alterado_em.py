@@ -0,0 +1,32 @@
+"""add produtos estoque_alterado_em
+
+Revision ID: c1f7a3e9d5b2
+Revises: b3e8f1c6d2a4
+Create Date: 2026-10-19 01:04:17.293518
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1f7a3e9d5b2"
+down_revision: Union[str, Sequence[str], None] = "b3e8f1c6d2a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.add_column(
+            sa.Column("estoque_alterado_em", sa.DateTime(timezone=True), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.drop_column("estoque_alterado_em")
@@ -0,0 +1,110 @@
+"""create order archive tables
+
+Revision ID: c4e8a2f6b1d9
+Revises: b9d4f7a2e6c1
+Create Date: 2026-10-18 14:47:35.206118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e8a2f6b1d9"
+down_revision: Union[str, Sequence[str], None] = "b9d4f7a2e6c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Pedidos existentes não têm data; contam a partir desta migração.
+    op.add_column("pedidos", sa.Column("criado_em", sa.DateTime(), nullable=True))
+    op.execute("UPDATE pedidos SET criado_em = CURRENT_TIMESTAMP")
+    with op.batch_alter_table("pedidos") as batch_op:
+        batch_op.alter_column(
+            "criado_em",
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        )
+    op.create_index(
+        op.f("ix_pedidos_criado_em"), "pedidos", ["criado_em"], unique=False
+    )
+
+    op.create_table(
+        "pedidos_arquivo",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("quantidade", sa.Integer(), nullable=False),
+        sa.Column("preco_total", sa.Integer(), nullable=False),
+        sa.Column("cliente_id", sa.Integer(), nullable=False),
+        sa.Column("criado_em", sa.DateTime(), nullable=False),
+        sa.Column(
+            "arquivado_em",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_pedidos_arquivo_cliente_id"),
+        "pedidos_arquivo",
+        ["cliente_id"],
+        unique=False,
+    )
+    op.create_table(
+        "itens_pedido_arquivo",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("produto_id", sa.Integer(), nullable=False),
+        sa.Column("pedido_id", sa.Integer(), nullable=False),
+        sa.Column("quantidade", sa.Float(), nullable=False),
+        sa.Column("preco_unitario", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["pedido_id"], ["pedidos_arquivo.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_itens_pedido_arquivo_pedido_id"),
+        "itens_pedido_arquivo",
+        ["pedido_id"],
+        unique=False,
+    )
+    op.create_table(
+        "vendas_arquivo",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("pedido_id", sa.Integer(), nullable=False),
+        sa.Column("forma_pagamento", sa.String(length=50), nullable=False),
+        sa.Column("status_venda", sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["pedido_id"], ["pedidos_arquivo.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("pedido_id"),
+    )
+    op.create_table(
+        "resumo_arquivo_cliente",
+        sa.Column("cliente_id", sa.Integer(), nullable=False),
+        sa.Column("quantidade_pedidos", sa.Integer(), nullable=False),
+        sa.Column("total_gasto", sa.Integer(), nullable=False),
+        sa.Column("ultimo_pedido_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("cliente_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("resumo_arquivo_cliente")
+    op.drop_table("vendas_arquivo")
+    op.drop_index(
+        op.f("ix_itens_pedido_arquivo_pedido_id"), table_name="itens_pedido_arquivo"
+    )
+    op.drop_table("itens_pedido_arquivo")
+    op.drop_index(op.f("ix_pedidos_arquivo_cliente_id"), table_name="pedidos_arquivo")
+    op.drop_table("pedidos_arquivo")
+    op.drop_index(op.f("ix_pedidos_criado_em"), table_name="pedidos")
+    with op.batch_alter_table("pedidos") as batch_op:
+        batch_op.drop_column("criado_em")
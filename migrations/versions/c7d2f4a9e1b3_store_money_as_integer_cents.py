@@ -0,0 +1,78 @@
+"""store money columns as integer cents
+
+Revision ID: c7d2f4a9e1b3
+Revises: a1c4e7b2d9f0
+Create Date: 2026-10-18 11:03:17.552904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d2f4a9e1b3"
+down_revision: Union[str, Sequence[str], None] = "a1c4e7b2d9f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+MONEY_COLUMNS = {
+    "produtos": ["preco_unidade"],
+    "itens_pedido": ["preco_unitario"],
+    "pedidos": ["preco_total"],
+    "receitas": [
+        "preco_sugerido",
+        "preco_venda",
+        "custo_porcao",
+        "custo_total",
+        "lucro_sugerido",
+    ],
+}
+
+
+def _copy_in_batches(table: str, assignments: str) -> None:
+    """Executa o UPDATE em faixas de id para não travar a tabela inteira."""
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text(f"SELECT MAX(id) FROM {table}")).scalar() or 0
+    for start in range(0, max_id + 1, BATCH_SIZE):
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {assignments} WHERE id >= :lo AND id < :hi"),
+            {"lo": start, "hi": start + BATCH_SIZE},
+        )
+
+
+def _convert(to_cents: bool) -> None:
+    new_type = sa.Integer() if to_cents else sa.Float()
+    expression = "CAST(ROUND({col} * 100) AS INTEGER)" if to_cents else "{col} / 100.0"
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for col in columns:
+                batch_op.add_column(sa.Column(f"{col}_tmp", new_type, nullable=True))
+
+        _copy_in_batches(
+            table,
+            ", ".join(f"{col}_tmp = {expression.format(col=col)}" for col in columns),
+        )
+
+        with op.batch_alter_table(table) as batch_op:
+            for col in columns:
+                batch_op.drop_column(col)
+                batch_op.alter_column(
+                    f"{col}_tmp",
+                    new_column_name=col,
+                    existing_type=new_type,
+                    nullable=False,
+                )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert(to_cents=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _convert(to_cents=False)
@@ -0,0 +1,44 @@
+"""create idempotency_keys table
+
+Revision ID: d3e8b1f5c2a7
+Revises: c7d2f4a9e1b3
+Create Date: 2026-10-18 11:48:05.734190
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e8b1f5c2a7"
+down_revision: Union[str, Sequence[str], None] = "c7d2f4a9e1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("chave", sa.String(length=255), nullable=False),
+        sa.Column("rota", sa.String(length=100), nullable=False),
+        sa.Column("request_hash", sa.String(length=64), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=False),
+        sa.Column("resposta", sa.Text(), nullable=False),
+        sa.Column("criado_em", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("chave", "rota"),
+    )
+    op.create_index(
+        op.f("ix_idempotency_keys_criado_em"),
+        "idempotency_keys",
+        ["criado_em"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_idempotency_keys_criado_em"), table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
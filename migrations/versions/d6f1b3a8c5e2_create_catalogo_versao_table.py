@@ -0,0 +1,34 @@
+"""create catalogo_versao table
+
+Revision ID: d6f1b3a8c5e2
+Revises: c4e8a2f6b1d9
+Create Date: 2026-10-18 15:21:04.671932
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f1b3a8c5e2"
+down_revision: Union[str, Sequence[str], None] = "c4e8a2f6b1d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tabela = op.create_table(
+        "catalogo_versao",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("versao", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(tabela, [{"id": 1, "versao": 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("catalogo_versao")
@@ -0,0 +1,41 @@
+"""drop catalogo_versao table and produtos estoque_alterado_em
+
+Revision ID: e2a7c5d9b4f1
+Revises: c1f7a3e9d5b2
+Create Date: 2026-10-19 00:41:52.604183
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a7c5d9b4f1"
+down_revision: Union[str, Sequence[str], None] = "c1f7a3e9d5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A versão do catálogo e a do estoque passam a viver na tabela versoes.
+    op.drop_table("catalogo_versao")
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.drop_column("estoque_alterado_em")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.add_column(
+            sa.Column("estoque_alterado_em", sa.DateTime(timezone=True), nullable=True)
+        )
+    tabela = op.create_table(
+        "catalogo_versao",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("versao", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(tabela, [{"id": 1, "versao": 0}])
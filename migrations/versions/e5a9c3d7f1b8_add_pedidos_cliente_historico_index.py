@@ -0,0 +1,33 @@
+"""add covering index for client order history
+
+Revision ID: e5a9c3d7f1b8
+Revises: d3e8b1f5c2a7
+Create Date: 2026-10-18 12:30:52.118406
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c3d7f1b8"
+down_revision: Union[str, Sequence[str], None] = "d3e8b1f5c2a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_pedidos_cliente_historico",
+        "pedidos",
+        ["cliente_id", "id", "preco_total"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_pedidos_cliente_historico", table_name="pedidos")
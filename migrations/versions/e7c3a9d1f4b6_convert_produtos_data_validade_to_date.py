@@ -0,0 +1,149 @@
+"""convert produtos.data_validade to date
+
+Revision ID: e7c3a9d1f4b6
+Revises: d6f1b3a8c5e2
+Create Date: 2026-10-18 16:02:41.318204
+
+"""
+
+import calendar
+import logging
+from datetime import date, datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c3a9d1f4b6"
+down_revision: Union[str, Sequence[str], None] = "d6f1b3a8c5e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+log = logging.getLogger("alembic.runtime.migration")
+
+BATCH_SIZE = 5000
+
+FORMATOS_DIA = (
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+    "%Y/%m/%d",
+    "%d/%m/%y",
+    "%Y%m%d",
+)
+# Validades só com mês e ano ("03/2026") vencem no último dia do mês.
+FORMATOS_MES = ("%m/%Y", "%m-%Y", "%Y-%m", "%m/%y")
+
+produtos = sa.table(
+    "produtos",
+    sa.column("id", sa.Integer),
+    sa.column("data_validade", sa.String),
+    sa.column("data_validade_tmp", sa.Date),
+)
+
+
+def _parse(valor: str | None) -> date | None:
+    texto = (valor or "").strip()
+    if not texto:
+        return None
+    # Datas com horário ("2026-03-01 00:00:00" / "2026-03-01T00:00").
+    texto = texto.split(" ")[0].split("T")[0]
+    for formato in FORMATOS_DIA:
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+    for formato in FORMATOS_MES:
+        try:
+            mes = datetime.strptime(texto, formato).date()
+        except ValueError:
+            continue
+        ultimo_dia = calendar.monthrange(mes.year, mes.month)[1]
+        return mes.replace(day=ultimo_dia)
+    return None
+
+
+def _converter_em_lotes() -> None:
+    """Lê e grava por faixas de id; valores ilegíveis ficam nulos e são logados."""
+    bind = op.get_bind()
+    ultimo_id = 0
+    ilegiveis = []
+    while True:
+        linhas = bind.execute(
+            sa.select(produtos.c.id, produtos.c.data_validade)
+            .where(produtos.c.id > ultimo_id)
+            .order_by(produtos.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not linhas:
+            break
+        valores = []
+        for id_, texto in linhas:
+            convertida = _parse(texto)
+            if convertida is None:
+                ilegiveis.append((id_, texto))
+                continue
+            valores.append({"b_id": id_, "validade": convertida})
+        if valores:
+            bind.execute(
+                produtos.update()
+                .where(produtos.c.id == sa.bindparam("b_id"))
+                .values(data_validade_tmp=sa.bindparam("validade")),
+                valores,
+            )
+        ultimo_id = linhas[-1][0]
+    if ilegiveis:
+        log.warning(
+            "data_validade ilegível em %d produtos (ficou nula): %s",
+            len(ilegiveis),
+            ilegiveis[:50],
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.add_column(sa.Column("data_validade_tmp", sa.Date(), nullable=True))
+
+    _converter_em_lotes()
+
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.drop_column("data_validade")
+        batch_op.alter_column(
+            "data_validade_tmp",
+            new_column_name="data_validade",
+            existing_type=sa.Date(),
+            nullable=True,
+        )
+    op.create_index(
+        "ix_produtos_validade_quantidade",
+        "produtos",
+        ["data_validade", "quantidade"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_produtos_validade_quantidade", table_name="produtos")
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.add_column(
+            sa.Column("data_validade_tmp", sa.String(length=20), nullable=True)
+        )
+
+    # Datas são gravadas em ISO (YYYY-MM-DD) e as nulas voltam como vazias.
+    op.execute(
+        "UPDATE produtos SET data_validade_tmp = "
+        "COALESCE(CAST(data_validade AS VARCHAR(20)), '')"
+    )
+
+    with op.batch_alter_table("produtos") as batch_op:
+        batch_op.drop_column("data_validade")
+        batch_op.alter_column(
+            "data_validade_tmp",
+            new_column_name="data_validade",
+            existing_type=sa.String(length=20),
+            nullable=False,
+        )
@@ -0,0 +1,84 @@
+"""add normalized search columns to clientes
+
+Revision ID: f2b6d8a4c9e1
+Revises: e5a9c3d7f1b8
+Create Date: 2026-10-18 13:14:27.903561
+
+"""
+
+import re
+import unicodedata
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b6d8a4c9e1"
+down_revision: Union[str, Sequence[str], None] = "e5a9c3d7f1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _normalizar_nome(nome: str) -> str:
+    sem_acentos = unicodedata.normalize("NFKD", nome).encode("ascii", "ignore")
+    return " ".join(sem_acentos.decode().lower().split())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "clientes", sa.Column("telefone_digitos", sa.String(length=15), nullable=True)
+    )
+    op.add_column(
+        "clientes", sa.Column("nome_busca", sa.String(length=100), nullable=True)
+    )
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, nome, telefone FROM clientes WHERE id > :last "
+                "ORDER BY id LIMIT :size"
+            ),
+            {"last": last_id, "size": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(
+                "UPDATE clientes SET telefone_digitos = :tel, nome_busca = :nome "
+                "WHERE id = :id"
+            ),
+            [
+                {
+                    "id": row.id,
+                    "tel": re.sub(r"\D", "", row.telefone or ""),
+                    "nome": _normalizar_nome(row.nome or ""),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    op.create_index(
+        op.f("ix_clientes_telefone_digitos"),
+        "clientes",
+        ["telefone_digitos"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_clientes_nome_busca"), "clientes", ["nome_busca"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_clientes_nome_busca"), table_name="clientes")
+    op.drop_index(op.f("ix_clientes_telefone_digitos"), table_name="clientes")
+    with op.batch_alter_table("clientes") as batch_op:
+        batch_op.drop_column("nome_busca")
+        batch_op.drop_column("telefone_digitos")
@@ -0,0 +1,38 @@
+"""add list filter indexes
+
+Revision ID: f8a2c6e4b1d3
+Revises: e7c3a9d1f4b6
+Create Date: 2026-10-18 17:12:53.904117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8a2c6e4b1d3"
+down_revision: Union[str, Sequence[str], None] = "e7c3a9d1f4b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDICES = {
+    "produtos": ["categoria_id", "marca", "preco_unidade"],
+    "vendas": ["forma_pagamento", "status_venda"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for tabela, colunas in INDICES.items():
+        for coluna in colunas:
+            op.create_index(
+                op.f(f"ix_{tabela}_{coluna}"), tabela, [coluna], unique=False
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for tabela, colunas in INDICES.items():
+        for coluna in colunas:
+            op.drop_index(op.f(f"ix_{tabela}_{coluna}"), table_name=tabela)
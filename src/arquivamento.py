@@ -0,0 +1,167 @@
+"""
+# -------------------------------
+# Arquivamento de pedidos antigos
+# -------------------------------
+
+Uso: ``python -m src.arquivamento [--dias 365] [--lote 500]``
+"""
+
+import argparse
+import os
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, insert, select
+from sqlalchemy.orm import Session
+
+from config.database import SessionLocal
+from config.logger_custom import logger as log
+from config.queries import delete_ids
+from src.jobs.worker import task
+from src.models.arquivo_model import (
+    ItemArquivoModel,
+    PedidoArquivoModel,
+    ResumoArquivoClienteModel,
+    VendaArquivoModel,
+)
+from src.models.item_model import ItemModel
+from src.models.pedido_model import PedidoModel
+from src.models.venda_model import VendaModel
+
+ARQUIVO_HORIZONTE_DIAS = int(os.getenv("ARQUIVO_HORIZONTE_DIAS", "365"))
+ARQUIVO_LOTE = int(os.getenv("ARQUIVO_LOTE", "500"))
+ARQUIVO_JOB = "arquivar_pedidos"
+# Status de venda que encerram o pedido; os demais ainda podem mudar.
+ARQUIVO_STATUS_CONCLUIDOS = tuple(
+    status.strip()
+    for status in os.getenv("ARQUIVO_STATUS_CONCLUIDOS", "pago").split(",")
+    if status.strip()
+)
+
+
+def _copiar(
+    db: Session, destino: type, origem: type, colunas: list[str], filtro: ColumnElement
+) -> None:
+    """``INSERT INTO destino (colunas) SELECT colunas FROM origem WHERE filtro``."""
+    origem_cols = [getattr(origem, nome) for nome in colunas]
+    db.execute(insert(destino).from_select(colunas, select(*origem_cols).where(filtro)))
+
+
+def _acumular_resumo(db: Session, ids: list[int]) -> None:
+    totais = db.execute(
+        select(
+            PedidoModel.cliente_id,
+            func.count(PedidoModel.id),
+            func.sum(PedidoModel.preco_total),
+            func.max(PedidoModel.id),
+        )
+        .where(PedidoModel.id.in_(ids))
+        .group_by(PedidoModel.cliente_id)
+    ).all()
+    for cliente_id, quantidade, total, ultimo in totais:
+        resumo = db.get(ResumoArquivoClienteModel, cliente_id)
+        if resumo is None:
+            db.add(
+                ResumoArquivoClienteModel(
+                    cliente_id=cliente_id,
+                    quantidade_pedidos=quantidade,
+                    total_gasto=total,
+                    ultimo_pedido_id=ultimo,
+                )
+            )
+            continue
+        resumo.quantidade_pedidos += quantidade
+        resumo.total_gasto += total
+        resumo.ultimo_pedido_id = max(resumo.ultimo_pedido_id, ultimo)
+
+
+def arquivar_lote(db: Session, ids: list[int]) -> None:
+    """
+    Move os pedidos ``ids`` (com itens e venda) para as tabelas de arquivo.
+
+    Tudo é feito com comandos ``INSERT ... SELECT`` e um único ``DELETE``; os
+    itens e a venda saem das tabelas quentes pelo ``ON DELETE CASCADE``.
+    """
+    _copiar(
+        db,
+        PedidoArquivoModel,
+        PedidoModel,
+        ["id", "quantidade", "preco_total", "cliente_id", "criado_em"],
+        PedidoModel.id.in_(ids),
+    )
+    _copiar(
+        db,
+        ItemArquivoModel,
+        ItemModel,
+        ["id", "produto_id", "pedido_id", "quantidade", "preco_unitario"],
+        ItemModel.pedido_id.in_(ids),
+    )
+    _copiar(
+        db,
+        VendaArquivoModel,
+        VendaModel,
+        ["id", "pedido_id", "forma_pagamento", "status_venda"],
+        VendaModel.pedido_id.in_(ids),
+    )
+    _acumular_resumo(db, ids)
+    delete_ids(db, PedidoModel, ids)
+
+
+def arquivar_pedidos(
+    db: Session,
+    dias: int = ARQUIVO_HORIZONTE_DIAS,
+    lote: int = ARQUIVO_LOTE,
+) -> int:
+    """
+    Arquiva os pedidos concluídos criados há mais de ``dias`` dias.
+
+    Concluído é o pedido cuja venda está em ``ARQUIVO_STATUS_CONCLUIDOS``.
+
+    Cada lote é uma transação, então o job pode ser interrompido e retomado sem
+    deixar pedidos pela metade. Pedidos com exclusão lógica ficam de fora.
+    Retorna quantos pedidos foram arquivados.
+    """
+    limite = datetime.now(UTC).replace(tzinfo=None) - timedelta(days=dias)
+    total = 0
+    while True:
+        ids = db.scalars(
+            select(PedidoModel.id)
+            .join(VendaModel, VendaModel.pedido_id == PedidoModel.id)
+            .where(
+                PedidoModel.criado_em < limite,
+                VendaModel.status_venda.in_(ARQUIVO_STATUS_CONCLUIDOS),
+            )
+            .order_by(PedidoModel.id)
+            .limit(lote)
+        ).all()
+        if not ids:
+            break
+        arquivar_lote(db, list(ids))
+        db.commit()
+        total += len(ids)
+        log.info("Arquivamento: %d pedidos movidos (total %d).", len(ids), total)
+    return total
+
+
+@task(ARQUIVO_JOB)
+def arquivar_job(payload: dict[str, Any]) -> None:
+    with SessionLocal() as db:
+        arquivar_pedidos(
+            db,
+            dias=payload.get("dias", ARQUIVO_HORIZONTE_DIAS),
+            lote=payload.get("lote", ARQUIVO_LOTE),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Arquiva pedidos concluídos antigos.")
+    parser.add_argument("--dias", type=int, default=ARQUIVO_HORIZONTE_DIAS)
+    parser.add_argument("--lote", type=int, default=ARQUIVO_LOTE)
+    args = parser.parse_args()
+    with SessionLocal() as db:
+        total = arquivar_pedidos(db, dias=args.dias, lote=args.lote)
+    print(f"{total} pedidos arquivados.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+# -------------------------------
+# Snapshot do catálogo em memória
+# -------------------------------
+
+Categorias e produtos mudam poucas vezes ao dia, mas são lidos em quase toda
+interação do caixa. Cada worker mantém uma cópia imutável do catálogo e só a
+recarrega quando a versão de ``categorias`` ou ``produtos`` na tabela
+``versoes`` muda (ver :mod:`config.versioning`).
+
+O estoque fica fora do snapshot: muda a cada venda, tem a sua própria versão
+(``estoque``) e é lido do banco, por chave primária, apenas para os produtos
+da resposta (:func:`com_estoque`).
+"""
+
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields
+from datetime import date
+from decimal import Decimal
+from types import MappingProxyType
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.logger_custom import logger as log
+from config.queries import chunked
+from config.versioning import VersionCache, version_cache
+from src.models.categoria_model import CategoriaModel
+from src.models.produto_model import ProdutoModel
+
+# Tabelas cujas versões compõem a versão do snapshot.
+TABELAS = ("categorias", "produtos")
+
+
+@dataclass(frozen=True, slots=True)
+class CategoriaRecord:
+    id: int
+    categoria: str
+
+
+@dataclass(frozen=True, slots=True)
+class ProdutoRecord:
+    id: int
+    nome_produto: str
+    data_validade: date | None
+    marca: str
+    codigo_barras: str
+    preco_unidade: Decimal
+    unidade: str
+    categoria_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class ProdutoEstoqueRecord(ProdutoRecord):
+    """Produto do snapshot com a quantidade atual lida do banco."""
+
+    quantidade: float
+
+
+@dataclass(frozen=True, slots=True)
+class Catalogo:
+    versao: int
+    categorias: tuple[CategoriaRecord, ...]
+    produtos: tuple[ProdutoRecord, ...]
+    categoria_por_id: Mapping[int, CategoriaRecord]
+    produto_por_id: Mapping[int, ProdutoRecord]
+    produto_por_codigo: Mapping[str, ProdutoRecord]
+
+
+def _select_record(model: type, record: type) -> list:
+    return [getattr(model, f.name) for f in fields(record)]
+
+
+def _produto(row: tuple) -> ProdutoRecord:
+    id_, nome, validade, marca, codigo, preco, unidade, categoria = row
+    # Marca e unidade se repetem entre produtos: uma cópia de cada.
+    intern = sys.intern
+    return ProdutoRecord(
+        id_,
+        nome,
+        validade,
+        intern(marca),
+        codigo,
+        preco,
+        intern(unidade),
+        categoria,
+    )
+
+
+def carregar(db: Session, versao: int) -> Catalogo:
+    """Lê categorias e produtos com um SELECT de colunas por tabela."""
+    categorias = tuple(
+        CategoriaRecord(*row)
+        for row in db.execute(
+            select(*_select_record(CategoriaModel, CategoriaRecord)).order_by(
+                CategoriaModel.id
+            )
+        )
+    )
+    produtos = tuple(
+        _produto(row)
+        for row in db.execute(
+            select(*_select_record(ProdutoModel, ProdutoRecord)).order_by(
+                ProdutoModel.id
+            )
+        )
+    )
+    return Catalogo(
+        versao=versao,
+        categorias=categorias,
+        produtos=produtos,
+        categoria_por_id=MappingProxyType({c.id: c for c in categorias}),
+        produto_por_id=MappingProxyType({p.id: p for p in produtos}),
+        produto_por_codigo=MappingProxyType({p.codigo_barras: p for p in produtos}),
+    )
+
+
+def com_estoque(
+    db: Session, produtos: Sequence[ProdutoRecord]
+) -> list[ProdutoEstoqueRecord]:
+    """Junta aos produtos do snapshot a quantidade atual, com um SELECT por lote."""
+    estoque = {}
+    for lote in chunked([p.id for p in produtos]):
+        linhas = db.execute(
+            select(ProdutoModel.id, ProdutoModel.quantidade).where(
+                ProdutoModel.id.in_(lote)
+            )
+        )
+        estoque.update(linhas.tuples().all())
+    # Produtos removidos desde a carga do snapshot ficam de fora.
+    return [
+        ProdutoEstoqueRecord(
+            *(getattr(p, f.name) for f in fields(ProdutoRecord)), estoque[p.id]
+        )
+        for p in produtos
+        if p.id in estoque
+    ]
+
+
+class CatalogoCache:
+    """Guarda o snapshot do processo e decide quando recarregá-lo."""
+
+    def __init__(self, versoes: VersionCache = version_cache) -> None:
+        self._versoes = versoes
+        self._snapshot: Catalogo | None = None
+        self._lock = threading.Lock()
+        self.recargas = 0
+
+    def versao(self, db: Session) -> int:
+        """Soma das versões de ``TABELAS``: muda sempre que uma delas muda."""
+        versoes = self._versoes.obter(db)
+        return sum(versoes.get(tabela, (0,))[0] for tabela in TABELAS)
+
+    def obter(self, db: Session) -> Catalogo:
+        versao = self.versao(db)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.versao == versao:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.versao != versao:
+                self._snapshot = carregar(db, versao)
+                self.recargas += 1
+                log.info(
+                    "Catálogo v%d carregado: %d produtos.",
+                    versao,
+                    len(self._snapshot.produtos),
+                )
+            return self._snapshot
+
+
+catalogo_cache = CatalogoCache()
@@ -0,0 +1,15 @@
+from src.events.outbox import (
+    dispatch_pending,
+    fetch_changes,
+    model_payload,
+    record_change,
+    subscribe,
+)
+
+__all__ = [
+    "dispatch_pending",
+    "fetch_changes",
+    "model_payload",
+    "record_change",
+    "subscribe",
+]
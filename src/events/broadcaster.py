@@ -0,0 +1,170 @@
+"""
+# -------------------------------
+# Broadcaster de eventos (SSE)
+# -------------------------------
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from config.logger_custom import logger as log
+
+CHANNEL = os.getenv("BROADCAST_CHANNEL", "doceteria:events")
+# Quantidade de eventos pendentes por assinante antes de desconectá-lo.
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("BROADCAST_QUEUE_SIZE", "100"))
+# Espera entre tentativas de reconectar ao Redis; dobra a cada falha.
+RECONNECT_MIN = float(os.getenv("BROADCAST_RECONNECT_MIN", "0.5"))
+RECONNECT_MAX = float(os.getenv("BROADCAST_RECONNECT_MAX", "30"))
+
+
+@dataclass(frozen=True)
+class Event:
+    event: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps({"event": self.event, "data": self.data}, default=str)
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> Event:
+        return cls(**json.loads(raw))
+
+
+# Sinal enviado ao assinante que não acompanhou o ritmo dos eventos.
+OVERFLOW = Event("reset")
+
+
+class Subscription:
+    """Fila de eventos de um cliente conectado, presa ao seu event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _put(self, event: Event) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Backpressure: em vez de crescer sem limite, a fila é descartada e o
+            # cliente recebe ``reset`` para recarregar o estado e reconectar.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+
+    async def get(self) -> Event:
+        return await self.queue.get()
+
+
+class Broadcaster:
+    """
+    Distribui eventos para todos os assinantes deste processo.
+
+    Com ``REDIS_URL`` configurado os eventos
+    passam por um canal pub/sub, alcançando os assinantes de todos os workers.
+    Se a conexão cair, a escuta reconecta com backoff e envia ``reset`` aos
+    assinantes quando o canal voltar.
+    """
+
+    def __init__(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._redis = None
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), self._maxsize)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(self, event: str, data: dict[str, Any]) -> None:
+        """Publica um evento; seguro para chamar de qualquer thread."""
+        message = Event(event, data)
+        if self._redis is not None:
+            self._redis.publish(CHANNEL, message.to_json())
+        else:
+            self._deliver(message)
+
+    def _deliver(self, message: Event) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, message)
+            except RuntimeError:  # event loop já encerrado
+                self.unsubscribe(subscription)
+
+    def connect_redis(self, url: str) -> None:
+        """Passa a publicar via Redis e inicia a thread que escuta o canal."""
+        try:
+            import redis
+            from redis import exceptions
+        except ImportError as exc:
+            raise RuntimeError(
+                "REDIS_URL definido, mas o pacote 'redis' não está instalado."
+            ) from exc
+        self._redis = redis.Redis.from_url(url)
+        falhas = (exceptions.ConnectionError, exceptions.TimeoutError)
+        threading.Thread(
+            target=self._listen,
+            args=(self._redis.pubsub, falhas),
+            name="broadcast-redis",
+            daemon=True,
+        ).start()
+
+    def _listen(
+        self,
+        abrir_pubsub: Callable[..., Any],
+        falhas: tuple[type[Exception], ...],
+    ) -> None:
+        """Escuta o canal do Redis, reconectando com backoff quando a conexão cai."""
+        espera = RECONNECT_MIN
+        caiu = False
+        while True:
+            try:
+                with abrir_pubsub(ignore_subscribe_messages=True) as pubsub:
+                    pubsub.subscribe(CHANNEL)
+                    if caiu:
+                        # Os eventos publicados durante a queda se perderam: os
+                        # assinantes recarregam o estado, agora que o canal voltou.
+                        log.info("Redis disponível de novo; eventos retomados.")
+                        self._deliver(OVERFLOW)
+                        caiu = False
+                    espera = RECONNECT_MIN
+                    for item in pubsub.listen():
+                        self._deliver(Event.from_json(item["data"]))
+            except falhas as exc:
+                if not caiu:
+                    log.warning("Redis indisponível; eventos suspensos: %s", exc)
+                    caiu = True
+                time.sleep(espera)
+                espera = min(espera * 2, RECONNECT_MAX)
+
+
+broadcaster = Broadcaster()
+
+
+def format_sse(message: Event) -> str:
+    """Formata um evento no protocolo text/event-stream."""
+    data = json.dumps(message.data, default=str)
+    return f"event: {message.event}\ndata: {data}\n\n"
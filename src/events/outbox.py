@@ -0,0 +1,161 @@
+"""
+# -------------------------------
+# Outbox transacional e feed de alterações
+# -------------------------------
+"""
+
+import json
+import os
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import httpx
+from sqlalchemy import func, inspect, select, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from config.database import DATABASE_URL, SessionLocal
+from config.logger_custom import logger as log
+from src.jobs.queue import enqueue_after_commit
+from src.jobs.worker import task
+from src.models.outbox_model import OutboxModel
+
+DISPATCH_JOB = "outbox_dispatch"
+DISPATCH_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+# URLs que recebem os lotes via POST, separadas por vírgula.
+WEBHOOKS = [url for url in os.getenv("OUTBOX_WEBHOOKS", "").split(",") if url]
+# Segundos que uma alteração espera antes de entrar no feed. O SQLite tem um
+# único escritor, então os ids são confirmados em ordem e não há espera; nos
+# demais bancos uma transação pode confirmar um id menor depois de um maior já
+# lido, e o atraso deve superar a transação de escrita mais longa.
+_SQLITE = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+CHANGES_LAG = float(os.getenv("CHANGES_LAG", "0" if _SQLITE else "5"))
+
+Subscriber = Callable[[list[dict[str, Any]]], None]
+
+_subscribers: list[Subscriber] = []
+
+
+def subscribe(callback: Subscriber) -> Subscriber:
+    """Registra um assinante que recebe cada lote de alterações despachado."""
+    _subscribers.append(callback)
+    return callback
+
+
+def model_payload(obj: Any) -> dict[str, Any]:
+    """Retorna as colunas de um objeto ORM como dicionário."""
+    mapper = inspect(obj).mapper
+    return {attr.key: getattr(obj, attr.key) for attr in mapper.column_attrs}
+
+
+def record_change(
+    db: Session,
+    entidade: str,
+    entidade_id: int,
+    operacao: str,
+    payload: dict[str, Any] | None = None,
+) -> OutboxModel:
+    """
+    Adiciona uma linha ao outbox na transação corrente da sessão.
+
+    Deve ser chamada antes do ``commit`` que grava a alteração; o despacho é
+    enfileirado para depois do commit e descartado em caso de rollback.
+    """
+    row = OutboxModel(
+        entidade=entidade,
+        entidade_id=entidade_id,
+        operacao=operacao,
+        payload=json.dumps(payload or {}, default=str),
+    )
+    db.add(row)
+    enqueue_after_commit(db, DISPATCH_JOB)
+    return row
+
+
+def change_to_dict(row: OutboxModel) -> dict[str, Any]:
+    return {
+        "seq": row.id,
+        "entidade": row.entidade,
+        "entidade_id": row.entidade_id,
+        "operacao": row.operacao,
+        "payload": json.loads(row.payload),
+        "criado_em": row.criado_em,
+    }
+
+
+def fetch_changes(db: Session, since: int, limit: int) -> list[dict[str, Any]]:
+    """
+    Retorna as alterações com sequência maior que ``since`` (busca pela PK).
+
+    Com ``CHANGES_LAG`` o lote para na primeira alteração mais recente que o
+    atraso: um id menor ainda não confirmado seria pulado pelo próximo
+    ``since``.
+    """
+    rows = db.scalars(
+        select(OutboxModel)
+        .where(OutboxModel.id > since)
+        .order_by(OutboxModel.id)
+        .limit(limit)
+    ).all()
+    if rows and CHANGES_LAG:
+        # Relógio do banco, o mesmo que preencheu criado_em.
+        agora = db.scalar(select(func.now())).replace(tzinfo=None)
+        limite = agora - timedelta(seconds=CHANGES_LAG)
+        recentes = (i for i, row in enumerate(rows) if row.criado_em > limite)
+        rows = rows[: next(recentes, len(rows))]
+    return [change_to_dict(row) for row in rows]
+
+
+def dispatch_pending(db: Session, batch_size: int = DISPATCH_BATCH_SIZE) -> int:
+    """
+    Envia um lote de alterações ainda não despachadas a todos os assinantes.
+
+    O lote só é marcado como despachado se todos os assinantes o aceitarem,
+    garantindo entrega ao menos uma vez. Retorna o tamanho do lote.
+    """
+    rows = db.scalars(
+        select(OutboxModel)
+        .where(OutboxModel.despachado_em.is_(None))
+        .order_by(OutboxModel.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0
+
+    batch = [change_to_dict(row) for row in rows]
+    for callback in _subscribers:
+        callback(batch)
+
+    db.execute(
+        update(OutboxModel)
+        .where(OutboxModel.id.in_([row.id for row in rows]))
+        .values(despachado_em=func.now())
+    )
+    db.commit()
+    return len(batch)
+
+
+def _post_webhooks(batch: list[dict[str, Any]]) -> None:
+    content = json.dumps(batch, default=str)
+    with httpx.Client(timeout=10) as client:
+        for url in WEBHOOKS:
+            response = client.post(
+                url, content=content, headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+
+
+if WEBHOOKS:
+    subscribe(_post_webhooks)
+
+
+@task(DISPATCH_JOB)
+def dispatch_job(_payload: dict[str, Any]) -> None:
+    """Drena o outbox em lotes; falhas fazem o job ser reexecutado."""
+    with SessionLocal() as db:
+        total = 0
+        while sent := dispatch_pending(db):
+            total += sent
+        if total:
+            log.info("Outbox: %d alterações despachadas.", total)
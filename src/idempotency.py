@@ -0,0 +1,109 @@
+"""
+# -------------------------------
+# Suporte ao header Idempotency-Key
+# -------------------------------
+"""
+
+import hashlib
+import json
+import os
+from datetime import timedelta
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from config.database import SessionLocal
+from config.logger_custom import logger as log
+from src.jobs.queue import enqueue_after_commit
+from src.jobs.worker import task
+from src.models.idempotency_model import IdempotencyKeyModel, utcnow
+
+IDEMPOTENCY_TTL = timedelta(hours=int(os.getenv("IDEMPOTENCY_TTL_HOURS", "24")))
+PURGE_JOB = "idempotency_purge"
+
+
+def request_hash(body: BaseModel) -> str:
+    return hashlib.sha256(body.model_dump_json().encode()).hexdigest()
+
+
+def cached_response(
+    db: Session, chave: str, rota: str, body_hash: str
+) -> JSONResponse | None:
+    """
+    Retorna a resposta gravada para a chave, se ainda estiver válida.
+
+    Reutilizar a chave com um corpo diferente é erro do cliente (422).
+    """
+    row = db.scalar(
+        select(IdempotencyKeyModel).where(
+            IdempotencyKeyModel.chave == chave,
+            IdempotencyKeyModel.rota == rota,
+            IdempotencyKeyModel.criado_em >= utcnow() - IDEMPOTENCY_TTL,
+        )
+    )
+    if row is None:
+        return None
+    if row.request_hash != body_hash:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key já utilizada com outro conteúdo.",
+        )
+    return JSONResponse(
+        json.loads(row.resposta),
+        status_code=row.status_code,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def store_response(
+    db: Session,
+    chave: str,
+    rota: str,
+    body_hash: str,
+    status_code: int,
+    resposta: Any,
+) -> None:
+    """
+    Grava a resposta na transação corrente, junto com os dados que ela descreve.
+
+    Requisições concorrentes com a mesma chave disputam a mesma chave primária:
+    apenas uma consegue fazer commit e as demais recebem ``IntegrityError``.
+    """
+    # Uma chave expirada ainda não removida pelo job de limpeza é substituída.
+    db.execute(
+        delete(IdempotencyKeyModel).where(
+            IdempotencyKeyModel.chave == chave,
+            IdempotencyKeyModel.rota == rota,
+            IdempotencyKeyModel.criado_em < utcnow() - IDEMPOTENCY_TTL,
+        )
+    )
+    db.add(
+        IdempotencyKeyModel(
+            chave=chave,
+            rota=rota,
+            request_hash=body_hash,
+            status_code=status_code,
+            resposta=json.dumps(resposta, default=str),
+        )
+    )
+    # No máximo uma limpeza por hora, qualquer que seja o volume de pedidos.
+    enqueue_after_commit(
+        db, PURGE_JOB, idempotency_key=f"{PURGE_JOB}:{utcnow():%Y%m%d%H}"
+    )
+
+
+@task(PURGE_JOB)
+def purge_expired(_payload: dict[str, Any]) -> None:
+    """Remove as chaves expiradas."""
+    with SessionLocal() as db:
+        result = db.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.criado_em < utcnow() - IDEMPOTENCY_TTL
+            )
+        )
+        db.commit()
+    log.info("Idempotency: %d chaves expiradas removidas.", result.rowcount)
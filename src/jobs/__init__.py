@@ -0,0 +1,21 @@
+from src.jobs.queue import (
+    Job,
+    MemoryBackend,
+    RedisBackend,
+    enqueue,
+    enqueue_after_commit,
+    get_backend,
+)
+from src.jobs.worker import metrics, run_pending, task
+
+__all__ = [
+    "Job",
+    "MemoryBackend",
+    "RedisBackend",
+    "enqueue",
+    "enqueue_after_commit",
+    "get_backend",
+    "metrics",
+    "run_pending",
+    "task",
+]
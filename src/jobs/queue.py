@@ -0,0 +1,181 @@
+"""
+# -------------------------------
+# Fila de jobs em background
+# -------------------------------
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from functools import cache
+from typing import Any, Protocol
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config.logger_custom import logger as log
+
+QUEUE_NAME = os.getenv("JOB_QUEUE_NAME", "doceteria:jobs")
+IDEMPOTENCY_TTL = int(os.getenv("JOB_IDEMPOTENCY_TTL", "86400"))
+
+
+@dataclass
+class Job:
+    """Unidade de trabalho serializável enviada para a fila."""
+
+    name: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    idempotency_key: str | None = None
+    attempts: int = 0
+    max_retries: int = 3
+    enqueued_at: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> Job:
+        return cls(**json.loads(raw))
+
+
+class QueueBackend(Protocol):
+    def push(self, job: Job) -> None: ...
+
+    def pop(self, timeout: float) -> Job | None: ...
+
+    def claim_key(self, key: str, ttl: int) -> bool: ...
+
+
+class MemoryBackend:
+    """Fila em memória do processo, usada em testes e sem Redis configurado."""
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[Job] = queue.Queue()
+        self._keys: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def push(self, job: Job) -> None:
+        self._queue.put(job)
+
+    def pop(self, timeout: float) -> Job | None:
+        try:
+            if timeout:
+                return self._queue.get(timeout=timeout)
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def claim_key(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expires = self._keys.get(key)
+            if expires is not None and expires > now:
+                return False
+            self._keys[key] = now + ttl
+            return True
+
+
+class RedisBackend:
+    """Fila compartilhada entre processos usando uma lista do Redis."""
+
+    def __init__(self, url: str, name: str = QUEUE_NAME) -> None:
+        import redis
+
+        self._redis = redis.Redis.from_url(url)
+        self._name = name
+
+    def push(self, job: Job) -> None:
+        self._redis.rpush(self._name, job.to_json())
+
+    def pop(self, timeout: float) -> Job | None:
+        if not timeout:
+            raw = self._redis.lpop(self._name)
+            return Job.from_json(raw) if raw else None
+        item = self._redis.blpop([self._name], timeout=max(1, int(timeout)))
+        return Job.from_json(item[1]) if item else None
+
+    def claim_key(self, key: str, ttl: int) -> bool:
+        return bool(self._redis.set(f"{self._name}:idem:{key}", 1, nx=True, ex=ttl))
+
+
+@cache
+def get_backend() -> QueueBackend:
+    """
+    Retorna o backend configurado: Redis quando ``REDIS_URL`` existir.
+
+    Sem o pacote ``redis`` a aplicação não sobe, em vez de cair para a fila em
+    memória, que o worker separado nunca enxergaria.
+    """
+    url = os.getenv("REDIS_URL")
+    if url:
+        try:
+            return RedisBackend(url)
+        except ImportError as exc:
+            raise RuntimeError(
+                "REDIS_URL definido, mas o pacote 'redis' não está instalado."
+            ) from exc
+    return MemoryBackend()
+
+
+def enqueue(
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    idempotency_key: str | None = None,
+    max_retries: int = 3,
+    backend: QueueBackend | None = None,
+) -> Job | None:
+    """
+    Enfileira um job.
+
+    Retorna ``None`` quando ``idempotency_key`` já foi usada dentro do TTL, ou
+    seja, o mesmo trabalho já está na fila ou já foi executado.
+    """
+    backend = backend or get_backend()
+    if idempotency_key and not backend.claim_key(idempotency_key, IDEMPOTENCY_TTL):
+        log.info("Job %s ignorado: chave %s já utilizada.", name, idempotency_key)
+        return None
+    job = Job(
+        name=name,
+        payload=payload or {},
+        idempotency_key=idempotency_key,
+        max_retries=max_retries,
+    )
+    backend.push(job)
+    return job
+
+
+def _flush_pending(session: Session) -> None:
+    pending = session.info.pop("pending_jobs", [])
+    for args, kwargs in pending:
+        enqueue(*args, **kwargs)
+
+
+def _discard_pending(session: Session, _previous_transaction: Any) -> None:
+    session.info.pop("pending_jobs", None)
+
+
+def enqueue_after_commit(db: Session, name: str, *args: Any, **kwargs: Any) -> None:
+    """
+    Agenda um job para ser enfileirado somente após o ``commit`` da sessão.
+
+    Se a transação sofrer rollback o job é descartado, então os routers podem
+    chamar esta função antes de ``db.commit()`` sem risco de processar dados
+    que não foram gravados. Chamadas idênticas na mesma transação geram um único
+    job.
+    """
+    if "pending_jobs" not in db.info:
+        db.info["pending_jobs"] = []
+        if not event.contains(db, "after_commit", _flush_pending):
+            event.listen(db, "after_commit", _flush_pending)
+            event.listen(db, "after_soft_rollback", _discard_pending)
+    entry = ((name, *args), kwargs)
+    if entry not in db.info["pending_jobs"]:
+        db.info["pending_jobs"].append(entry)
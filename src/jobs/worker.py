@@ -0,0 +1,159 @@
+"""
+# -------------------------------
+# Worker da fila de jobs
+# -------------------------------
+
+Uso: ``python -m src.jobs.worker``
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from config.logger_custom import logger as log
+from src.jobs.queue import Job, QueueBackend, get_backend
+
+JobHandler = Callable[[dict[str, Any]], None]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def task(name: str) -> Callable[[JobHandler], JobHandler]:
+    """Registra uma função como handler do job ``name``."""
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _handlers[name] = func
+        return func
+
+    return decorator
+
+
+@dataclass
+class JobStats:
+    executed: int = 0
+    failed: int = 0
+    retried: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.executed if self.executed else 0.0
+
+
+_stats: dict[str, JobStats] = {}
+_stats_lock = threading.Lock()
+
+
+def metrics() -> dict[str, dict[str, float]]:
+    """Retorna as métricas de execução por nome de job deste processo."""
+    with _stats_lock:
+        return {
+            name: {
+                "executed": s.executed,
+                "failed": s.failed,
+                "retried": s.retried,
+                "avg_seconds": round(s.avg_seconds, 6),
+                "max_seconds": round(s.max_seconds, 6),
+            }
+            for name, s in _stats.items()
+        }
+
+
+def _record(name: str, elapsed: float, ok: bool, retried: bool) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(name, JobStats())
+        stats.executed += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.failed += not ok
+        stats.retried += retried
+
+
+def run_job(job: Job, backend: QueueBackend) -> bool:
+    """Executa um job, reenfileirando-o enquanto houver tentativas."""
+    handler = _handlers.get(job.name)
+    if handler is None:
+        log.error("Job %s (%s) sem handler registrado.", job.name, job.id)
+        return False
+
+    start = time.perf_counter()
+    try:
+        handler(job.payload)
+    except Exception:
+        elapsed = time.perf_counter() - start
+        job.attempts += 1
+        retry = job.attempts <= job.max_retries
+        _record(job.name, elapsed, ok=False, retried=retry)
+        log.exception(
+            "Job %s (%s) falhou na tentativa %d.", job.name, job.id, job.attempts
+        )
+        if retry:
+            backend.push(job)
+        return False
+
+    elapsed = time.perf_counter() - start
+    _record(job.name, elapsed, ok=True, retried=False)
+    log.info("Job %s (%s) concluído em %.3fs.", job.name, job.id, elapsed)
+    return True
+
+
+def run_pending(backend: QueueBackend | None = None, limit: int = 1000) -> int:
+    """Processa os jobs já enfileirados e retorna quantos foram executados."""
+    backend = backend or get_backend()
+    count = 0
+    while count < limit and (job := backend.pop(timeout=0)) is not None:
+        run_job(job, backend)
+        count += 1
+    return count
+
+
+def run_worker(
+    backend: QueueBackend | None = None,
+    stop: threading.Event | None = None,
+    poll_timeout: float = 1.0,
+) -> None:
+    """Laço principal do worker; termina quando ``stop`` for sinalizado."""
+    backend = backend or get_backend()
+    stop = stop or threading.Event()
+    log.info("Worker de jobs iniciado (%s).", type(backend).__name__)
+    while not stop.is_set():
+        job = backend.pop(timeout=poll_timeout)
+        if job is not None:
+            run_job(job, backend)
+
+
+def start_background_worker(backend: QueueBackend | None = None) -> threading.Event:
+    """
+    Inicia o worker em uma thread do próprio processo.
+
+    Usado quando a fila é em memória, onde um processo separado não enxergaria
+    os jobs. Retorna o evento que encerra a thread.
+    """
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=run_worker, args=(backend, stop), name="job-worker", daemon=True
+    )
+    thread.start()
+    return stop
+
+
+def main() -> None:
+    import signal
+
+    import src.main  # noqa: F401  registra os handlers declarados nos routers
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        run_worker(stop=stop)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
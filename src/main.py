@@ -1,9 +1,27 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from config.config_model import Base
-from config.database import engine
+from config.database import SessionLocal, engine
+from config.load_shedding import (
+    MAX_CONCURRENCIA,
+    ConcurrencyLimitMiddleware,
+    pool_timeout_handler,
+)
 from config.logger_custom import logger as log
+from config.memoria import iniciar_tracemalloc
+from config.profiling import ProfilerMiddleware, profiler_habilitado
+from config.rate_limit import RATE_LIMIT_RPS, RateLimitMiddleware, make_bucket
+from config.threadpool import configurar_threadpool
+from src.catalogo import catalogo_cache
+from src.events.broadcaster import broadcaster
+from src.jobs.queue import MemoryBackend, get_backend
+from src.jobs.worker import start_background_worker
 from src.models import (
     CategoriaModel,
     IngredienteModel,
@@ -13,14 +31,42 @@ from src.models import (
     ReceitaModel,
     VendaModel,
 )
+from src.routers.arquivo_router import arquivo_router
 from src.routers.categorias_router import categoria_router
+from src.routers.change_router import change_router
+from src.routers.checkout_router import checkout_router
 from src.routers.cliente_router import cliente_router
+from src.routers.diagnostico_router import diagnostico_router
 from src.routers.pedido_router import pedido_router
 from src.routers.produto_router import produto_router
 from src.routers.receita_router import receita_router
 from src.routers.venda_router import venda_router
 
-app = FastAPI(title="Doceteria API", version="0.0.1-beta")
+try:  # brotli é opcional; sem ele as respostas são comprimidas apenas com gzip
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # pragma: no cover
+    BrotliMiddleware = None
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    configurar_threadpool()
+    iniciar_tracemalloc()
+    # Sem Redis a fila vive neste processo, então o worker também precisa viver.
+    backend = get_backend()
+    stop = None
+    if isinstance(backend, MemoryBackend):
+        stop = start_background_worker(backend)
+    if redis_url := os.getenv("REDIS_URL"):
+        broadcaster.connect_redis(redis_url)
+    with SessionLocal() as db:
+        catalogo_cache.obter(db)
+    yield
+    if stop is not None:
+        stop.set()
+
+
+app = FastAPI(title="Doceteria API", version="0.0.1-beta", lifespan=lifespan)
 
 
 def log_tables():
@@ -46,12 +92,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Respostas menores que o limite não compensam o custo de compressão.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1000"))
+
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
+# Conexões SSE e long-poll ficam abertas por muito tempo e não ocupam vaga.
+ROTAS_LONGAS = ("/pedidos/stream", "/changes")
+
+if MAX_CONCURRENCIA:
+    app.add_middleware(
+        ConcurrencyLimitMiddleware, limite=MAX_CONCURRENCIA, exempt=ROTAS_LONGAS
+    )
+
+# Só existe quando habilitado por env, para não custar nada no caminho normal.
+if profiler_habilitado():
+    app.add_middleware(ProfilerMiddleware, exempt=ROTAS_LONGAS)
+
+# Adicionado por último para ficar por fora: o cliente acima do limite é
+# recusado antes de disputar uma vaga.
+if RATE_LIMIT_RPS:
+    app.add_middleware(
+        RateLimitMiddleware, bucket=make_bucket(), exempt=("/docs", "/openapi.json")
+    )
+
+app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+
 app.include_router(cliente_router)
 app.include_router(pedido_router)
 app.include_router(produto_router)
 app.include_router(receita_router)
 app.include_router(venda_router)
+app.include_router(checkout_router)
 app.include_router(categoria_router)
+app.include_router(change_router)
+app.include_router(arquivo_router)
+app.include_router(diagnostico_router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,6 +1,15 @@
+from src.models.arquivo_model import (
+    ItemArquivoModel,
+    PedidoArquivoModel,
+    ResumoArquivoClienteModel,
+    VendaArquivoModel,
+)
 from src.models.categoria_model import CategoriaModel
+from src.models.cliente_model import ClienteModel
+from src.models.idempotency_model import IdempotencyKeyModel
 from src.models.ingrediente_model import IngredienteModel
 from src.models.item_model import ItemModel
+from src.models.outbox_model import OutboxModel
 from src.models.pedido_model import PedidoModel
 from src.models.produto_model import ProdutoModel
 from src.models.receita_model import ReceitaModel
@@ -8,10 +17,17 @@ from src.models.venda_model import VendaModel
 
 __all__ = [
     "CategoriaModel",
+    "ClienteModel",
     "ProdutoModel",
     "ReceitaModel",
     "IngredienteModel",
     "ItemModel",
     "PedidoModel",
     "VendaModel",
+    "OutboxModel",
+    "IdempotencyKeyModel",
+    "PedidoArquivoModel",
+    "ItemArquivoModel",
+    "VendaArquivoModel",
+    "ResumoArquivoClienteModel",
 ]
@@ -0,0 +1,84 @@
+"""
+# -------------------------------
+# Arquivo de pedidos antigos
+# -------------------------------
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from config.config_model import Base
+from config.types import Cents
+
+
+class PedidoArquivoModel(Base):
+    """
+    Pedido concluído movido das tabelas quentes pelo arquivamento.
+
+    Mantém o mesmo ``id`` do pedido original. Sem FK para ``clientes``: o arquivo
+    não deve impedir nem acompanhar alterações nas tabelas quentes.
+    """
+
+    __tablename__ = "pedidos_arquivo"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    quantidade: Mapped[int] = mapped_column(Integer, nullable=False)
+    preco_total: Mapped[Decimal] = mapped_column(Cents, nullable=False)
+    cliente_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    criado_em: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    arquivado_em: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+
+    itens_pedido: Mapped[list[ItemArquivoModel]] = relationship(
+        "ItemArquivoModel", passive_deletes=True, lazy="selectin"
+    )
+    venda: Mapped[VendaArquivoModel | None] = relationship(
+        "VendaArquivoModel", uselist=False, passive_deletes=True, lazy="selectin"
+    )
+
+
+class ItemArquivoModel(Base):
+
+    __tablename__ = "itens_pedido_arquivo"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    produto_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    pedido_id: Mapped[int] = mapped_column(
+        ForeignKey("pedidos_arquivo.id", ondelete="CASCADE"), index=True
+    )
+    quantidade: Mapped[float] = mapped_column(Float, nullable=False)
+    preco_unitario: Mapped[Decimal] = mapped_column(Cents, nullable=False)
+
+
+class VendaArquivoModel(Base):
+
+    __tablename__ = "vendas_arquivo"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    pedido_id: Mapped[int] = mapped_column(
+        ForeignKey("pedidos_arquivo.id", ondelete="CASCADE"), unique=True
+    )
+    forma_pagamento: Mapped[str] = mapped_column(String(50), nullable=False)
+    status_venda: Mapped[str] = mapped_column(String(50), nullable=False)
+
+
+class ResumoArquivoClienteModel(Base):
+    """
+    Totais dos pedidos arquivados por cliente.
+
+    Atualizado na mesma transação que move os pedidos, para que o resumo de
+    ``/clientes/{id}/pedidos`` continue considerando todo o histórico.
+    """
+
+    __tablename__ = "resumo_arquivo_cliente"
+
+    cliente_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    quantidade_pedidos: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_gasto: Mapped[Decimal] = mapped_column(Cents, nullable=False)
+    ultimo_pedido_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -29,5 +29,6 @@ class CategoriaModel(Base):
         "ProdutoModel",
         back_populates="categoria",
         cascade="all, delete",
+        passive_deletes=True,
         lazy="selectin",
     )
@@ -4,10 +4,12 @@ Módulo que define o modelo ClienteModel para a doceteria.
 
 from __future__ import annotations
 
+import re
+import unicodedata
 from typing import TYPE_CHECKING
 
 from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from config.config_model import (
     Base,  # Certifique-se de que 'Base' está definido em config_model.py
@@ -17,6 +19,17 @@ if TYPE_CHECKING:
     from src.models.pedido_model import PedidoModel
 
 
+def normalizar_telefone(telefone: str) -> str:
+    """Mantém apenas os dígitos: ``(11) 98888-7777`` vira ``11988887777``."""
+    return re.sub(r"\D", "", telefone)
+
+
+def normalizar_nome(nome: str) -> str:
+    """Minúsculas, sem acentos e com espaços simples, para busca por prefixo."""
+    sem_acentos = unicodedata.normalize("NFKD", nome).encode("ascii", "ignore")
+    return " ".join(sem_acentos.decode().lower().split())
+
+
 class ClienteModel(Base):
     """
     Classe que representa um cliente na doceteria.
@@ -26,6 +39,8 @@ class ClienteModel(Base):
         nome (str): O nome do cliente.
         telefone (str): O telefone do cliente.
         endereco (str): O endereço do cliente.
+        telefone_digitos (str): Telefone normalizado, indexado para busca.
+        nome_busca (str): Nome normalizado, indexado para busca por prefixo.
     """
 
     __tablename__ = "clientes"
@@ -34,10 +49,23 @@ class ClienteModel(Base):
     nome: Mapped[str] = mapped_column(String(100), nullable=False)
     telefone: Mapped[str] = mapped_column(String(15), nullable=False)
     endereco: Mapped[str] = mapped_column(String(255), nullable=False)
+    telefone_digitos: Mapped[str | None] = mapped_column(String(15), index=True)
+    nome_busca: Mapped[str | None] = mapped_column(String(100), index=True)
 
+    # Carregado só quando acessado; o histórico usa /clientes/{id}/pedidos.
     pedidos: Mapped[list[PedidoModel]] = relationship(
-        "PedidoModel", back_populates="cliente", lazy="selectin"
+        "PedidoModel", back_populates="cliente", passive_deletes="all", lazy="select"
     )
 
+    @validates("telefone")
+    def _sincronizar_telefone(self, _key: str, telefone: str) -> str:
+        self.telefone_digitos = normalizar_telefone(telefone)
+        return telefone
+
+    @validates("nome")
+    def _sincronizar_nome(self, _key: str, nome: str) -> str:
+        self.nome_busca = normalizar_nome(nome)
+        return nome
+
     class Config:
         from_attributes = True
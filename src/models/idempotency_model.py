@@ -0,0 +1,42 @@
+"""
+# -------------------------------
+# Idempotency Key Model
+# -------------------------------
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from config.config_model import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class IdempotencyKeyModel(Base):
+    """
+    Resposta gravada para uma chave ``Idempotency-Key``.
+
+    Attributes:
+        chave (str): Valor do header enviado pelo cliente.
+        rota (str): Nome da rota, para que a mesma chave possa ser usada em rotas
+            diferentes.
+        request_hash (str): Hash do corpo da requisição original.
+        status_code (int): Status HTTP da resposta original.
+        resposta (str): Corpo JSON da resposta original.
+        criado_em (datetime): Momento da gravação, usado para expirar a chave.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    chave: Mapped[str] = mapped_column(String(255), primary_key=True)
+    rota: Mapped[str] = mapped_column(String(100), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    status_code: Mapped[int] = mapped_column(Integer, nullable=False)
+    resposta: Mapped[str] = mapped_column(Text, nullable=False)
+    criado_em: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utcnow, index=True
+    )
@@ -31,11 +31,13 @@ class IngredienteModel(Base):
     __tablename__ = "ingredientes"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    nome: Mapped[str] = mapped_column(String(100))
+    # Único: resolve os nomes recebidos na criação de receitas sem repetições.
+    nome: Mapped[str] = mapped_column(String(100), index=True, unique=True)
     # Relação inversa com Receita
     receitas: Mapped[list[ReceitaModel]] = relationship(
         "ReceitaModel",
         secondary=receita_ingrediente_table,
         back_populates="ingredientes",
+        passive_deletes=True,
         lazy="selectin",
     )
@@ -6,12 +6,14 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Float, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from config.config_model import Base
+from config.types import Cents
 
 if TYPE_CHECKING:
     from src.models.pedido_model import PedidoModel
@@ -23,10 +25,12 @@ class ItemModel(Base):
     __tablename__ = "itens_pedido"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    produto_id: Mapped[int] = mapped_column(ForeignKey("produtos.id"))
-    pedido_id: Mapped[int] = mapped_column(ForeignKey("pedidos.id"))
+    produto_id: Mapped[int] = mapped_column(
+        ForeignKey("produtos.id", ondelete="RESTRICT")
+    )
+    pedido_id: Mapped[int] = mapped_column(ForeignKey("pedidos.id", ondelete="CASCADE"))
     quantidade: Mapped[float] = mapped_column(Float, nullable=False)
-    preco_unitario: Mapped[float] = mapped_column(Float, nullable=False)
+    preco_unitario: Mapped[Decimal] = mapped_column(Cents, nullable=False)
 
     produto: Mapped[ProdutoModel] = relationship(
         "ProdutoModel", back_populates="itens_pedidos", lazy="selectin"
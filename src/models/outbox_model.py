@@ -0,0 +1,41 @@
+"""
+# -------------------------------
+# Outbox Model
+# -------------------------------
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from config.config_model import Base
+
+
+class OutboxModel(Base):
+    """
+    Registro de alteração gravado na mesma transação que pedidos e vendas.
+
+    Attributes:
+        id (int): Sequência global da alteração (usada pelo feed ``/changes``).
+        entidade (str): Nome da entidade alterada (``pedido`` ou ``venda``).
+        entidade_id (int): O ID do registro alterado.
+        operacao (str): ``create``, ``update`` ou ``delete``.
+        payload (str): Estado serializado em JSON após a alteração.
+        criado_em (datetime): Momento da alteração.
+        despachado_em (datetime | None): Momento em que foi enviado aos assinantes.
+    """
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entidade: Mapped[str] = mapped_column(String(50), nullable=False)
+    entidade_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    operacao: Mapped[str] = mapped_column(String(20), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False, default="{}")
+    criado_em: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+    despachado_em: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
@@ -6,12 +6,16 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from config.config_model import Base
+from config.soft_delete import SoftDeleteMixin
+from config.types import Cents, Timestamp
 
 if TYPE_CHECKING:
     from src.models.cliente_model import ClienteModel
@@ -19,21 +23,43 @@ if TYPE_CHECKING:
     from src.models.venda_model import VendaModel
 
 
-class PedidoModel(Base):
+class PedidoModel(SoftDeleteMixin, Base):
 
     __tablename__ = "pedidos"
+    __table_args__ = (
+        # Cobre o histórico por cliente: paginação por (cliente_id, id) e o
+        # resumo (COUNT/SUM/MAX) sem acessar a tabela, já filtrando os excluídos.
+        Index(
+            "ix_pedidos_cliente_historico",
+            "cliente_id",
+            "id",
+            "preco_total",
+            "excluido_em",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     quantidade: Mapped[int] = mapped_column(Integer, nullable=False)
-    preco_total: Mapped[float] = mapped_column(Float, nullable=False)
-    cliente_id: Mapped[int] = mapped_column(ForeignKey("clientes.id"))
+    preco_total: Mapped[Decimal] = mapped_column(Cents, nullable=False)
+    cliente_id: Mapped[int] = mapped_column(
+        ForeignKey("clientes.id", ondelete="RESTRICT")
+    )
+    # Indexado para o arquivamento selecionar os pedidos antigos. Precisão de
+    # segundos: é a do ``server_default`` no SQLite.
+    criado_em: Mapped[datetime] = mapped_column(
+        Timestamp, nullable=False, server_default=func.now(), index=True
+    )
 
     cliente: Mapped[ClienteModel] = relationship(
         "ClienteModel", back_populates="pedidos", lazy="selectin"
     )
 
     itens_pedido: Mapped[list[ItemModel]] = relationship(
-        "ItemModel", back_populates="pedido", cascade="all, delete", lazy="selectin"
+        "ItemModel",
+        back_populates="pedido",
+        cascade="all, delete",
+        passive_deletes=True,
+        lazy="selectin",
     )
 
     # 🔗 Relacionamento 1:1 com Venda
@@ -42,5 +68,6 @@ class PedidoModel(Base):
         back_populates="pedido",
         uselist=False,  # garante 1:1
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="selectin",
     )
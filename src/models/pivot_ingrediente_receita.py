@@ -4,18 +4,27 @@
 # -------------------------------
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, Table
+from sqlalchemy import Column, Float, ForeignKey, Integer, Table
 
 from config.config_model import Base
 
 receita_ingrediente_table = Table(
     "receita_ingrediente",
     Base.metadata,
-    Column("receita_id", Integer, ForeignKey("receitas.id"), primary_key=True),
+    Column(
+        "receita_id",
+        Integer,
+        ForeignKey("receitas.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
     Column(
         "ingrediente_id",
         Integer,
-        ForeignKey("ingredientes.id"),
+        ForeignKey("ingredientes.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # Quantidade do ingrediente na receita; nula nas linhas anteriores a ela.
+    Column("quantidade", Float, nullable=True),
+    # Ordem do ingrediente na receita, como foi enviado na criação.
+    Column("posicao", Integer, nullable=True),
 )
@@ -8,12 +8,15 @@
 
 from __future__ import annotations
 
+from datetime import date
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from config.config_model import Base
+from config.types import Cents
 
 if TYPE_CHECKING:
     from src.models.categoria_model import CategoriaModel
@@ -23,21 +26,29 @@ if TYPE_CHECKING:
 class ProdutoModel(Base):
 
     __tablename__ = "produtos"
+    __table_args__ = (
+        # Faixa de validade (/produtos/vencendo) já filtrando o estoque no índice.
+        Index("ix_produtos_validade_quantidade", "data_validade", "quantidade"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     nome_produto: Mapped[str] = mapped_column(String(150), nullable=False)
-    data_validade: Mapped[str] = mapped_column(String(20), nullable=False)
-    marca: Mapped[str] = mapped_column(String(100), nullable=False)
+    # Nula apenas para valores antigos que não puderam ser convertidos.
+    data_validade: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # Índices de marca, preço e categoria atendem os filtros de /produtos.
+    marca: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     codigo_barras: Mapped[str] = mapped_column(String(50), unique=True)
-    preco_unidade: Mapped[float] = mapped_column(Float, nullable=False)
+    preco_unidade: Mapped[Decimal] = mapped_column(Cents, nullable=False, index=True)
     unidade: Mapped[str] = mapped_column(String(20), nullable=False)
     quantidade: Mapped[float] = mapped_column(Float, nullable=False)
-    categoria_id: Mapped[int] = mapped_column(ForeignKey("categorias.id"))
+    categoria_id: Mapped[int] = mapped_column(
+        ForeignKey("categorias.id", ondelete="CASCADE"), index=True
+    )
 
     categoria: Mapped[CategoriaModel] = relationship(
         "CategoriaModel", back_populates="produtos", lazy="selectin"
     )
 
     itens_pedidos: Mapped[list[ItemModel]] = relationship(
-        "ItemModel", back_populates="produto", lazy="selectin"
+        "ItemModel", back_populates="produto", passive_deletes="all", lazy="selectin"
     )
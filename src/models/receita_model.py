@@ -6,12 +6,14 @@
 
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Float, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from config.config_model import Base
+from config.types import Cents
 from src.models.pivot_ingrediente_receita import receita_ingrediente_table
 
 if TYPE_CHECKING:
@@ -27,11 +29,11 @@ class ReceitaModel(Base):
         porcao_rendimento (str): A porção de rendimento da receita.
         modo_preparo (str): O modo de preparo da receita.
         margem_lucro (float): A margem de lucro da receita.
-        preco_sugerido (float): O preço sugerido da receita.
-        preco_venda (float): O preço de venda da receita.
-        custo_porcao (float): O custo por porção da receita.
-        custo_total (float): O custo total da receita.
-        lucro_sugerido (float): O lucro sugerido da receita.
+        preco_sugerido (Decimal): O preço sugerido da receita.
+        preco_venda (Decimal): O preço de venda da receita.
+        custo_porcao (Decimal): O custo por porção da receita.
+        custo_total (Decimal): O custo total da receita.
+        lucro_sugerido (Decimal): O lucro sugerido da receita.
         ingredientes (List[Ingrediente]): A lista de ingredientes usados na receita.
     """
 
@@ -42,17 +44,17 @@ class ReceitaModel(Base):
     porcao_rendimento: Mapped[str] = mapped_column(String(50))
     modo_preparo: Mapped[str] = mapped_column(String)
     margem_lucro: Mapped[float] = mapped_column(Float)
-    preco_sugerido: Mapped[float] = mapped_column(Float)
-    preco_venda: Mapped[float] = mapped_column(Float)
-    custo_porcao: Mapped[float] = mapped_column(Float)
-    custo_porcao: Mapped[float] = mapped_column(Float)
-    custo_total: Mapped[float] = mapped_column(Float)
-    lucro_sugerido: Mapped[float] = mapped_column(Float)
+    preco_sugerido: Mapped[Decimal] = mapped_column(Cents)
+    preco_venda: Mapped[Decimal] = mapped_column(Cents)
+    custo_porcao: Mapped[Decimal] = mapped_column(Cents)
+    custo_total: Mapped[Decimal] = mapped_column(Cents)
+    lucro_sugerido: Mapped[Decimal] = mapped_column(Cents)
 
     # Relação Many-to-Many com Ingredientes
     ingredientes: Mapped[list[IngredienteModel]] = relationship(
         "IngredienteModel",
         secondary=receita_ingrediente_table,
         back_populates="receitas",
+        passive_deletes=True,
         lazy="selectin",
     )
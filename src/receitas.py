@@ -0,0 +1,152 @@
+"""
+# -------------------------------
+# Criação de receitas em lote
+# -------------------------------
+
+As receitas chegam com os ingredientes por nome. Os nomes de todas as receitas
+do lote são resolvidos juntos: um ``SELECT ... WHERE nome IN (...)``, um único
+``INSERT ... ON CONFLICT DO NOTHING`` (executemany) dos ingredientes que ainda
+não existem e outro para as linhas de ``receita_ingrediente``. O custo não
+cresce com o número de ingredientes de cada receita.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from config.queries import chunked
+from src.events.outbox import model_payload
+from src.models.ingrediente_model import IngredienteModel
+from src.models.pivot_ingrediente_receita import receita_ingrediente_table
+from src.models.receita_model import ReceitaModel
+from src.schermas.receita_scherma import ReceitaScherma
+
+_CAMPOS_LISTA = {"ingrediente", "quantidade"}
+# Bancos com ``INSERT ... ON CONFLICT DO NOTHING``.
+_INSERT_SEM_CONFLITO = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def _normalizar(nome: str) -> str:
+    return " ".join(nome.split())
+
+
+def _buscar_ingredientes(db: Session, nomes: Iterable[str]) -> dict[str, int]:
+    ids: dict[str, int] = {}
+    for lote in chunked(sorted(nomes)):
+        linhas = db.execute(
+            select(IngredienteModel.nome, IngredienteModel.id).where(
+                IngredienteModel.nome.in_(lote)
+            )
+        )
+        ids.update(linhas.tuples().all())
+    return ids
+
+
+def _inserir_ingredientes(db: Session, nomes: Sequence[str]) -> None:
+    dialeto = db.get_bind().dialect.name
+    if dialeto in _INSERT_SEM_CONFLITO:
+        stmt = _INSERT_SEM_CONFLITO[dialeto](IngredienteModel).on_conflict_do_nothing(
+            index_elements=[IngredienteModel.nome]
+        )
+    else:
+        stmt = insert(IngredienteModel)
+    db.execute(stmt, [{"nome": nome} for nome in nomes])
+
+
+def resolver_ingredientes(db: Session, nomes: Iterable[str]) -> dict[str, int]:
+    """
+    Retorna o id de cada nome, cadastrando de uma vez os que não existem.
+
+    Os nomes são comparados após juntar espaços repetidos; maiúsculas e
+    minúsculas são mantidas como vieram. O nome é único: um ingrediente gravado
+    por outra transação entre o ``SELECT`` e o ``INSERT`` é ignorado pelo
+    ``ON CONFLICT`` e lido na nova consulta.
+    """
+    nomes = {_normalizar(nome) for nome in nomes}
+    ids = _buscar_ingredientes(db, nomes)
+    novos = sorted(nomes - ids.keys())
+    if novos:
+        _inserir_ingredientes(db, novos)
+        ids.update(_buscar_ingredientes(db, novos))
+    return ids
+
+
+def _quantidades(receita: ReceitaScherma) -> dict[str, float]:
+    """
+    Quantidade por ingrediente, somando nomes repetidos na mesma receita.
+
+    A ordem é a da primeira ocorrência de cada nome.
+    """
+    quantidades: dict[str, float] = {}
+    for nome, quantidade in zip(receita.ingrediente, receita.quantidade, strict=True):
+        nome = _normalizar(nome)
+        quantidades[nome] = quantidades.get(nome, 0.0) + quantidade
+    return quantidades
+
+
+def criar_receitas(
+    db: Session, receitas: Sequence[ReceitaScherma]
+) -> list[ReceitaModel]:
+    """Grava as receitas e seus ingredientes na transação corrente, sem commit."""
+    quantidades = [_quantidades(receita) for receita in receitas]
+    ids = resolver_ingredientes(db, {nome for q in quantidades for nome in q})
+
+    modelos = [
+        ReceitaModel(**receita.model_dump(exclude=_CAMPOS_LISTA))
+        for receita in receitas
+    ]
+    db.add_all(modelos)
+    db.flush()
+
+    pivot = [
+        {
+            "receita_id": modelo.id,
+            "ingrediente_id": ids[nome],
+            "quantidade": qtd,
+            "posicao": posicao,
+        }
+        for modelo, por_nome in zip(modelos, quantidades, strict=True)
+        for posicao, (nome, qtd) in enumerate(por_nome.items())
+    ]
+    if pivot:
+        db.execute(insert(receita_ingrediente_table), pivot)
+    return modelos
+
+
+def serializar_receitas(
+    db: Session, receitas: Sequence[ReceitaModel]
+) -> list[dict[str, Any]]:
+    """
+    Monta a resposta de ``ReceitaScherma`` para ``receitas``.
+
+    Os ingredientes e as quantidades de todas elas vêm de uma única consulta ao
+    ``receita_ingrediente``, em vez de um carregamento por receita, na ordem em
+    que foram enviados. Linhas anteriores a ``posicao`` seguem a ordem dos ids.
+    """
+    por_receita: dict[int, tuple[list[str], list[float]]] = {
+        receita.id: ([], []) for receita in receitas
+    }
+    pivot = receita_ingrediente_table.c
+    for lote in chunked(list(por_receita)):
+        linhas = db.execute(
+            select(pivot.receita_id, IngredienteModel.nome, pivot.quantidade)
+            .join(IngredienteModel, IngredienteModel.id == pivot.ingrediente_id)
+            .where(pivot.receita_id.in_(lote))
+            .order_by(pivot.receita_id, pivot.posicao, pivot.ingrediente_id)
+        )
+        for receita_id, nome, quantidade in linhas:
+            nomes, quantidades = por_receita[receita_id]
+            nomes.append(nome)
+            quantidades.append(quantidade or 0.0)
+
+    return [
+        {
+            **model_payload(receita),
+            "ingrediente": por_receita[receita.id][0],
+            "quantidade": por_receita[receita.id][1],
+        }
+        for receita in receitas
+    ]
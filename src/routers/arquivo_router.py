@@ -0,0 +1,67 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.dependencies import get_db
+from src.arquivamento import ARQUIVO_JOB  # noqa: F401  registra o job
+from src.models.arquivo_model import PedidoArquivoModel
+from src.schermas.arquivo_scherma import PedidoArquivoScherma, PedidosArquivoScherma
+
+arquivo_router = APIRouter()
+tag = "Arquivo"
+
+
+@arquivo_router.get(
+    "/arquivo/pedidos",
+    tags=[tag],
+    name="arquivo_pedido_index",
+    summary="Pedidos arquivados",
+    description=(
+        "Pedidos movidos para o arquivo, do mais recente para o mais antigo, "
+        "paginados por cursor (`antes_de`)."
+    ),
+    response_description="Página de pedidos arquivados.",
+    status_code=200,
+    response_model=PedidosArquivoScherma,
+)
+def arquivo_pedido_index(
+    db: Annotated[Session, Depends(get_db)],
+    cliente_id: int | None = Query(None, ge=1),
+    antes_de: int | None = Query(None, ge=1, description="Cursor: ID do pedido."),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict:
+    stmt = (
+        select(PedidoArquivoModel)
+        .order_by(PedidoArquivoModel.id.desc())
+        .limit(limit + 1)
+    )
+    if cliente_id is not None:
+        stmt = stmt.where(PedidoArquivoModel.cliente_id == cliente_id)
+    if antes_de is not None:
+        stmt = stmt.where(PedidoArquivoModel.id < antes_de)
+    pedidos = db.scalars(stmt).all()
+
+    proximo_cursor = pedidos[limit - 1].id if len(pedidos) > limit else None
+    return {"pedidos": pedidos[:limit], "proximo_cursor": proximo_cursor}
+
+
+@arquivo_router.get(
+    "/arquivo/pedidos/{id}",
+    tags=[tag],
+    name="arquivo_pedido_show",
+    summary="Pedido arquivado",
+    description="Pedido arquivado com seus itens e a venda.",
+    response_description="Pedido arquivado.",
+    status_code=200,
+    response_model=PedidoArquivoScherma,
+)
+def arquivo_pedido_show(
+    id_: Annotated[int, Path(alias="id")],
+    db: Annotated[Session, Depends(get_db)],
+) -> PedidoArquivoModel:
+    pedido = db.get(PedidoArquivoModel, id_)
+    if pedido is None:
+        raise HTTPException(status_code=404, detail="Pedido arquivado não encontrado.")
+    return pedido
@@ -1,13 +1,24 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
-from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
+from config.projection import load_options
+from config.queries import (
+    delete_ids,
+    in_request_order,
+    parse_ids,
+    update_data,
+    update_returning,
+)
+from config.versioning import bump_version, not_modified
+from src.catalogo import CategoriaRecord, catalogo_cache
 from src.models.categoria_model import CategoriaModel
-from src.schermas.categoria_scherma import CategoriaScherma
+from src.schermas.categoria_scherma import CategoriaScherma, CategoriaUpdateScherma
+from src.schermas.exclusao_scherma import ExclusaoLoteScherma
 
 categoria_router = APIRouter()
 tag = "Categoria"
@@ -29,16 +40,25 @@ def read_root():
     response_model=list[CategoriaScherma],
 )
 def listar_categorias(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-) -> list[CategoriaModel]:
+    ids: str | None = Query(
+        None, description="Ids separados por vírgula; ignora a paginação."
+    ),
+) -> list[CategoriaRecord] | Response:
     """
-    Retorna uma lista paginada de categorias.
+    Retorna uma lista paginada de categorias, ou as categorias dos ``ids``.
     """
+    if cached := not_modified(request, response, db, "categorias"):
+        return cached
+    catalogo = catalogo_cache.obter(db)
+    if ids is not None:
+        return in_request_order(response, catalogo.categoria_por_id, parse_ids(ids))
     offset = (page - 1) * page_size
-    categorias = db.query(CategoriaModel).offset(offset).limit(page_size).all()
-    return categorias
+    return catalogo.categorias[offset : offset + page_size]
 
 
 @categoria_router.get(
@@ -51,9 +71,12 @@ def listar_categorias(
     status_code=200,
     response_model=CategoriaScherma,
 )
-async def show_categoria(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> CategoriaModel | None:
+def show_categoria(
+    id_: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_db)],
+) -> CategoriaRecord | Response:
     """
     Mostra uma categoria existente.
 
@@ -63,7 +86,12 @@ async def show_categoria(
     Returns:
     Categoria: A categoria existente com o ID informado.
     """
-    return db.query(CategoriaModel).filter(CategoriaModel.id == id_).first()
+    if cached := not_modified(request, response, db, "categorias"):
+        return cached
+    categoria = catalogo_cache.obter(db).categoria_por_id.get(id_)
+    if categoria is None:
+        raise HTTPException(status_code=404, detail="Categoria não encontrada.")
+    return categoria
 
 
 @categoria_router.post(
@@ -76,7 +104,7 @@ async def show_categoria(
     status_code=201,
     response_model=CategoriaScherma,
 )
-async def create_categoria(
+def create_categoria(
     categoria: CategoriaScherma, db: Annotated[Session, Depends(get_db)]
 ) -> CategoriaModel:
     """
@@ -90,6 +118,7 @@ async def create_categoria(
     """
     db_categoria = CategoriaModel(**categoria.model_dump())
     db.add(db_categoria)
+    bump_version(db, "categorias")
     db.commit()
     db.refresh(db_categoria)
     return db_categoria
@@ -105,11 +134,11 @@ async def create_categoria(
     status_code=200,
     response_model=CategoriaScherma,
 )
-async def update_categoria(
+def update_categoria(
     id_: int,
-    categoria: CategoriaScherma,
+    categoria: CategoriaUpdateScherma,
     db: Annotated[Session, Depends(get_db)],
-) -> CategoriaModel | None:
+) -> CategoriaScherma:
     """
     Atualiza uma categoria existente.
 
@@ -120,15 +149,16 @@ async def update_categoria(
     Returns:
     Categoria: A categoria atualizada.
     """
-    data = categoria.model_dump(exclude_unset=True)
-    stmt = (
-        update(CategoriaModel)
-        .where(CategoriaModel.id == id_)
-        .values({getattr(CategoriaModel, k): v for k, v in data.items()})
+    data = update_data(CategoriaModel, categoria)
+    db_categoria = update_returning(
+        db, CategoriaModel, id_, data, load_options(CategoriaModel, CategoriaScherma)
     )
-    db.execute(stmt)
+    if db_categoria is None:
+        raise HTTPException(status_code=404, detail="Categoria não encontrada.")
+    resposta = CategoriaScherma.model_validate(db_categoria, from_attributes=True)
+    bump_version(db, "categorias")
     db.commit()
-    return db.query(CategoriaModel).filter(CategoriaModel.id == id_).first()
+    return resposta
 
 
 @categoria_router.delete(
@@ -140,18 +170,54 @@ async def update_categoria(
     response_description="Categoria Delete",
     status_code=204,
 )
-async def delete_categoria(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> JSONResponse:
+def delete_categoria(id_: int, db: Annotated[Session, Depends(get_db)]) -> JSONResponse:
     """
     Deleta uma categoria existente.
 
+    Os produtos da categoria são removidos pelo ``ON DELETE CASCADE`` do banco;
+    se algum deles já constar em pedidos a exclusão é recusada com 409.
+
     Parameters:
     id (int): O ID da categoria a ser deletada.
 
     Returns:
     JSONResponse: Uma resposta JSON com o código de status 204.
     """
-    db.query(CategoriaModel).filter(CategoriaModel.id == id_).delete()
-    db.commit()
+    _excluir_categorias(db, [id_])
     return JSONResponse("Categoria removida com sucesso.", status_code=204)
+
+
+@categoria_router.delete(
+    "/categorias",
+    tags=[tag],
+    name="categoria_delete_lote",
+    summary="Categoria Delete em lote",
+    description="Categoria Delete em lote",
+    response_description="Categorias removidas",
+    status_code=200,
+    response_model=ExclusaoLoteScherma,
+)
+def delete_categorias(
+    db: Annotated[Session, Depends(get_db)],
+    ids: str = Query(..., description="IDs separados por vírgula."),
+) -> dict[str, list[int]]:
+    """Remove várias categorias (e seus produtos) com um único DELETE por lote."""
+    alvos = parse_ids(ids)
+    removidos = _excluir_categorias(db, alvos)
+    return {
+        "removidos": removidos,
+        "nao_encontrados": sorted(set(alvos) - set(removidos)),
+    }
+
+
+def _excluir_categorias(db: Session, ids: list[int]) -> list[int]:
+    try:
+        removidos = delete_ids(db, CategoriaModel, ids)
+        bump_version(db, "categorias", "produtos")
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Há produtos da categoria vinculados a pedidos."
+        ) from None
+    return removidos
@@ -0,0 +1,57 @@
+import asyncio
+import os
+import time
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from config.dependencies import get_db
+from config.threadpool import run_in_threadpool
+from src.events.outbox import fetch_changes
+from src.schermas.change_scherma import ChangeFeedScherma
+
+change_router = APIRouter()
+tag = "Changes"
+
+# Intervalo entre consultas enquanto um long-poll aguarda novas alterações.
+POLL_INTERVAL = float(os.getenv("CHANGES_POLL_INTERVAL", "0.5"))
+
+
+def _buscar(db: Session, since: int, limit: int) -> list[dict[str, Any]]:
+    changes = fetch_changes(db, since, limit)
+    if not changes:
+        # Encerra a transação de leitura para não segurar o banco durante a espera.
+        db.rollback()
+    return changes
+
+
+@change_router.get(
+    "/changes",
+    tags=[tag],
+    name="change_feed",
+    summary="Feed de alterações",
+    description="Alterações de pedidos e vendas com sequência maior que `since`.",
+    response_description="Lote de alterações e o próximo `since`.",
+    status_code=200,
+    response_model=ChangeFeedScherma,
+)
+async def change_feed(
+    db: Annotated[Session, Depends(get_db)],
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    timeout: float = Query(0, ge=0, le=30, description="Long-poll em segundos."),
+) -> dict:
+    """
+    Retorna as alterações posteriores a ``since``.
+
+    Com ``timeout`` > 0 a requisição aguarda até surgir alguma alteração ou o
+    tempo esgotar, evitando que consumidores varram as listagens completas.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        changes = await run_in_threadpool(_buscar, db, since, limit)
+        if changes or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(min(POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+    return {"changes": changes, "next": changes[-1]["seq"] if changes else since}
@@ -0,0 +1,194 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config.dependencies import get_db
+from config.queries import chunked
+from config.types import to_money
+from config.versioning import bump_version
+from src.events.outbox import model_payload, record_change
+from src.idempotency import cached_response, request_hash, store_response
+from src.models.cliente_model import ClienteModel
+from src.models.item_model import ItemModel
+from src.models.pedido_model import PedidoModel
+from src.models.produto_model import ProdutoModel
+from src.models.venda_model import VendaModel
+from src.routers.pedido_router import publish_pedido
+from src.schermas.checkout_scherma import CheckoutRespostaScherma, CheckoutScherma
+from src.schermas.pedido_scherma import PedidoScherma
+
+checkout_router = APIRouter()
+tag = "Checkout"
+
+
+def _precos(db: Session, ids: list[int]) -> dict[int, Decimal]:
+    """Preço atual de cada produto, sem carregar os relacionamentos do modelo."""
+    precos: dict[int, Decimal] = {}
+    for lote in chunked(ids):
+        linhas = db.execute(
+            select(ProdutoModel.id, ProdutoModel.preco_unidade).where(
+                ProdutoModel.id.in_(lote)
+            )
+        )
+        precos.update(linhas.tuples().all())
+    return precos
+
+
+def _baixar_estoque(db: Session, quantidades: dict[int, float]) -> dict[int, Decimal]:
+    """
+    Decrementa o estoque de cada produto e retorna o preço de cada um pelo id.
+
+    O ``UPDATE`` só afeta a linha se ainda houver estoque, então duas vendas
+    simultâneas do mesmo produto não deixam a quantidade negativa. Os ids vão
+    em ordem para que transações concorrentes travem as linhas na mesma ordem.
+
+    A baixa incrementa só a versão ``estoque``, que entra no ETag dos produtos
+    sem recarregar o snapshot do catálogo.
+    """
+    precos = _precos(db, list(quantidades))
+    faltando = sorted(set(quantidades) - set(precos))
+    if faltando:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Produtos não encontrados: {faltando}.",
+        )
+    for produto_id in sorted(quantidades):
+        quantidade = quantidades[produto_id]
+        baixado = db.execute(
+            update(ProdutoModel)
+            .where(
+                ProdutoModel.id == produto_id,
+                ProdutoModel.quantidade >= quantidade,
+            )
+            .values(quantidade=ProdutoModel.quantidade - quantidade),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+        if not baixado:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Estoque insuficiente para o produto {produto_id}.",
+            )
+    return precos
+
+
+@checkout_router.post(
+    "/checkout",
+    tags=[tag],
+    name="checkout",
+    summary="Checkout",
+    description=(
+        "Cria o pedido com seus itens, baixa o estoque e registra a venda em uma "
+        "única transação. O preço de cada item é o preço atual do produto."
+    ),
+    response_description="Pedido e venda criados.",
+    status_code=status.HTTP_201_CREATED,
+    response_model=CheckoutRespostaScherma,
+)
+def checkout(
+    dados: CheckoutScherma,
+    db: Annotated[Session, Depends(get_db)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
+) -> dict | JSONResponse:
+    """
+    Fecha uma venda de balcão com um único ``commit``.
+
+    Com o header ``Idempotency-Key`` uma nova tentativa com a mesma chave devolve
+    a resposta original sem baixar o estoque de novo.
+    """
+    if idempotency_key:
+        body_hash = request_hash(dados)
+        if cached := cached_response(db, idempotency_key, "checkout", body_hash):
+            return cached
+
+    cliente = select(ClienteModel.id).where(ClienteModel.id == dados.cliente_id)
+    if db.scalar(cliente) is None:
+        raise HTTPException(status_code=404, detail="Cliente não encontrado.")
+
+    quantidades: dict[int, float] = defaultdict(float)
+    for item in dados.itens:
+        quantidades[item.produto_id] += item.quantidade
+    precos = _baixar_estoque(db, quantidades)
+
+    itens = [
+        ItemModel(
+            produto_id=item.produto_id,
+            quantidade=item.quantidade,
+            preco_unitario=precos[item.produto_id],
+        )
+        for item in dados.itens
+    ]
+    pedido = PedidoModel(
+        cliente_id=dados.cliente_id,
+        quantidade=len(itens),
+        preco_total=to_money(
+            sum(
+                (i.preco_unitario * Decimal(str(i.quantidade)) for i in itens),
+                Decimal("0"),
+            )
+        ),
+        itens_pedido=itens,
+    )
+    venda = VendaModel(
+        pedido=pedido,
+        forma_pagamento=dados.forma_pagamento,
+        status_venda=dados.status_venda,
+    )
+    db.add(venda)
+    db.flush()
+
+    record_change(
+        db,
+        "pedido",
+        pedido.id,
+        "create",
+        {
+            **model_payload(pedido),
+            "itens_pedido": [model_payload(item) for item in itens],
+        },
+    )
+    record_change(db, "venda", venda.id, "create", model_payload(venda))
+
+    # Serializados antes do commit, que expira os atributos.
+    evento = PedidoScherma.model_validate(pedido, from_attributes=True)
+    resposta = CheckoutRespostaScherma(
+        pedido_id=pedido.id,
+        cliente_id=pedido.cliente_id,
+        quantidade=pedido.quantidade,
+        preco_total=pedido.preco_total,
+        itens=[model_payload(item) for item in itens],
+        venda={
+            "id": venda.id,
+            "forma_pagamento": venda.forma_pagamento,
+            "status_venda": venda.status_venda,
+        },
+    ).model_dump(mode="json")
+    if idempotency_key:
+        store_response(
+            db,
+            idempotency_key,
+            "checkout",
+            body_hash,
+            status.HTTP_201_CREATED,
+            resposta,
+        )
+    # Último comando antes do commit: a linha da versão fica travada só por ele.
+    bump_version(db, "estoque")
+    try:
+        db.commit()
+    except IntegrityError:
+        # Outra requisição com a mesma chave gravou primeiro.
+        db.rollback()
+        if idempotency_key and (
+            cached := cached_response(db, idempotency_key, "checkout", body_hash)
+        ):
+            return cached
+        raise
+
+    publish_pedido("pedido_created", resposta["pedido_id"], evento)
+    return resposta
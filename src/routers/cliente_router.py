@@ -1,16 +1,41 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from fastapi.responses import JSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
-from src.models.cliente_model import ClienteModel
-from src.schermas.cliente_scherma import ClienteScherma
+from config.projection import load_options
+from config.queries import (
+    delete_ids,
+    fetch_ids,
+    get_by_id,
+    in_request_order,
+    parse_ids,
+)
+from src.models.arquivo_model import ResumoArquivoClienteModel
+from src.models.cliente_model import (
+    ClienteModel,
+    normalizar_nome,
+    normalizar_telefone,
+)
+from src.models.pedido_model import PedidoModel
+from src.schermas.cliente_scherma import (
+    ClienteBuscaScherma,
+    ClientePedidosScherma,
+    ClienteScherma,
+    PedidoHistoricoScherma,
+)
+from src.schermas.exclusao_scherma import ExclusaoLoteScherma
 
 cliente_router = APIRouter()
 tag = "Cliente"
 
+# Montado uma vez: só offset e limit mudam entre as páginas.
+_LISTA = select(ClienteModel).order_by(ClienteModel.id)
+
 
 @cliente_router.get(
     "/clientes",
@@ -23,13 +48,19 @@ tag = "Cliente"
     response_model=list[ClienteScherma],
 )
 def listar_clientes(
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    ids: str | None = Query(
+        None, description="Ids separados por vírgula; ignora a paginação."
+    ),
 ) -> list[ClienteModel]:
+    if ids is not None:
+        ids_ = parse_ids(ids)
+        return in_request_order(response, fetch_ids(db, ClienteModel, ids_), ids_)
     offset = (page - 1) * page_size
-    clientes = db.query(ClienteModel).offset(offset).limit(page_size).all()
-    return clientes
+    return db.scalars(_LISTA.offset(offset).limit(page_size)).all()
 
 
 @cliente_router.post(
@@ -52,6 +83,43 @@ def criar_cliente(
     return novo_cliente
 
 
+@cliente_router.get(
+    "/clientes/lookup",
+    tags=[tag],
+    name="cliente_lookup",
+    summary="Buscar cliente",
+    description=(
+        "Busca clientes pelo telefone (apenas dígitos são comparados) ou pelo "
+        "início do nome, para autocompletar no caixa."
+    ),
+    response_description="Clientes encontrados.",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ClienteBuscaScherma],
+)
+def buscar_cliente(
+    db: Annotated[Session, Depends(get_db)],
+    telefone: str | None = Query(None, min_length=1, max_length=30),
+    nome: str | None = Query(None, min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+) -> list[ClienteModel]:
+    stmt = select(ClienteModel)
+    if telefone is not None:
+        stmt = stmt.where(
+            ClienteModel.telefone_digitos == normalizar_telefone(telefone)
+        )
+    elif nome is not None:
+        # Intervalo [prefixo, prefixo + U+FFFF) percorre o índice de nome_busca,
+        # o que LIKE 'prefixo%' não garante em todos os bancos.
+        prefixo = normalizar_nome(nome)
+        stmt = stmt.where(
+            ClienteModel.nome_busca >= prefixo,
+            ClienteModel.nome_busca < prefixo + "\uffff",
+        ).order_by(ClienteModel.nome_busca)
+    else:
+        raise HTTPException(status_code=400, detail="Informe telefone ou nome.")
+    return db.scalars(stmt.limit(limit)).all()
+
+
 @cliente_router.get(
     "/clientes/{id}",
     tags=[tag],
@@ -63,12 +131,71 @@ def criar_cliente(
     response_model=ClienteScherma,
 )
 def mostrar_cliente(id_: int, db: Annotated[Session, Depends(get_db)]) -> ClienteModel:
-    cliente = db.query(ClienteModel).filter(ClienteModel.id == id_).first()
+    cliente = get_by_id(db, ClienteModel, id_)
     if not cliente:
         raise HTTPException(status_code=404, detail="Cliente não encontrado.")
     return cliente
 
 
+@cliente_router.get(
+    "/clientes/{id}/pedidos",
+    tags=[tag],
+    name="cliente_pedidos",
+    summary="Histórico de pedidos do cliente",
+    description=(
+        "Pedidos do cliente do mais recente para o mais antigo, paginados por "
+        "cursor (`antes_de`), com o resumo de gastos."
+    ),
+    response_description="Resumo e página de pedidos do cliente.",
+    status_code=status.HTTP_200_OK,
+    response_model=ClientePedidosScherma,
+)
+def cliente_pedidos(
+    id_: Annotated[int, Path(alias="id")],
+    db: Annotated[Session, Depends(get_db)],
+    antes_de: int | None = Query(None, ge=1, description="Cursor: ID do pedido."),
+    limit: int = Query(20, ge=1, le=100),
+) -> dict:
+    if db.scalar(select(ClienteModel.id).where(ClienteModel.id == id_)) is None:
+        raise HTTPException(status_code=404, detail="Cliente não encontrado.")
+
+    # Agregação resolvida pelo índice (cliente_id, id, preco_total).
+    quantidade, total, ultimo = db.execute(
+        select(
+            func.count(PedidoModel.id),
+            func.coalesce(func.sum(PedidoModel.preco_total), 0),
+            func.max(PedidoModel.id),
+        ).where(PedidoModel.cliente_id == id_)
+    ).one()
+    # Pedidos já arquivados entram pelo resumo mantido pelo arquivamento.
+    if arquivado := db.get(ResumoArquivoClienteModel, id_):
+        quantidade += arquivado.quantidade_pedidos
+        total += arquivado.total_gasto
+        ultimo = max(ultimo or 0, arquivado.ultimo_pedido_id)
+
+    stmt = (
+        select(PedidoModel)
+        .options(*load_options(PedidoModel, PedidoHistoricoScherma))
+        .where(PedidoModel.cliente_id == id_)
+        .order_by(PedidoModel.id.desc())
+        .limit(limit + 1)
+    )
+    if antes_de is not None:
+        stmt = stmt.where(PedidoModel.id < antes_de)
+    pedidos = db.scalars(stmt).all()
+
+    proximo_cursor = pedidos[limit - 1].id if len(pedidos) > limit else None
+    return {
+        "resumo": {
+            "total_gasto": total,
+            "quantidade_pedidos": quantidade,
+            "ultimo_pedido_id": ultimo,
+        },
+        "pedidos": pedidos[:limit],
+        "proximo_cursor": proximo_cursor,
+    }
+
+
 @cliente_router.patch(
     "/clientes/{id}",
     tags=[tag],
@@ -84,7 +211,7 @@ def atualizar_cliente(
     cliente_data: ClienteScherma,
     db: Annotated[Session, Depends(get_db)],
 ) -> ClienteModel:
-    cliente = db.query(ClienteModel).filter(ClienteModel.id == id).first()
+    cliente = get_by_id(db, ClienteModel, id_)
     if not cliente:
         raise HTTPException(status_code=404, detail="Cliente não encontrado.")
     for key, value in cliente_data.model_dump(exclude_unset=True).items():
@@ -104,12 +231,45 @@ def atualizar_cliente(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 def deletar_cliente(id_: int, db: Annotated[Session, Depends(get_db)]) -> JSONResponse:
-    cliente = db.query(ClienteModel).filter(ClienteModel.id == id_).first()
-    if not cliente:
+    if not _excluir_clientes(db, [id_]):
         raise HTTPException(status_code=404, detail="Cliente não encontrado.")
-    db.delete(cliente)
-    db.commit()
     return JSONResponse(
         content={"message": "Cliente excluído com sucesso."},
         status_code=status.HTTP_204_NO_CONTENT,
     )
+
+
+@cliente_router.delete(
+    "/clientes",
+    tags=[tag],
+    name="cliente_destroy_lote",
+    summary="Excluir clientes em lote",
+    description="Remove vários clientes com um único DELETE por lote.",
+    response_description="Clientes excluídos.",
+    status_code=status.HTTP_200_OK,
+    response_model=ExclusaoLoteScherma,
+)
+def deletar_clientes(
+    db: Annotated[Session, Depends(get_db)],
+    ids: str = Query(..., description="IDs separados por vírgula."),
+) -> dict[str, list[int]]:
+    alvos = parse_ids(ids)
+    removidos = _excluir_clientes(db, alvos)
+    return {
+        "removidos": removidos,
+        "nao_encontrados": sorted(set(alvos) - set(removidos)),
+    }
+
+
+def _excluir_clientes(db: Session, ids: list[int]) -> list[int]:
+    # Clientes com pedidos são protegidos pelo ON DELETE RESTRICT.
+    try:
+        removidos = delete_ids(db, ClienteModel, ids)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Cliente com pedidos não pode ser excluído.",
+        ) from None
+    return removidos
@@ -0,0 +1,125 @@
+import tracemalloc
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from config.dependencies import exigir_admin
+from config.memoria import (
+    diff_alocacoes,
+    iniciar_tracemalloc,
+    marcar_referencia,
+    parar_tracemalloc,
+    resumo,
+)
+from config.statement_cache import estatisticas
+from config.threadpool import metricas
+
+diagnostico_router = APIRouter(dependencies=[Depends(exigir_admin)])
+tag = "Diagnóstico"
+
+
+@diagnostico_router.get(
+    "/diagnostico/pool",
+    tags=[tag],
+    name="diagnostico_pool",
+    summary="Ocupação dos pools",
+    description=(
+        "Vagas em uso e tarefas aguardando no thread pool deste worker, tempo de "
+        "espera do offload e conexões em uso no pool do banco."
+    ),
+    response_description="Métricas de saturação do worker.",
+    status_code=200,
+)
+async def diagnostico_pool() -> dict:
+    # async: as estatísticas do limitador pertencem ao event loop.
+    return metricas()
+
+
+@diagnostico_router.get(
+    "/diagnostico/sql",
+    tags=[tag],
+    name="diagnostico_sql",
+    summary="Cache de SQL compilado",
+    description=(
+        "Acertos e falhas do cache de SQL compilado do SQLAlchemy desde a subida "
+        "do worker e quantos comandos distintos ele guarda."
+    ),
+    response_description="Estatísticas do cache de comandos.",
+    status_code=200,
+)
+def diagnostico_sql() -> dict:
+    return estatisticas()
+
+
+@diagnostico_router.get(
+    "/diagnostico/memoria",
+    tags=[tag],
+    name="diagnostico_memoria",
+    summary="Memória do worker",
+    description=(
+        "RSS do processo, maiores alocações do tracemalloc (quando ativo) e "
+        "tamanho do identity map das sessões por rota."
+    ),
+    response_description="Resumo de memória do worker.",
+    status_code=200,
+)
+def diagnostico_memoria(top: int = Query(20, ge=1, le=200)) -> dict:
+    return resumo(top)
+
+
+@diagnostico_router.post(
+    "/diagnostico/memoria/tracemalloc",
+    tags=[tag],
+    name="diagnostico_tracemalloc",
+    summary="Liga ou desliga o tracemalloc",
+    description=(
+        "Começa a rastrear alocações guardando `frames` frames por alocação; "
+        "`frames=0` desliga. Rastrear deixa o worker mais lento."
+    ),
+    response_description="Estado do tracemalloc.",
+    status_code=200,
+)
+def diagnostico_tracemalloc(frames: int = Query(1, ge=0, le=50)) -> dict:
+    if frames:
+        iniciar_tracemalloc(frames)
+    else:
+        parar_tracemalloc()
+    return {"ativo": tracemalloc.is_tracing()}
+
+
+@diagnostico_router.post(
+    "/diagnostico/memoria/referencia",
+    tags=[tag],
+    name="diagnostico_referencia",
+    summary="Snapshot de referência",
+    description="Guarda o snapshot usado como base por `/diagnostico/memoria/diff`.",
+    response_description="Snapshot registrado.",
+    status_code=204,
+)
+def diagnostico_referencia() -> None:
+    if not tracemalloc.is_tracing():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="tracemalloc desligado."
+        )
+    marcar_referencia()
+
+
+@diagnostico_router.get(
+    "/diagnostico/memoria/diff",
+    tags=[tag],
+    name="diagnostico_diff",
+    summary="Crescimento desde a referência",
+    description=(
+        "Linhas de código cuja memória retida mais cresceu desde o último snapshot "
+        "de referência."
+    ),
+    response_description="Maiores diferenças de alocação.",
+    status_code=200,
+)
+def diagnostico_diff(top: int = Query(20, ge=1, le=200)) -> list[dict]:
+    diff = diff_alocacoes(top)
+    if diff is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Sem snapshot de referência.",
+        )
+    return diff
@@ -1,19 +1,74 @@
+import asyncio
+import os
+from datetime import datetime
+from decimal import Decimal
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
-from fastapi.responses import JSONResponse
-from sqlalchemy import update
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
+from config.filtros import Filtro, ListaFiltros, Listagem
+from config.projection import load_options, parse_fields, project
+from config.queries import (
+    delete_ids,
+    fetch_ids,
+    get_by_id,
+    in_request_order,
+    parse_ids,
+    soft_delete_ids,
+    update_data,
+    update_returning,
+)
+from config.threadpool import run_in_threadpool
+from config.types import to_money
+from src.events.broadcaster import OVERFLOW, broadcaster, format_sse
+from src.events.outbox import model_payload, record_change
+from src.idempotency import cached_response, request_hash, store_response
+from src.models.cliente_model import ClienteModel
 from src.models.item_model import ItemModel
 from src.models.pedido_model import PedidoModel
-from src.schermas.pedido_scherma import PedidoScherma
-from src.schermas.item_scherma import ItemScherma
+from src.models.produto_model import ProdutoModel
+from src.models.venda_model import VendaModel
+from src.schermas.exclusao_scherma import ExclusaoLoteScherma
+from src.schermas.pedido_detalhe_scherma import PedidoDetalheScherma
+from src.schermas.pedido_scherma import PedidoScherma, PedidoUpdateScherma
 
 pedido_router = APIRouter()
 tag = "Pedido"
 
+PEDIDO_FILTROS = ListaFiltros(
+    PedidoModel,
+    filtros={
+        "cliente_id": Filtro("cliente_id", int),
+        "criado_de": Filtro("criado_em", datetime, "ge", "Criados a partir de."),
+        "criado_ate": Filtro("criado_em", datetime, "lt", "Criados antes de."),
+    },
+    ordens={"criado_em": datetime},
+)
+
+# Intervalo de comentários enviados para manter a conexão SSE aberta em proxies.
+SSE_KEEPALIVE = float(os.getenv("SSE_KEEPALIVE", "15"))
+
+
+def publish_pedido(event: str, id_: int, pedido: PedidoModel | PedidoScherma) -> None:
+    """Envia o pedido (com seus itens) aos assinantes de ``/pedidos/stream``."""
+    data = PedidoScherma.model_validate(pedido, from_attributes=True)
+    broadcaster.publish(event, {"id": id_, **data.model_dump(mode="json")})
+
 
 @pedido_router.get(
     "/pedidos",
@@ -26,14 +81,79 @@ tag = "Pedido"
     response_model=list[PedidoScherma],
 )
 async def pedido_index(
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
+    listagem: Annotated[Listagem, Depends(PEDIDO_FILTROS.dependency)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-) -> list[PedidoModel]:
-    """Lista todos os pedidos cadastrados."""
-    offset = (page - 1) * page_size
-    receitas = db.query(PedidoModel).offset(offset).limit(page_size).all()
-    return receitas
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+    ids: str | None = Query(
+        None, description="Ids separados por vírgula; ignora a paginação."
+    ),
+) -> list[PedidoModel] | JSONResponse:
+    """Lista os pedidos cadastrados, por página ou pelos ``ids`` pedidos."""
+    selected = parse_fields(fields, PedidoScherma)
+    options = load_options(PedidoModel, PedidoScherma, selected)
+    if ids is not None:
+        ids_ = parse_ids(ids)
+        por_id = await run_in_threadpool(fetch_ids, db, PedidoModel, ids_, options)
+        pedidos = in_request_order(response, por_id, ids_)
+    else:
+        stmt = listagem.aplicar(select(PedidoModel).options(*options), page, page_size)
+        rows = await run_in_threadpool(lambda: db.scalars(stmt).all())
+        pedidos = listagem.pagina(response, rows, page_size)
+    if selected:
+        return JSONResponse(
+            [project(p, PedidoScherma, selected) for p in pedidos],
+            headers=response.headers,
+        )
+    return pedidos
+
+
+@pedido_router.get(
+    "/pedidos/stream",
+    tags=[tag],
+    name="pedido_stream",
+    summary="Pedido Stream",
+    description="Server-Sent Events com pedidos criados, atualizados e removidos.",
+    response_description="Fluxo text/event-stream",
+    status_code=200,
+    response_class=StreamingResponse,
+)
+async def pedido_stream(request: Request) -> StreamingResponse:
+    """
+    Mantém a conexão aberta e envia cada alteração de pedido após o commit.
+
+    Clientes lentos recebem o evento ``reset`` e são desconectados; devem então
+    recarregar ``/pedidos`` e reconectar.
+    """
+    subscription = broadcaster.subscribe()
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.get(), timeout=SSE_KEEPALIVE
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is not OVERFLOW and not message.event.startswith("pedido"):
+                    continue
+                yield format_sse(message)
+                if message is OVERFLOW:
+                    break
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @pedido_router.get(
@@ -46,9 +166,13 @@ async def pedido_index(
     status_code=200,
     response_model=PedidoScherma,
 )
-async def show_pedido(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> PedidoModel | None:
+def show_pedido(
+    id_: int,
+    db: Annotated[Session, Depends(get_db)],
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+) -> PedidoModel | JSONResponse:
     """
     Mostra um pedido existente.
 
@@ -58,7 +182,104 @@ async def show_pedido(
     Returns:
     Pedido: O pedido existente com o ID informado.
     """
-    return db.query(PedidoModel).filter(PedidoModel.id == id_).first()
+    selected = parse_fields(fields, PedidoScherma)
+    pedido = get_by_id(db, PedidoModel, id_, PedidoScherma, selected)
+    if pedido is None:
+        raise HTTPException(status_code=404, detail="Pedido não encontrado.")
+    if selected:
+        return JSONResponse(project(pedido, PedidoScherma, selected))
+    return pedido
+
+
+# Uma linha por item: os dados do pedido, do cliente e da venda se repetem.
+_DETALHE = (
+    select(
+        PedidoModel.id,
+        PedidoModel.quantidade,
+        PedidoModel.preco_total,
+        PedidoModel.criado_em,
+        ClienteModel.id.label("cliente_id"),
+        ClienteModel.nome,
+        ClienteModel.telefone,
+        ClienteModel.endereco,
+        ItemModel.id.label("item_id"),
+        ItemModel.produto_id,
+        ProdutoModel.nome_produto,
+        ProdutoModel.unidade,
+        ItemModel.quantidade.label("item_quantidade"),
+        ItemModel.preco_unitario,
+        VendaModel.id.label("venda_id"),
+        VendaModel.forma_pagamento,
+        VendaModel.status_venda,
+    )
+    .join(ClienteModel, ClienteModel.id == PedidoModel.cliente_id)
+    .outerjoin(ItemModel, ItemModel.pedido_id == PedidoModel.id)
+    .outerjoin(ProdutoModel, ProdutoModel.id == ItemModel.produto_id)
+    .outerjoin(VendaModel, VendaModel.pedido_id == PedidoModel.id)
+    .where(PedidoModel.id == bindparam("pedido_id"))
+    .order_by(ItemModel.id)
+)
+
+
+def _montar_detalhe(linhas: list) -> dict:
+    primeira = linhas[0]
+    return {
+        "id": primeira.id,
+        "quantidade": primeira.quantidade,
+        "preco_total": primeira.preco_total,
+        "criado_em": primeira.criado_em,
+        "cliente": {
+            "id": primeira.cliente_id,
+            "nome": primeira.nome,
+            "telefone": primeira.telefone,
+            "endereco": primeira.endereco,
+        },
+        "itens": [
+            {
+                "id": linha.item_id,
+                "produto_id": linha.produto_id,
+                "nome_produto": linha.nome_produto,
+                "unidade": linha.unidade,
+                "quantidade": linha.item_quantidade,
+                "preco_unitario": linha.preco_unitario,
+            }
+            for linha in linhas
+            if linha.item_id is not None
+        ],
+        "venda": (
+            {
+                "id": primeira.venda_id,
+                "forma_pagamento": primeira.forma_pagamento,
+                "status_venda": primeira.status_venda,
+            }
+            if primeira.venda_id is not None
+            else None
+        ),
+    }
+
+
+@pedido_router.get(
+    "/pedidos/{id}/detalhe",
+    tags=[tag],
+    name="pedido_detalhe",
+    summary="Pedido Detalhe",
+    description=(
+        "Pedido com cliente, itens (com nome e unidade do produto) e venda, "
+        "lidos em uma única consulta."
+    ),
+    response_description="Pedido detalhado.",
+    status_code=200,
+    response_model=PedidoDetalheScherma,
+)
+def pedido_detalhe(
+    id_: Annotated[int, Path(alias="id")],
+    db: Annotated[Session, Depends(get_db)],
+) -> dict:
+    """Monta a resposta das linhas do JOIN, sem carregar objetos ORM."""
+    linhas = db.execute(_DETALHE, {"pedido_id": id_}).all()
+    if not linhas:
+        raise HTTPException(status_code=404, detail="Pedido não encontrado.")
+    return _montar_detalhe(linhas)
 
 
 @pedido_router.post(
@@ -71,53 +292,98 @@ async def show_pedido(
     status_code=201,
     response_model=PedidoScherma,
 )
-async def create_pedido(
-    pedido: PedidoScherma, db: Annotated[Session, Depends(get_db)]
-) -> PedidoModel | None:
+def create_pedido(
+    pedido: PedidoScherma,
+    db: Annotated[Session, Depends(get_db)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
+) -> PedidoModel | JSONResponse | None:
     """
     Cria um novo pedido.
 
+    Com o header ``Idempotency-Key`` uma nova tentativa com a mesma chave devolve
+    a resposta original sem gravar outro pedido.
+
     Parameters:
     pedido (Pedido): O pedido a ser criado.
 
     Returns:
     Pedido: O pedido criado.
     """
+    if idempotency_key:
+        body_hash = request_hash(pedido)
+        if cached := cached_response(db, idempotency_key, "pedido_create", body_hash):
+            return cached
+
     model = {**pedido.model_dump()}
 
-    model["preco_total"] = sum(
-        item["preco_unitario"] * item["quantidade"] for item in model["itens_pedido"]
+    # Soma em Decimal: o preço unitário já chega com duas casas pelo schema.
+    model["preco_total"] = to_money(
+        sum(
+            (
+                item["preco_unitario"] * Decimal(str(item["quantidade"]))
+                for item in model["itens_pedido"]
+            ),
+            Decimal("0"),
+        )
     )
 
     model["quantidade"] = model["itens_pedido"].__len__()
 
+    itens = [
+        ItemModel(
+            produto_id=item["produto_id"],
+            quantidade=item["quantidade"],
+            preco_unitario=item["preco_unitario"],
+        )
+        for item in model["itens_pedido"]
+    ]
+
     db_pedido = PedidoModel(
         cliente_id=model["cliente_id"],
         preco_total=model["preco_total"],
         quantidade=model["quantidade"],
+        itens_pedido=itens,
     )
 
+    # Pedido, itens e outbox são gravados em uma única transação.
     db.add(db_pedido)
-    db.commit()
-    db.refresh(db_pedido)
-
-    for item in model["itens_pedido"]:
-        item_selecionado = ItemScherma(
-            pedido_id=db_pedido.id,
-            produto_id=item["produto_id"],
-            quantidade=item["quantidade"],
-            preco_unitario=item["preco_unitario"],
+    db.flush()
+    record_change(
+        db,
+        "pedido",
+        db_pedido.id,
+        "create",
+        {
+            **model_payload(db_pedido),
+            "itens_pedido": [model_payload(item) for item in itens],
+        },
+    )
+    if idempotency_key:
+        resposta = PedidoScherma.model_validate(db_pedido, from_attributes=True)
+        store_response(
+            db,
+            idempotency_key,
+            "pedido_create",
+            body_hash,
+            status.HTTP_201_CREATED,
+            resposta.model_dump(mode="json"),
         )
-
-        db_item = ItemModel(**item_selecionado.model_dump())
-        db.add(db_item)
+    try:
         db.commit()
-        db.refresh(db_item)
+    except IntegrityError:
+        # Outra requisição com a mesma chave gravou primeiro.
+        db.rollback()
+        if idempotency_key and (
+            cached := cached_response(db, idempotency_key, "pedido_create", body_hash)
+        ):
+            return cached
+        raise
 
-    pedido_model = db.query(PedidoModel).filter(PedidoModel.id == db_pedido.id).first()
+    pedido_model = get_by_id(db, PedidoModel, db_pedido.id)
 
     if pedido_model is None:
         return None
+    publish_pedido("pedido_created", pedido_model.id, pedido_model)
     return pedido_model
 
 
@@ -130,23 +396,68 @@ async def create_pedido(
     response_description="Pedido Delete",
     status_code=204,
 )
-async def delete_pedido(
-    id_: int, db: Annotated[Session, Depends(get_db)]
+def delete_pedido(
+    id_: int,
+    db: Annotated[Session, Depends(get_db)],
+    soft: bool = Query(False, description="Apenas marca o pedido como excluído."),
 ) -> JSONResponse:
     """
     Remove um pedido pelo seu ID.
 
+    Itens e venda são removidos pelo ``ON DELETE CASCADE`` do banco. Com
+    ``soft=true`` o pedido só recebe ``excluido_em`` e deixa de ser listado.
+
     Parameters:
     id (int): O ID do pedido a ser removido.
 
     Returns:
     JSONResponse: Uma resposta JSON com uma mensagem de sucesso e status code 204.
     """
-    db.query(PedidoModel).filter(PedidoModel.id == id_).delete()
-    db.commit()
+    _excluir_pedidos(db, [id_], soft)
     return JSONResponse("Pedido removido com sucesso.", status_code=status.HTTP_200_OK)
 
 
+@pedido_router.delete(
+    "/pedidos",
+    tags=[tag],
+    name="pedido_delete_lote",
+    summary="Pedido Delete em lote",
+    description="Pedido Delete em lote",
+    response_description="Pedidos removidos",
+    status_code=200,
+    response_model=ExclusaoLoteScherma,
+)
+def delete_pedidos(
+    db: Annotated[Session, Depends(get_db)],
+    ids: str = Query(..., description="IDs separados por vírgula."),
+    soft: bool = Query(False, description="Apenas marca os pedidos como excluídos."),
+) -> dict[str, list[int]]:
+    """Remove vários pedidos com um único comando por lote de ids."""
+    alvos = parse_ids(ids)
+    removidos = _excluir_pedidos(db, alvos, soft)
+    return {
+        "removidos": removidos,
+        "nao_encontrados": sorted(set(alvos) - set(removidos)),
+    }
+
+
+def _excluir_pedidos(db: Session, ids: list[int], soft: bool) -> list[int]:
+    if soft:
+        removidos = soft_delete_ids(db, PedidoModel, ids)
+        # Sem o pedido a venda não pode ser exibida: é excluída junto.
+        vendas = soft_delete_ids(db, VendaModel, removidos, VendaModel.pedido_id)
+        for venda_id in vendas:
+            record_change(db, "venda", venda_id, "delete", {"soft": soft})
+    else:
+        removidos = delete_ids(db, PedidoModel, ids)
+    for id_ in removidos:
+        record_change(db, "pedido", id_, "delete", {"soft": soft})
+    db.commit()
+    for id_ in removidos:
+        broadcaster.publish("pedido_deleted", {"id": id_})
+    return removidos
+
+
 @pedido_router.patch(
     "/pedidos/{id}",
     tags=[tag],
@@ -157,9 +468,11 @@ async def delete_pedido(
     status_code=200,
     response_model=PedidoScherma,
 )
-async def update_pedido(
-    id_: int, pedido: PedidoScherma, db: Annotated[Session, Depends(get_db)]
-) -> PedidoModel | None:
+def update_pedido(
+    id_: int,
+    pedido: PedidoUpdateScherma,
+    db: Annotated[Session, Depends(get_db)],
+) -> PedidoScherma:
     """
     Atualiza um pedido existente.
 
@@ -170,12 +483,16 @@ async def update_pedido(
     Returns:
     Pedido: O pedido atualizado.
     """
-    data = pedido.model_dump(exclude_unset=True)
-    stmt = (
-        update(PedidoModel)
-        .where(PedidoModel.id == id_)
-        .values({getattr(PedidoModel, k): v for k, v in data.items()})
+    data = update_data(PedidoModel, pedido)
+    db_pedido = update_returning(
+        db, PedidoModel, id_, data, load_options(PedidoModel, PedidoScherma)
     )
-    db.execute(stmt)
+    if db_pedido is None:
+        raise HTTPException(status_code=404, detail="Pedido não encontrado.")
+    resposta = PedidoScherma.model_validate(db_pedido, from_attributes=True)
+    if data:
+        record_change(db, "pedido", id_, "update", data)
     db.commit()
-    return db.query(PedidoModel).filter(PedidoModel.id == id_).first()
+    if data:
+        publish_pedido("pedido_updated", id_, resposta)
+    return resposta
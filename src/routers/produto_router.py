@@ -1,17 +1,55 @@
+from datetime import date, timedelta
+from decimal import Decimal
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import JSONResponse
-from sqlalchemy import update
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
+from config.filtros import Filtro, ListaFiltros, Listagem
+from config.projection import load_options, parse_fields, project
+from config.queries import (
+    delete_ids,
+    in_request_order,
+    parse_ids,
+    update_data,
+    update_returning,
+)
+from config.versioning import bump_version, not_modified
+from src.catalogo import (
+    ProdutoEstoqueRecord,
+    ProdutoRecord,
+    catalogo_cache,
+    com_estoque,
+)
 from src.models.produto_model import ProdutoModel
-from src.schermas.produto_scherma import ProdutoScherma
+from src.schermas.exclusao_scherma import ExclusaoLoteScherma
+from src.schermas.produto_scherma import (
+    ProdutoScherma,
+    ProdutosVencendoScherma,
+    ProdutoUpdateScherma,
+    ProdutoVencendoScherma,
+)
 
 produto_router = APIRouter()
 tag = "Produto"
 
+PRODUTO_FILTROS = ListaFiltros(
+    ProdutoModel,
+    filtros={
+        "categoria_id": Filtro("categoria_id", int),
+        "marca": Filtro("marca", str),
+        "preco_min": Filtro("preco_unidade", Decimal, "ge", "Preço mínimo."),
+        "preco_max": Filtro("preco_unidade", Decimal, "le", "Preço máximo."),
+    },
+    ordens={"preco_unidade": Decimal},
+)
+# O ETag dos produtos segue o cadastro e as baixas de estoque do checkout.
+_VERSOES = ("produtos", "estoque")
+
 
 @produto_router.get(
     "/produtos",
@@ -23,17 +61,116 @@ tag = "Produto"
     status_code=200,
     response_model=list[ProdutoScherma],
 )
-async def produto_index(
+def produto_index(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
+    listagem: Annotated[Listagem, Depends(PRODUTO_FILTROS.dependency)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-) -> list[ProdutoModel]:
-    """Lista todos os produtos cadastrados."""
-    offset = (page - 1) * page_size
-    produtos = db.query(ProdutoModel).offset(offset).limit(page_size).all()
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+    ids: str | None = Query(
+        None, description="Ids separados por vírgula; ignora a paginação."
+    ),
+) -> list[ProdutoEstoqueRecord] | list[ProdutoModel] | Response:
+    """
+    Lista os produtos cadastrados, por página ou pelos ``ids`` pedidos.
+
+    Sem filtros a página sai do snapshot, com o estoque lido do banco; com
+    filtros, ordem ou cursor a consulta vai ao banco, pelos índices declarados
+    em ``PRODUTO_FILTROS``.
+    """
+    selected = parse_fields(fields, ProdutoScherma)
+    if cached := not_modified(request, response, db, *_VERSOES):
+        return cached
+    if listagem.ativa:
+        stmt = listagem.aplicar(
+            select(ProdutoModel).options(
+                *load_options(ProdutoModel, ProdutoScherma, selected)
+            ),
+            page,
+            page_size,
+        )
+        rows = db.scalars(stmt).all()
+        produtos = listagem.pagina(response, rows, page_size)
+    else:
+        catalogo = catalogo_cache.obter(db)
+        if ids is not None:
+            por_id = catalogo.produto_por_id
+            registros = in_request_order(response, por_id, parse_ids(ids))
+        else:
+            offset = (page - 1) * page_size
+            registros = catalogo.produtos[offset : offset + page_size]
+        produtos = com_estoque(db, registros)
+    if selected:
+        return JSONResponse(
+            [project(p, ProdutoScherma, selected) for p in produtos],
+            headers=response.headers,
+        )
     return produtos
 
 
+@produto_router.get(
+    "/produtos/vencendo",
+    tags=[tag],
+    name="produto_vencendo",
+    summary="Produtos vencendo",
+    description=(
+        "Produtos com estoque que vencem nos próximos `dias` dias, ordenados pela "
+        "validade e paginados por cursor (`apos_data` + `apos_id`)."
+    ),
+    response_description="Página de produtos vencendo.",
+    status_code=200,
+    response_model=ProdutosVencendoScherma,
+)
+def produto_vencendo(
+    db: Annotated[Session, Depends(get_db)],
+    dias: int = Query(7, ge=0, le=365),
+    incluir_vencidos: bool = Query(
+        False, description="Inclui produtos já vencidos que ainda têm estoque."
+    ),
+    apos_data: Annotated[date | None, Query(description="Cursor: validade.")] = None,
+    apos_id: int | None = Query(None, ge=1, description="Cursor: ID do produto."),
+    limit: int = Query(100, ge=1, le=1000),
+) -> dict:
+    """
+    Consulta o banco (e não o snapshot) com uma faixa sobre o índice
+    ``ix_produtos_validade_quantidade``, que já filtra o estoque zerado.
+    """
+    hoje = date.today()
+    stmt = (
+        select(ProdutoModel)
+        .options(*load_options(ProdutoModel, ProdutoVencendoScherma))
+        .where(
+            ProdutoModel.data_validade <= hoje + timedelta(days=dias),
+            ProdutoModel.quantidade > 0,
+        )
+        .order_by(ProdutoModel.data_validade, ProdutoModel.id)
+        .limit(limit + 1)
+    )
+    if not incluir_vencidos:
+        stmt = stmt.where(ProdutoModel.data_validade >= hoje)
+    if apos_data is not None and apos_id is not None:
+        stmt = stmt.where(
+            or_(
+                ProdutoModel.data_validade > apos_data,
+                and_(
+                    ProdutoModel.data_validade == apos_data,
+                    ProdutoModel.id > apos_id,
+                ),
+            )
+        )
+    produtos = db.scalars(stmt).all()
+
+    proximo_cursor = None
+    if len(produtos) > limit:
+        ultimo = produtos[limit - 1]
+        proximo_cursor = {"data_validade": ultimo.data_validade, "id": ultimo.id}
+    return {"produtos": produtos[:limit], "proximo_cursor": proximo_cursor}
+
+
 @produto_router.get(
     "/produtos/{id}",
     tags=[tag],
@@ -44,9 +181,15 @@ async def produto_index(
     status_code=200,
     response_model=ProdutoScherma,
 )
-async def show_produto(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> ProdutoModel | None:
+def show_produto(
+    id_: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_db)],
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+) -> ProdutoEstoqueRecord | Response:
     """
     Mostra um produto existente.
 
@@ -56,7 +199,45 @@ async def show_produto(
     Returns:
     Produto: O produto existente com o ID informado.
     """
-    return db.query(ProdutoModel).filter(ProdutoModel.id == id_).first()
+    selected = parse_fields(fields, ProdutoScherma)
+    if cached := not_modified(request, response, db, *_VERSOES):
+        return cached
+    produto = _com_estoque(db, catalogo_cache.obter(db).produto_por_id.get(id_))
+    if selected:
+        return JSONResponse(
+            project(produto, ProdutoScherma, selected), headers=response.headers
+        )
+    return produto
+
+
+@produto_router.get(
+    "/produtos/codigo/{codigo_barras}",
+    tags=[tag],
+    name="produto_show_codigo",
+    summary="Produto por código de barras",
+    description="Produto por código de barras",
+    response_description="Produto por código de barras",
+    status_code=200,
+    response_model=ProdutoScherma,
+)
+def show_produto_codigo(
+    codigo_barras: str,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_db)],
+) -> ProdutoEstoqueRecord | Response:
+    """Busca um produto pelo código de barras lido no caixa."""
+    if cached := not_modified(request, response, db, *_VERSOES):
+        return cached
+    registro = catalogo_cache.obter(db).produto_por_codigo.get(codigo_barras)
+    return _com_estoque(db, registro)
+
+
+def _com_estoque(db: Session, registro: ProdutoRecord | None) -> ProdutoEstoqueRecord:
+    produtos = com_estoque(db, [registro]) if registro is not None else []
+    if not produtos:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    return produtos[0]
 
 
 @produto_router.post(
@@ -69,7 +250,7 @@ async def show_produto(
     status_code=201,
     response_model=ProdutoScherma,
 )
-async def create_produto(
+def create_produto(
     produto: ProdutoScherma, db: Annotated[Session, Depends(get_db)]
 ) -> ProdutoModel:
     """
@@ -96,6 +277,7 @@ async def create_produto(
     )
 
     db.add(db_produto)
+    bump_version(db, "produtos")
     db.commit()
     db.refresh(db_produto)
 
@@ -112,9 +294,11 @@ async def create_produto(
     status_code=200,
     response_model=ProdutoScherma,
 )
-async def update_produto(
-    id_: int, produto: ProdutoScherma, db: Annotated[Session, Depends(get_db)]
-) -> ProdutoModel | None:
+def update_produto(
+    id_: int,
+    produto: ProdutoUpdateScherma,
+    db: Annotated[Session, Depends(get_db)],
+) -> ProdutoScherma:
     """
     Atualiza um produto existente.
 
@@ -126,15 +310,16 @@ async def update_produto(
     Produto: O produto atualizado.
     """
 
-    data = produto.model_dump(exclude_unset=True)
-    stmt = (
-        update(ProdutoModel)
-        .where(ProdutoModel.id == id_)
-        .values({getattr(ProdutoModel, k): v for k, v in data.items()})
+    data = update_data(ProdutoModel, produto)
+    db_produto = update_returning(
+        db, ProdutoModel, id_, data, load_options(ProdutoModel, ProdutoScherma)
     )
-    db.execute(stmt)
+    if db_produto is None:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    resposta = ProdutoScherma.model_validate(db_produto, from_attributes=True)
+    bump_version(db, "produtos")
     db.commit()
-    return db.query(ProdutoModel).filter(ProdutoModel.id == id_).first()
+    return resposta
 
 
 @produto_router.delete(
@@ -146,9 +331,7 @@ async def update_produto(
     response_description="Produto Delete",
     status_code=204,
 )
-async def delete_produto(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> JSONResponse:
+def delete_produto(id_: int, db: Annotated[Session, Depends(get_db)]) -> JSONResponse:
     """
     Remove um produto pelo seu ID.
 
@@ -158,6 +341,41 @@ async def delete_produto(
     Returns:
     JSONResponse: Uma resposta JSON com uma mensagem de sucesso e status code 204.
     """
-    db.query(ProdutoModel).filter(ProdutoModel.id == id_).delete()
-    db.commit()
+    _excluir_produtos(db, [id_])
     return JSONResponse("Produto removido com sucesso.", status_code=204)
+
+
+@produto_router.delete(
+    "/produtos",
+    tags=[tag],
+    name="produto_delete_lote",
+    summary="Produto Delete em lote",
+    description="Produto Delete em lote",
+    response_description="Produtos removidos",
+    status_code=200,
+    response_model=ExclusaoLoteScherma,
+)
+def delete_produtos(
+    db: Annotated[Session, Depends(get_db)],
+    ids: str = Query(..., description="IDs separados por vírgula."),
+) -> dict[str, list[int]]:
+    """Remove vários produtos com um único DELETE por lote."""
+    alvos = parse_ids(ids)
+    removidos = _excluir_produtos(db, alvos)
+    return {
+        "removidos": removidos,
+        "nao_encontrados": sorted(set(alvos) - set(removidos)),
+    }
+
+
+def _excluir_produtos(db: Session, ids: list[int]) -> list[int]:
+    try:
+        removidos = delete_ids(db, ProdutoModel, ids)
+        bump_version(db, "produtos")
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="Produto vinculado a pedidos não pode ser removido."
+        ) from None
+    return removidos
@@ -1,17 +1,35 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.responses import JSONResponse
-from sqlalchemy import update
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
+from config.projection import load_options
+from config.queries import get_by_id, update_data, update_returning
+from config.versioning import bump_version, not_modified
 from src.models.receita_model import ReceitaModel
-from src.schermas.receita_scherma import ReceitaScherma
+from src.receitas import criar_receitas, serializar_receitas
+from src.schermas.receita_scherma import ReceitaScherma, ReceitaUpdateScherma
 
 receita_router = APIRouter()
 tag = "Receita"
 
+# Os ingredientes vêm de serializar_receitas, não do relacionamento.
+_OPCOES = load_options(ReceitaModel, ReceitaScherma)
+_LISTA = select(ReceitaModel).options(*_OPCOES).order_by(ReceitaModel.id)
+# Receitas aceitas por chamada de POST /receitas/lote.
+LOTE_MAXIMO = 1000
+
 
 @receita_router.get(
     "/receitas",
@@ -24,16 +42,20 @@ tag = "Receita"
     response_model=list[ReceitaScherma],
 )
 def listar_receitas(
+    request: Request,
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-) -> list[ReceitaModel]:
+) -> list[dict] | Response:
     """
     Retorna uma lista paginada de receitas.
     """
+    if cached := not_modified(request, response, db, "receitas"):
+        return cached
     offset = (page - 1) * page_size
-    receitas = db.query(ReceitaModel).offset(offset).limit(page_size).all()
-    return receitas
+    receitas = db.scalars(_LISTA.offset(offset).limit(page_size)).all()
+    return serializar_receitas(db, receitas)
 
 
 @receita_router.post(
@@ -46,23 +68,50 @@ def listar_receitas(
     status_code=201,
     response_model=ReceitaScherma,
 )
-async def create_receita(
+def create_receita(
     receita: ReceitaScherma, db: Annotated[Session, Depends(get_db)]
-) -> ReceitaModel:
+) -> dict:
     """
     Cria uma nova receita.
 
+    Ingredientes ainda não cadastrados são criados pelo nome.
+
     Parameters:
     receita (Receita): Receita a ser criada.
 
     Returns:
     Receita: A nova receita criada.
     """
-    db_receita = ReceitaModel(**receita.model_dump())
-    db.add(db_receita)
+    [resposta] = serializar_receitas(db, criar_receitas(db, [receita]))
+    bump_version(db, "receitas")
+    db.commit()
+    return resposta
+
+
+@receita_router.post(
+    "/receitas/lote",
+    tags=[tag],
+    name="receita_create_lote",
+    summary="Importar receitas",
+    description=(
+        "Cria várias receitas em uma transação, resolvendo os ingredientes de "
+        "todas elas de uma vez."
+    ),
+    response_description="Receitas criadas, na ordem enviada.",
+    status_code=201,
+    response_model=list[ReceitaScherma],
+)
+def create_receitas_lote(
+    receitas: Annotated[
+        list[ReceitaScherma], Body(min_length=1, max_length=LOTE_MAXIMO)
+    ],
+    db: Annotated[Session, Depends(get_db)],
+) -> list[dict]:
+    """Importa um livro de receitas com um único ``commit``."""
+    resposta = serializar_receitas(db, criar_receitas(db, receitas))
+    bump_version(db, "receitas")
     db.commit()
-    db.refresh(db_receita)
-    return db_receita
+    return resposta
 
 
 @receita_router.get(
@@ -75,9 +124,12 @@ async def create_receita(
     status_code=200,
     response_model=ReceitaScherma,
 )
-async def show_receita(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> ReceitaModel | None:
+def show_receita(
+    id_: int,
+    request: Request,
+    response: Response,
+    db: Annotated[Session, Depends(get_db)],
+) -> dict | Response:
     """
     Mostra uma receita existente.
 
@@ -87,7 +139,12 @@ async def show_receita(
     Returns:
     Receita: A receita existente com o ID informado.
     """
-    return db.query(ReceitaModel).filter(ReceitaModel.id == id_).first()
+    if cached := not_modified(request, response, db, "receitas"):
+        return cached
+    receita = get_by_id(db, ReceitaModel, id_, ReceitaScherma)
+    if receita is None:
+        raise HTTPException(status_code=404, detail="Receita não encontrada.")
+    return serializar_receitas(db, [receita])[0]
 
 
 @receita_router.patch(
@@ -100,9 +157,11 @@ async def show_receita(
     status_code=200,
     response_model=ReceitaScherma,
 )
-async def update_receita(
-    id_: int, receita: ReceitaScherma, db: Annotated[Session, Depends(get_db)]
-) -> ReceitaModel | None:
+def update_receita(
+    id_: int,
+    receita: ReceitaUpdateScherma,
+    db: Annotated[Session, Depends(get_db)],
+) -> dict:
     """
     Atualiza uma receita existente.
 
@@ -113,15 +172,14 @@ async def update_receita(
     Returns:
     Receita: A receita atualizada.
     """
-    data = receita.model_dump(exclude_unset=True)
-    stmt = (
-        update(ReceitaModel)
-        .where(ReceitaModel.id == id_)
-        .values({getattr(ReceitaModel, k): v for k, v in data.items()})
-    )
-    db.execute(stmt)
+    data = update_data(ReceitaModel, receita)
+    db_receita = update_returning(db, ReceitaModel, id_, data, _OPCOES)
+    if db_receita is None:
+        raise HTTPException(status_code=404, detail="Receita não encontrada.")
+    [resposta] = serializar_receitas(db, [db_receita])
+    bump_version(db, "receitas")
     db.commit()
-    return db.query(ReceitaModel).filter(ReceitaModel.id == id_).first()
+    return resposta
 
 
 @receita_router.delete(
@@ -133,9 +191,7 @@ async def update_receita(
     response_description="Receita Delete",
     status_code=204,
 )
-async def delete_receita(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> JSONResponse:
+def delete_receita(id_: int, db: Annotated[Session, Depends(get_db)]) -> JSONResponse:
     """
     Remove uma receita pelo seu ID.
 
@@ -146,5 +202,6 @@ async def delete_receita(
     JSONResponse: Uma resposta JSON com uma mensagem de sucesso e status code 204.
     """
     db.query(ReceitaModel).filter(ReceitaModel.id == id_).delete()
+    bump_version(db, "receitas")
     db.commit()
     return JSONResponse("Receita removida com sucesso.", status_code=204)
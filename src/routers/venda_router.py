@@ -1,17 +1,46 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from fastapi.responses import JSONResponse
-from sqlalchemy import update
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.dependencies import get_db
+from config.filtros import Filtro, ListaFiltros, Listagem
+from config.projection import load_options, parse_fields, project
+from config.queries import (
+    delete_ids,
+    get_by_id,
+    parse_ids,
+    soft_delete_ids,
+    update_data,
+    update_returning,
+)
+from config.threadpool import run_in_threadpool
+from src.events.outbox import model_payload, record_change
+from src.idempotency import cached_response, request_hash, store_response
+from src.models.pedido_model import PedidoModel
 from src.models.venda_model import VendaModel
-from src.schermas.venda_scherma import VendaScherma
+from src.schermas.exclusao_scherma import ExclusaoLoteScherma
+from src.schermas.venda_scherma import (
+    VendaCreateScherma,
+    VendaScherma,
+    VendaUpdateScherma,
+)
 
 venda_router = APIRouter()
 tag = "Venda"
 
+VENDA_FILTROS = ListaFiltros(
+    VendaModel,
+    filtros={
+        "status_venda": Filtro("status_venda", str),
+        "forma_pagamento": Filtro("forma_pagamento", str),
+    },
+    ordens={},
+)
+
 
 @venda_router.get(
     "/vendas",
@@ -24,13 +53,30 @@ tag = "Venda"
     response_model=list[VendaScherma],
 )
 async def venda_index(
+    response: Response,
     db: Annotated[Session, Depends(get_db)],
+    listagem: Annotated[Listagem, Depends(VENDA_FILTROS.dependency)],
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-) -> list[VendaModel]:
-    """Lista todas as vendas cadastradas."""
-    offset = (page - 1) * page_size
-    return db.query(VendaModel).offset(offset).limit(page_size).all()
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+) -> list[VendaModel] | JSONResponse:
+    """Lista as vendas cadastradas, com os filtros de ``VENDA_FILTROS``."""
+    selected = parse_fields(fields, VendaScherma)
+    stmt = listagem.aplicar(
+        select(VendaModel).options(*load_options(VendaModel, VendaScherma, selected)),
+        page,
+        page_size,
+    )
+    rows = await run_in_threadpool(lambda: db.scalars(stmt).all())
+    vendas = listagem.pagina(response, rows, page_size)
+    if selected:
+        return JSONResponse(
+            [project(v, VendaScherma, selected) for v in vendas],
+            headers=response.headers,
+        )
+    return vendas
 
 
 @venda_router.get(
@@ -43,9 +89,13 @@ async def venda_index(
     status_code=200,
     response_model=VendaScherma,
 )
-async def show_venda(
-    id_: int, db: Annotated[Session, Depends(get_db)]
-) -> VendaModel | None:
+def show_venda(
+    id_: int,
+    db: Annotated[Session, Depends(get_db)],
+    fields: str | None = Query(
+        None, description="Campos a retornar, separados por vírgula."
+    ),
+) -> VendaModel | JSONResponse:
     """
     Mostra uma venda existente.
 
@@ -55,7 +105,13 @@ async def show_venda(
     Returns:
     Venda: A venda existente com o ID informado.
     """
-    return db.query(VendaModel).filter(VendaModel.id == id_).first()
+    selected = parse_fields(fields, VendaScherma)
+    venda = get_by_id(db, VendaModel, id_, VendaScherma, selected)
+    if venda is None:
+        raise HTTPException(status_code=404, detail="Venda não encontrada.")
+    if selected:
+        return JSONResponse(project(venda, VendaScherma, selected))
+    return venda
 
 
 @venda_router.post(
@@ -68,21 +124,57 @@ async def show_venda(
     status_code=201,
     response_model=VendaScherma,
 )
-async def create_venda(
-    venda: VendaScherma, db: Annotated[Session, Depends(get_db)]
-) -> VendaModel:
+def create_venda(
+    venda: VendaCreateScherma,
+    db: Annotated[Session, Depends(get_db)],
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
+) -> VendaModel | JSONResponse:
     """
     Cria uma nova venda.
 
+    Com o header ``Idempotency-Key`` uma nova tentativa com a mesma chave devolve
+    a resposta original sem gravar outra venda.
+
     Parameters:
     venda (Venda): A venda a ser criada.
 
     Returns:
     Venda: A venda criada.
     """
+    if idempotency_key:
+        body_hash = request_hash(venda)
+        if cached := cached_response(db, idempotency_key, "venda_create", body_hash):
+            return cached
+
+    if db.get(PedidoModel, venda.pedido_id) is None:
+        raise HTTPException(status_code=404, detail="Pedido não encontrado.")
     db_venda = VendaModel(**venda.model_dump())
-    db.add(db_venda)
-    db.commit()
+    try:
+        # pedido_id é único: o flush já detecta a venda gravada por outra
+        # requisição com a mesma chave.
+        db.add(db_venda)
+        db.flush()
+        record_change(db, "venda", db_venda.id, "create", model_payload(db_venda))
+        if idempotency_key:
+            resposta = VendaScherma.model_validate(db_venda, from_attributes=True)
+            store_response(
+                db,
+                idempotency_key,
+                "venda_create",
+                body_hash,
+                status.HTTP_201_CREATED,
+                resposta.model_dump(mode="json"),
+            )
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        if idempotency_key and (
+            cached := cached_response(db, idempotency_key, "venda_create", body_hash)
+        ):
+            return cached
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Pedido já possui venda."
+        ) from None
     db.refresh(db_venda)
     return db_venda
 
@@ -97,9 +189,11 @@ async def create_venda(
     status_code=200,
     response_model=VendaScherma,
 )
-async def update_venda(
-    id_: int, venda: VendaScherma, db: Annotated[Session, Depends(get_db)]
-) -> VendaModel | None:
+def update_venda(
+    id_: int,
+    venda: VendaUpdateScherma,
+    db: Annotated[Session, Depends(get_db)],
+) -> VendaScherma:
     """
     Atualiza uma venda existente.
 
@@ -110,15 +204,17 @@ async def update_venda(
     Returns:
     Venda: A venda atualizada.
     """
-    data = venda.model_dump(exclude_unset=True)
-    stmt = (
-        update(VendaModel)
-        .where(VendaModel.id == id_)
-        .values({getattr(VendaModel, k): v for k, v in data.items()})
+    data = update_data(VendaModel, venda)
+    db_venda = update_returning(
+        db, VendaModel, id_, data, load_options(VendaModel, VendaScherma)
     )
-    db.execute(stmt)
+    if db_venda is None:
+        raise HTTPException(status_code=404, detail="Venda não encontrada.")
+    resposta = VendaScherma.model_validate(db_venda, from_attributes=True)
+    if data:
+        record_change(db, "venda", id_, "update", data)
     db.commit()
-    return db.query(VendaModel).filter(VendaModel.id == id_).first()
+    return resposta
 
 
 @venda_router.delete(
@@ -130,18 +226,56 @@ async def update_venda(
     response_description="Venda Delete",
     status_code=204,
 )
-async def delete_venda(
-    id_: int, db: Annotated[Session, Depends(get_db)]
+def delete_venda(
+    id_: int,
+    db: Annotated[Session, Depends(get_db)],
+    soft: bool = Query(False, description="Apenas marca a venda como excluída."),
 ) -> JSONResponse:
     """
     Remove uma venda pelo seu ID.
 
+    Com ``soft=true`` a venda só recebe ``excluido_em`` e deixa de ser listada.
+
     Parameters:
     id (int): O ID da venda a ser removida.
 
     Returns:
     JSONResponse: Uma resposta JSON com uma mensagem de sucesso e status code 204.
     """
-    db.query(VendaModel).filter(VendaModel.id == id_).delete()
-    db.commit()
+    _excluir_vendas(db, [id_], soft)
     return JSONResponse("Venda removida com sucesso.", status_code=204)
+
+
+@venda_router.delete(
+    "/vendas",
+    tags=[tag],
+    name="venda_delete_lote",
+    summary="Venda Delete em lote",
+    description="Venda Delete em lote",
+    response_description="Vendas removidas",
+    status_code=200,
+    response_model=ExclusaoLoteScherma,
+)
+def delete_vendas(
+    db: Annotated[Session, Depends(get_db)],
+    ids: str = Query(..., description="IDs separados por vírgula."),
+    soft: bool = Query(False, description="Apenas marca as vendas como excluídas."),
+) -> dict[str, list[int]]:
+    """Remove várias vendas com um único comando por lote de ids."""
+    alvos = parse_ids(ids)
+    removidos = _excluir_vendas(db, alvos, soft)
+    return {
+        "removidos": removidos,
+        "nao_encontrados": sorted(set(alvos) - set(removidos)),
+    }
+
+
+def _excluir_vendas(db: Session, ids: list[int], soft: bool) -> list[int]:
+    if soft:
+        removidos = soft_delete_ids(db, VendaModel, ids)
+    else:
+        removidos = delete_ids(db, VendaModel, ids)
+    for id_ in removidos:
+        record_change(db, "venda", id_, "delete", {"soft": soft})
+    db.commit()
+    return removidos
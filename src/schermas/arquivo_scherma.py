@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from .money import Money
+
+
+class ItemArquivoScherma(BaseModel):
+    id: int
+    produto_id: int
+    quantidade: float
+    preco_unitario: Money
+
+
+class VendaArquivoScherma(BaseModel):
+    id: int
+    forma_pagamento: str
+    status_venda: str
+
+
+class PedidoArquivoScherma(BaseModel):
+    id: int
+    cliente_id: int
+    quantidade: int
+    preco_total: Money
+    criado_em: datetime
+    arquivado_em: datetime
+    itens_pedido: list[ItemArquivoScherma]
+    venda: VendaArquivoScherma | None
+
+
+class PedidosArquivoScherma(BaseModel):
+    pedidos: list[PedidoArquivoScherma]
+    proximo_cursor: int | None
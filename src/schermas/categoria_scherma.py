@@ -8,7 +8,12 @@ class CategoriaScherma(BaseModel):
     Args:
        Scherma BaseModel (_type_): _description_
     """
+
     categoria: str
 
     class ConfigDict:
         from_attributes = True
+
+
+class CategoriaUpdateScherma(BaseModel):
+    categoria: str | None = None
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ChangeScherma(BaseModel):
+    seq: int
+    entidade: str
+    entidade_id: int
+    operacao: str
+    payload: dict[str, Any]
+    criado_em: datetime
+
+
+class ChangeFeedScherma(BaseModel):
+    changes: list[ChangeScherma]
+    next: int
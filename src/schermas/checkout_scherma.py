@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+from .money import Money
+from .pedido_detalhe_scherma import VendaResumoScherma
+
+
+class CheckoutItemScherma(BaseModel):
+    produto_id: int
+    quantidade: float = Field(gt=0)
+
+
+class CheckoutScherma(BaseModel):
+    cliente_id: int
+    itens: list[CheckoutItemScherma] = Field(min_length=1)
+    forma_pagamento: str = Field(max_length=50)
+    status_venda: str = Field(max_length=50)
+
+
+class CheckoutItemRespostaScherma(BaseModel):
+    produto_id: int
+    quantidade: float
+    preco_unitario: Money
+
+
+class CheckoutRespostaScherma(BaseModel):
+    pedido_id: int
+    cliente_id: int
+    quantidade: int
+    preco_total: Money
+    itens: list[CheckoutItemRespostaScherma]
+    venda: VendaResumoScherma
@@ -1,5 +1,8 @@
 from pydantic import BaseModel
 
+from .money import Money
+from .pedido_scherma import PedidoScherma
+
 
 class ClienteScherma(BaseModel):
     nome: str
@@ -8,3 +11,24 @@ class ClienteScherma(BaseModel):
 
     class ConfigDict:
         from_attributes = True
+
+
+class ClienteBuscaScherma(ClienteScherma):
+    id: int
+
+
+class PedidoHistoricoScherma(PedidoScherma):
+    id: int
+    quantidade: int
+
+
+class ClienteResumoScherma(BaseModel):
+    total_gasto: Money
+    quantidade_pedidos: int
+    ultimo_pedido_id: int | None
+
+
+class ClientePedidosScherma(BaseModel):
+    resumo: ClienteResumoScherma
+    pedidos: list[PedidoHistoricoScherma]
+    proximo_cursor: int | None
@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class ExclusaoLoteScherma(BaseModel):
+    removidos: list[int]
+    nao_encontrados: list[int]
@@ -1,11 +1,13 @@
 from pydantic import BaseModel
 
+from .money import Money
+
 
 class ItemScherma(BaseModel):
     produto_id: int
     pedido_id: int
     quantidade: float
-    preco_unitario: float
+    preco_unitario: Money
 
     class ConfigDict:
         from_attributes = True
@@ -0,0 +1,13 @@
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import AfterValidator, PlainSerializer
+
+from config.types import to_money
+
+# Decimal com duas casas; no JSON continua sendo número, como antes.
+Money = Annotated[
+    Decimal,
+    AfterValidator(to_money),
+    PlainSerializer(float, return_type=float, when_used="json"),
+]
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from .cliente_scherma import ClienteBuscaScherma
+from .money import Money
+
+
+class ItemDetalheScherma(BaseModel):
+    id: int
+    produto_id: int
+    nome_produto: str
+    unidade: str
+    quantidade: float
+    preco_unitario: Money
+
+
+class VendaResumoScherma(BaseModel):
+    id: int
+    forma_pagamento: str
+    status_venda: str
+
+
+class PedidoDetalheScherma(BaseModel):
+    id: int
+    quantidade: int
+    preco_total: Money
+    criado_em: datetime
+    cliente: ClienteBuscaScherma
+    itens: list[ItemDetalheScherma]
+    venda: VendaResumoScherma | None
@@ -1,11 +1,18 @@
 from pydantic import BaseModel
+
 from .item_scherma import ItemScherma
+from .money import Money
 
 
 class PedidoScherma(BaseModel):
     cliente_id: int
     itens_pedido: list[ItemScherma]
-    preco_total: float
+    preco_total: Money
 
     class ConfigDictDict:
         from_attributes = True
+
+
+class PedidoUpdateScherma(BaseModel):
+    cliente_id: int | None = None
+    preco_total: Money | None = None
@@ -1,5 +1,9 @@
+from datetime import date
+
 from pydantic import BaseModel
 
+from .money import Money
+
 
 class ProdutoScherma(BaseModel):
     """
@@ -10,10 +14,10 @@ class ProdutoScherma(BaseModel):
     """
 
     nome_produto: str
-    data_validade: str
+    data_validade: date | None
     marca: str
     codigo_barras: str
-    preco_unidade: float
+    preco_unidade: Money
     unidade: str
     quantidade: float
     categoria_id: int
@@ -21,3 +25,27 @@ class ProdutoScherma(BaseModel):
     class ConfigDict:
         from_attributes = True
 
+
+class ProdutoUpdateScherma(BaseModel):
+    nome_produto: str | None = None
+    data_validade: date | None = None
+    marca: str | None = None
+    codigo_barras: str | None = None
+    preco_unidade: Money | None = None
+    unidade: str | None = None
+    quantidade: float | None = None
+    categoria_id: int | None = None
+
+
+class ProdutoVencendoScherma(ProdutoScherma):
+    id: int
+
+
+class CursorValidadeScherma(BaseModel):
+    data_validade: date
+    id: int
+
+
+class ProdutosVencendoScherma(BaseModel):
+    produtos: list[ProdutoVencendoScherma]
+    proximo_cursor: CursorValidadeScherma | None
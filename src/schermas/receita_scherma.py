@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from typing import Self
+
+from pydantic import BaseModel, model_validator
+
+from .money import Money
 
 
 class ReceitaScherma(BaseModel):
@@ -14,13 +18,31 @@ class ReceitaScherma(BaseModel):
     quantidade: list[float]
     modo_preparo: str
     margem_lucro: float
-    preco_sugerido: float
-    preco_venda: float
-    custo_porcao: float
-    custo_total: float
-    lucro_sugerido: float
+    preco_sugerido: Money
+    preco_venda: Money
+    custo_porcao: Money
+    custo_total: Money
+    lucro_sugerido: Money
+
+    @model_validator(mode="after")
+    def _uma_quantidade_por_ingrediente(self) -> Self:
+        if len(self.ingrediente) != len(self.quantidade):
+            raise ValueError("Informe uma quantidade para cada ingrediente.")
+        return self
 
     class ConfigDict:
         """_summary_"""
 
         from_attributes = True
+
+
+class ReceitaUpdateScherma(BaseModel):
+    nome_receita: str | None = None
+    porcao_rendimento: str | None = None
+    modo_preparo: str | None = None
+    margem_lucro: float | None = None
+    preco_sugerido: Money | None = None
+    preco_venda: Money | None = None
+    custo_porcao: Money | None = None
+    custo_total: Money | None = None
+    lucro_sugerido: Money | None = None
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
 from .pedido_scherma import PedidoScherma
 
+
 class VendaScherma(BaseModel):
     pedido: PedidoScherma
     forma_pagamento: str
@@ -8,3 +10,14 @@ class VendaScherma(BaseModel):
 
     class ConfigDictDict:
         from_attributes = True
+
+
+class VendaCreateScherma(BaseModel):
+    pedido_id: int
+    forma_pagamento: str = Field(max_length=50)
+    status_venda: str = Field(max_length=50)
+
+
+class VendaUpdateScherma(BaseModel):
+    forma_pagamento: str | None = None
+    status_venda: str | None = None
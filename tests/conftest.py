@@ -0,0 +1,52 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from config import dependencies
+from config.database import SessionLocal
+from config.versioning import bump_version
+from src.models.categoria_model import CategoriaModel
+from src.models.cliente_model import ClienteModel
+from src.models.produto_model import ProdutoModel
+
+
+@pytest.fixture
+def admin_headers(monkeypatch) -> dict[str, str]:
+    """Configura o ``ADMIN_TOKEN`` e retorna o header que libera /diagnostico."""
+    monkeypatch.setattr(dependencies, "ADMIN_TOKEN", "token-de-teste")
+    return {"X-Admin-Token": "token-de-teste"}
+
+
+@pytest.fixture
+def cliente_id() -> int:
+    """Cliente novo, exigido pela FK de pedidos."""
+    with SessionLocal() as db:
+        cliente = ClienteModel(nome="Teste", telefone="11900000000", endereco="Rua")
+        db.add(cliente)
+        db.commit()
+        return cliente.id
+
+
+@pytest.fixture
+def produto_id() -> int:
+    """Produto novo (com sua categoria), exigido pela FK de itens_pedido."""
+    with SessionLocal() as db:
+        categoria = CategoriaModel(categoria="Teste")
+        db.add(categoria)
+        db.flush()
+        produto = ProdutoModel(
+            nome_produto="Brigadeiro",
+            data_validade=date(2030, 1, 1),
+            marca="Casa",
+            codigo_barras=uuid.uuid4().hex,
+            preco_unidade=Decimal("2.50"),
+            unidade="un",
+            quantidade=100,
+            categoria_id=categoria.id,
+        )
+        db.add(produto)
+        bump_version(db, "categorias", "produtos")
+        db.commit()
+        return produto.id
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, update
+
+from config.database import SessionLocal
+from src.arquivamento import arquivar_pedidos
+from src.main import app
+from src.models.pedido_model import PedidoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def _pedido_vendido(
+    cliente_id: int, produto_id: int, criado_em: datetime, status: str = "pago"
+) -> int:
+    item = {
+        "produto_id": produto_id,
+        "pedido_id": 0,
+        "quantidade": 2,
+        "preco_unitario": 1.25,
+    }
+    client.post(
+        "/pedidos",
+        json={"cliente_id": cliente_id, "itens_pedido": [item], "preco_total": 0},
+    )
+    with SessionLocal() as db:
+        pedido_id = db.scalar(
+            select(func.max(PedidoModel.id)).where(PedidoModel.cliente_id == cliente_id)
+        )
+        db.execute(
+            update(PedidoModel)
+            .where(PedidoModel.id == pedido_id)
+            .values(criado_em=criado_em)
+        )
+        db.add(
+            VendaModel(pedido_id=pedido_id, forma_pagamento="pix", status_venda=status)
+        )
+        db.commit()
+    return pedido_id
+
+
+def test_arquiva_pedidos_antigos_e_mantem_resumo(cliente_id, produto_id):
+    antigo = _pedido_vendido(cliente_id, produto_id, datetime(2020, 1, 1))
+    recente = _pedido_vendido(cliente_id, produto_id, datetime.now())
+    url = f"/clientes/{cliente_id}/pedidos"
+    resumo_antes = client.get(url).json()["resumo"]
+
+    with SessionLocal() as db:
+        assert arquivar_pedidos(db, dias=365, lote=1) >= 1
+        assert db.get(PedidoModel, antigo) is None
+        assert db.get(PedidoModel, recente) is not None
+
+    historico = client.get(url).json()
+    assert historico["resumo"] == resumo_antes
+    assert [p["id"] for p in historico["pedidos"]] == [recente]
+
+    arquivado = client.get(f"/arquivo/pedidos/{antigo}").json()
+    assert arquivado["preco_total"] == 2.5
+    assert arquivado["venda"]["forma_pagamento"] == "pix"
+    assert len(arquivado["itens_pedido"]) == 1
+
+    pagina = client.get("/arquivo/pedidos", params={"cliente_id": cliente_id}).json()
+    assert [p["id"] for p in pagina["pedidos"]] == [antigo]
+
+
+def test_nao_arquiva_pedido_com_venda_pendente(cliente_id, produto_id):
+    pendente = _pedido_vendido(
+        cliente_id, produto_id, datetime(2020, 1, 1), status="pendente"
+    )
+
+    with SessionLocal() as db:
+        arquivar_pedidos(db, dias=365)
+        assert db.get(PedidoModel, pendente) is not None
+
+    assert client.get(f"/arquivo/pedidos/{pendente}").status_code == 404
+
+
+def test_pedido_arquivado_inexistente():
+    assert client.get("/arquivo/pedidos/999999999").status_code == 404
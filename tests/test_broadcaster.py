@@ -0,0 +1,87 @@
+import asyncio
+import threading
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.events import broadcaster as modulo
+from src.events.broadcaster import OVERFLOW, Broadcaster, Event
+
+
+def test_fan_out_para_centenas_de_assinantes():
+    async def cenario():
+        broadcaster = Broadcaster()
+        subscriptions = [broadcaster.subscribe() for _ in range(500)]
+
+        # Publica de outra thread, como fazem os handlers síncronos.
+        thread = threading.Thread(
+            target=broadcaster.publish, args=("pedido_created", {"id": 1})
+        )
+        thread.start()
+        thread.join()
+
+        events = await asyncio.wait_for(
+            asyncio.gather(*(s.get() for s in subscriptions)), timeout=5
+        )
+        assert len(events) == 500
+        assert all(e.data == {"id": 1} for e in events)
+
+    asyncio.run(cenario())
+
+
+def test_assinante_lento_recebe_reset():
+    async def cenario():
+        broadcaster = Broadcaster(maxsize=2)
+        lento = broadcaster.subscribe()
+        for i in range(5):
+            broadcaster.publish("pedido_created", {"id": i})
+        await asyncio.sleep(0)
+
+        assert await lento.get() is OVERFLOW
+        assert lento.queue.empty()
+
+    asyncio.run(cenario())
+
+
+class _PubSubInstavel:
+    """Cai na primeira conexão; na seguinte entrega um evento e fica aberta."""
+
+    def __init__(self) -> None:
+        self.conexoes = 0
+
+    def __call__(self, **_kwargs):
+        self.conexoes += 1
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        pass
+
+    def subscribe(self, _channel: str) -> None:
+        pass
+
+    def listen(self):
+        if self.conexoes == 1:
+            raise RedisConnectionError("conexão perdida")
+        yield {"data": Event("pedido_created", {"id": 1}).to_json()}
+        threading.Event().wait()
+
+
+def test_reconecta_ao_redis_e_envia_reset(monkeypatch):
+    monkeypatch.setattr(modulo, "RECONNECT_MIN", 0)
+    pubsub = _PubSubInstavel()
+
+    async def cenario():
+        broadcaster = Broadcaster()
+        subscription = broadcaster.subscribe()
+        threading.Thread(
+            target=broadcaster._listen,
+            args=(pubsub, (RedisConnectionError,)),
+            daemon=True,
+        ).start()
+        assert await asyncio.wait_for(subscription.get(), timeout=5) is OVERFLOW
+        assert (await asyncio.wait_for(subscription.get(), timeout=5)).data == {"id": 1}
+        assert pubsub.conexoes == 2
+
+    asyncio.run(cenario())
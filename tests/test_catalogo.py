@@ -0,0 +1,68 @@
+import dataclasses
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from config.database import SessionLocal
+from config.versioning import VersionCache, bump_version
+from src.catalogo import CatalogoCache
+from src.main import app
+from src.models.produto_model import ProdutoModel
+
+client = TestClient(app)
+
+
+def test_produto_criado_aparece_no_snapshot(produto_id):
+    with SessionLocal() as db:
+        categoria_id = db.get(ProdutoModel, produto_id).categoria_id
+    codigo = uuid.uuid4().hex
+    produto = {
+        "nome_produto": "Bolo de pote",
+        "data_validade": "2030-01-01",
+        "marca": "Casa",
+        "codigo_barras": codigo,
+        "preco_unidade": 12.5,
+        "unidade": "un",
+        "quantidade": 10,
+        "categoria_id": categoria_id,
+    }
+    assert client.post("/produtos", json=produto).status_code == 201
+
+    response = client.get(f"/produtos/codigo/{codigo}")
+    assert response.status_code == 200
+    assert response.json()["nome_produto"] == "Bolo de pote"
+    assert client.get("/produtos/codigo/inexistente").status_code == 404
+
+
+def test_snapshot_recarrega_quando_a_versao_muda(produto_id):
+    cache = CatalogoCache(VersionCache(intervalo=0))
+    with SessionLocal() as db:
+        bump_version(db, "produtos")
+        db.commit()
+        antes = cache.obter(db)
+        assert cache.obter(db) is antes
+
+        # Alteração feita por "outro worker".
+        db.execute(
+            update(ProdutoModel)
+            .where(ProdutoModel.id == produto_id)
+            .values(nome_produto="Beijinho")
+        )
+        bump_version(db, "produtos")
+        db.commit()
+
+        depois = cache.obter(db)
+    assert depois is not antes
+    assert depois.versao == antes.versao + 1
+    assert depois.produto_por_id[produto_id].nome_produto == "Beijinho"
+    assert cache.recargas == 2
+
+
+def test_registros_sao_imutaveis(produto_id):
+    cache = CatalogoCache(VersionCache(intervalo=0))
+    with SessionLocal() as db:
+        produto = cache.obter(db).produto_por_id[produto_id]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        produto.nome_produto = "Beijinho"
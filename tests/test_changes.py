@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from config.database import SessionLocal
+from src.events import outbox
+from src.main import app
+from src.models.outbox_model import OutboxModel
+
+client = TestClient(app)
+
+
+def test_changes_recebe_pedido_criado(cliente_id):
+    since = client.get("/changes", params={"since": 0, "limit": 1000}).json()
+    cursor = since["next"]
+    while since["changes"]:
+        since = client.get("/changes", params={"since": cursor, "limit": 1000}).json()
+        cursor = since["next"]
+
+    pedido = client.post(
+        "/pedidos",
+        json={"cliente_id": cliente_id, "itens_pedido": [], "preco_total": 0},
+    )
+    assert pedido.status_code == 201
+
+    feed = client.get("/changes", params={"since": cursor, "timeout": 1}).json()
+    assert [c["operacao"] for c in feed["changes"]] == ["create"]
+    assert feed["changes"][0]["entidade"] == "pedido"
+    assert feed["next"] > cursor
+
+
+def test_changes_long_poll_sem_alteracoes():
+    cursor = 10**9
+    feed = client.get("/changes", params={"since": cursor, "timeout": 0.2}).json()
+    assert feed == {"changes": [], "next": cursor}
+
+
+def test_changes_aguarda_o_atraso_configurado(cliente_id, monkeypatch):
+    with SessionLocal() as db:
+        cursor = db.scalar(select(func.max(OutboxModel.id))) or 0
+    pedido = {"cliente_id": cliente_id, "itens_pedido": [], "preco_total": 0}
+    assert client.post("/pedidos", json=pedido).status_code == 201
+
+    monkeypatch.setattr(outbox, "CHANGES_LAG", 3600)
+    feed = client.get("/changes", params={"since": cursor}).json()
+    assert feed == {"changes": [], "next": cursor}
+
+    monkeypatch.setattr(outbox, "CHANGES_LAG", 0)
+    feed = client.get("/changes", params={"since": cursor}).json()
+    assert [c["entidade"] for c in feed["changes"]] == ["pedido"]
@@ -0,0 +1,101 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from config.database import SessionLocal, engine
+from config.versioning import ler_versoes
+from src.main import app
+from src.models.produto_model import ProdutoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def _estoque(produto_id: int) -> float:
+    with SessionLocal() as db:
+        return db.get(ProdutoModel, produto_id).quantidade
+
+
+def _checkout(cliente_id: int, produto_id: int, quantidade: float, **headers):
+    return client.post(
+        "/checkout",
+        json={
+            "cliente_id": cliente_id,
+            "itens": [{"produto_id": produto_id, "quantidade": quantidade}],
+            "forma_pagamento": "pix",
+            "status_venda": "pago",
+        },
+        headers=headers,
+    )
+
+
+def test_checkout_cria_pedido_venda_e_baixa_estoque(cliente_id, produto_id):
+    resposta = _checkout(cliente_id, produto_id, 4)
+
+    assert resposta.status_code == 201
+    dados = resposta.json()
+    assert dados["preco_total"] == 10.0
+    assert dados["itens"][0]["preco_unitario"] == 2.5
+    assert _estoque(produto_id) == 96
+    with SessionLocal() as db:
+        venda = db.get(VendaModel, dados["venda"]["id"])
+        assert venda.pedido_id == dados["pedido_id"]
+    # O snapshot do catálogo enxerga o estoque novo.
+    produtos = client.get(f"/produtos?ids={produto_id}").json()
+    assert produtos[0]["quantidade"] == 96
+
+
+def test_estoque_insuficiente_desfaz_tudo(cliente_id, produto_id):
+    resposta = _checkout(cliente_id, produto_id, 101)
+
+    assert resposta.status_code == 409
+    assert _estoque(produto_id) == 100
+
+
+def test_checkout_idempotente(cliente_id, produto_id):
+    chave = {"Idempotency-Key": uuid.uuid4().hex}
+    primeira = _checkout(cliente_id, produto_id, 1, **chave)
+    segunda = _checkout(cliente_id, produto_id, 1, **chave)
+
+    assert segunda.json() == primeira.json()
+    assert _estoque(produto_id) == 99
+
+
+def test_checkout_muda_etag_sem_mudar_o_catalogo(cliente_id, produto_id):
+    with SessionLocal() as db:
+        versao = ler_versoes(db).get("produtos")
+    antes = client.get(f"/produtos/{produto_id}", params={"id_": produto_id})
+    etag = antes.headers["ETag"]
+    assert antes.json()["quantidade"] == 100
+
+    assert _checkout(cliente_id, produto_id, 3).status_code == 201
+
+    depois = client.get(
+        f"/produtos/{produto_id}",
+        params={"id_": produto_id},
+        headers={"If-None-Match": etag},
+    )
+    assert depois.status_code == 200
+    assert depois.headers["ETag"] != etag
+    assert depois.json()["quantidade"] == 97
+    with SessionLocal() as db:
+        assert ler_versoes(db).get("produtos") == versao
+
+
+def test_checkout_nao_carrega_o_historico_do_produto(cliente_id, produto_id):
+    assert _checkout(cliente_id, produto_id, 1).status_code == 201
+    consultas = []
+
+    def registrar(_conn, _cursor, statement, *_args):
+        if statement.startswith("SELECT"):
+            consultas.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        assert _checkout(cliente_id, produto_id, 1).status_code == 201
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    # Só a existência do cliente e o preço dos produtos.
+    assert len(consultas) == 2
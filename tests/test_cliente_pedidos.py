@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from config.database import SessionLocal
+from src.main import app
+from src.models.cliente_model import ClienteModel
+from src.models.pedido_model import PedidoModel
+
+client = TestClient(app)
+
+
+def _cliente_com_pedidos(totais: list[str]) -> int:
+    with SessionLocal() as db:
+        cliente = ClienteModel(nome="Bia", telefone="11988887777", endereco="Rua B")
+        db.add(cliente)
+        db.flush()
+        for total in totais:
+            db.add(
+                PedidoModel(
+                    cliente_id=cliente.id, quantidade=0, preco_total=Decimal(total)
+                )
+            )
+        db.commit()
+        return cliente.id
+
+
+def test_historico_paginado_por_cursor():
+    cliente_id = _cliente_com_pedidos(["10.10", "20.20", "0.30"])
+
+    primeira = client.get(f"/clientes/{cliente_id}/pedidos", params={"limit": 2})
+    assert primeira.status_code == 200
+    body = primeira.json()
+    assert body["resumo"]["quantidade_pedidos"] == 3
+    assert body["resumo"]["total_gasto"] == 30.6
+    assert body["resumo"]["ultimo_pedido_id"] == body["pedidos"][0]["id"]
+    assert len(body["pedidos"]) == 2
+
+    segunda = client.get(
+        f"/clientes/{cliente_id}/pedidos",
+        params={"limit": 2, "antes_de": body["proximo_cursor"]},
+    ).json()
+    assert [p["preco_total"] for p in segunda["pedidos"]] == [10.1]
+    assert segunda["proximo_cursor"] is None
+
+
+def test_historico_cliente_inexistente():
+    assert client.get("/clientes/999999999/pedidos").status_code == 404
+
+
+def test_lookup_por_telefone_formatado():
+    cliente_id = _cliente_com_pedidos([])
+    response = client.get("/clientes/lookup", params={"telefone": "(11) 98888-7777"})
+    assert response.status_code == 200
+    assert cliente_id in [c["id"] for c in response.json()]
+
+
+def test_lookup_por_prefixo_do_nome():
+    response = client.get("/clientes/lookup", params={"nome": "BI"})
+    assert response.status_code == 200
+    assert response.json()
+    assert all(c["nome"].lower().startswith("bi") for c in response.json())
+
+
+def test_lookup_sem_parametros():
+    assert client.get("/clientes/lookup").status_code == 400
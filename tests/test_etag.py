@@ -0,0 +1,82 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+
+from config import versioning
+from config.database import SessionLocal, engine
+from config.versioning import bump_version, versoes_table
+from src.main import app
+
+client = TestClient(app)
+
+
+def test_produto_index_304_quando_etag_atual():
+    response = client.get("/produtos")
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"produtos-')
+    assert "last-modified" in response.headers
+
+    cached = client.get("/produtos", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_categoria_etag_muda_apos_create():
+    etag = client.get("/categorias").headers["etag"]
+
+    created = client.post("/categorias", json={"categoria": "Bolos"})
+    assert created.status_code == 201
+
+    response = client.get("/categorias", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_produto_304_nao_consulta_o_banco(monkeypatch):
+    monkeypatch.setattr(versioning.version_cache, "intervalo", 60)
+    etag = client.get("/produtos").headers["etag"]
+    consultas = []
+
+    def registrar(_conn, _cursor, statement, *_args):
+        consultas.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        cached = client.get("/produtos", headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert cached.status_code == 304
+    assert consultas == []
+
+
+def test_etag_segue_versao_gravada_no_banco(monkeypatch):
+    # Outro worker grava a versão direto no banco, sem invalidar a cópia local.
+    monkeypatch.setattr(versioning.version_cache, "intervalo", 0)
+    with SessionLocal() as db:
+        bump_version(db, "receitas")
+        db.commit()
+    etag = client.get("/receitas").headers["etag"]
+    with SessionLocal() as db:
+        db.execute(
+            update(versoes_table)
+            .where(versoes_table.c.tabela == "receitas")
+            .values(versao=versoes_table.c.versao + 1)
+        )
+        db.commit()
+
+    response = client.get("/receitas", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_produto_etag_muda_apos_alterar_estoque(produto_id):
+    url = f"/produtos/{produto_id}"
+    etag = client.get(url, params={"id_": produto_id}).headers["etag"]
+
+    client.patch(url, params={"id_": produto_id}, json={"quantidade": 7})
+
+    response = client.get(
+        url, params={"id_": produto_id}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["quantidade"] == 7
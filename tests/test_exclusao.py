@@ -0,0 +1,112 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from config.database import SessionLocal
+from config.soft_delete import INCLUIR_EXCLUIDOS
+from src.main import app
+from src.models.item_model import ItemModel
+from src.models.pedido_model import PedidoModel
+from src.models.produto_model import ProdutoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def _pedido(cliente_id: int, produto_id: int) -> int:
+    item = {
+        "produto_id": produto_id,
+        "pedido_id": 0,
+        "quantidade": 1,
+        "preco_unitario": 2.5,
+    }
+    response = client.post(
+        "/pedidos",
+        json={"cliente_id": cliente_id, "itens_pedido": [item], "preco_total": 0},
+    )
+    assert response.status_code == 201
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.max(PedidoModel.id)).where(PedidoModel.cliente_id == cliente_id)
+        )
+
+
+def test_exclusao_em_lote_de_categorias_remove_produtos(produto_id):
+    with SessionLocal() as db:
+        categoria_id = db.get(ProdutoModel, produto_id).categoria_id
+
+    response = client.delete("/categorias", params={"ids": f"{categoria_id},0"})
+
+    assert response.status_code == 200
+    assert response.json() == {"removidos": [categoria_id], "nao_encontrados": [0]}
+    with SessionLocal() as db:
+        assert db.get(ProdutoModel, produto_id) is None
+
+
+def test_produto_em_pedido_nao_pode_ser_removido(cliente_id, produto_id):
+    _pedido(cliente_id, produto_id)
+    response = client.delete("/produtos", params={"ids": str(produto_id)})
+    assert response.status_code == 409
+
+
+def test_cliente_com_pedidos_nao_pode_ser_removido(cliente_id, produto_id):
+    _pedido(cliente_id, produto_id)
+    response = client.delete(f"/clientes/{cliente_id}", params={"id_": cliente_id})
+    assert response.status_code == 409
+
+
+def test_exclusao_logica_e_definitiva_de_pedidos(cliente_id, produto_id):
+    ids = [_pedido(cliente_id, produto_id) for _ in range(2)]
+    params = {"ids": ",".join(map(str, ids))}
+
+    response = client.delete("/pedidos", params={**params, "soft": True})
+    assert response.json()["removidos"] == ids
+    assert client.get(f"/pedido/{ids[0]}", params={"id_": ids[0]}).status_code == 404
+    with SessionLocal() as db:
+        excluidos = db.scalars(
+            select(PedidoModel).where(PedidoModel.id.in_(ids)),
+            execution_options={INCLUIR_EXCLUIDOS: True},
+        ).all()
+        assert all(p.excluido_em is not None for p in excluidos)
+
+    response = client.delete("/pedidos", params=params)
+    assert response.json()["removidos"] == ids
+    with SessionLocal() as db:
+        itens = db.scalar(select(func.count()).where(ItemModel.pedido_id.in_(ids)))
+        assert itens == 0
+
+
+def test_exclusao_logica_do_pedido_exclui_a_venda(cliente_id, produto_id):
+    pedido_id = _pedido(cliente_id, produto_id)
+    with SessionLocal() as db:
+        venda = VendaModel(
+            pedido_id=pedido_id, forma_pagamento="pix", status_venda="pago"
+        )
+        db.add(venda)
+        db.commit()
+        venda_id = venda.id
+
+    assert client.get(f"/venda/{venda_id}", params={"id_": venda_id}).is_success
+
+    client.delete(f"/pedido/{pedido_id}", params={"id_": pedido_id, "soft": True})
+
+    response = client.get("/vendas", params={"page_size": 100})
+    assert response.status_code == 200
+    assert all(v["pedido"]["cliente_id"] != cliente_id for v in response.json())
+    response = client.get(f"/venda/{venda_id}", params={"id_": venda_id})
+    assert response.status_code == 404
+
+
+def test_ids_invalidos():
+    assert client.delete("/pedidos", params={"ids": "1,a"}).status_code == 400
+    assert client.delete("/vendas", params={"ids": ","}).status_code == 400
+
+
+def test_total_do_historico_ignora_pedidos_excluidos(cliente_id, produto_id):
+    ids = [_pedido(cliente_id, produto_id) for _ in range(2)]
+    client.delete(f"/pedido/{ids[0]}", params={"id_": ids[0], "soft": True})
+
+    resumo = client.get(f"/clientes/{cliente_id}/pedidos").json()["resumo"]
+    assert resumo["quantidade_pedidos"] == 1
+    assert Decimal(str(resumo["total_gasto"])) == Decimal("2.50")
@@ -0,0 +1,140 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from config.database import SessionLocal
+from config.filtros import Filtro, ListaFiltros
+from config.versioning import bump_version
+from src.main import app
+from src.models.categoria_model import CategoriaModel
+from src.models.pedido_model import PedidoModel
+from src.models.produto_model import ProdutoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def test_filtro_sem_indice_e_recusado():
+    with pytest.raises(ValueError, match="nome_produto"):
+        ListaFiltros(ProdutoModel, {"nome": Filtro("nome_produto", str)}, {})
+
+
+def _categoria_com_precos(precos: list[str]) -> int:
+    with SessionLocal() as db:
+        categoria = CategoriaModel(categoria="Filtros")
+        db.add(categoria)
+        db.flush()
+        for preco in precos:
+            db.add(
+                ProdutoModel(
+                    nome_produto="Trufa",
+                    marca="Casa",
+                    codigo_barras=uuid.uuid4().hex,
+                    preco_unidade=Decimal(preco),
+                    unidade="un",
+                    quantidade=1,
+                    categoria_id=categoria.id,
+                )
+            )
+        bump_version(db, "categorias", "produtos")
+        db.commit()
+        return categoria.id
+
+
+def test_produtos_filtrados_e_paginados_por_cursor():
+    categoria_id = _categoria_com_precos(["1.00", "5.00", "5.00", "9.00", "20.00"])
+    params = {
+        "categoria_id": categoria_id,
+        "preco_min": "2",
+        "preco_max": "10",
+        "ordem": "-preco_unidade",
+        "page_size": 2,
+    }
+
+    precos = []
+    while True:
+        response = client.get("/produtos", params=params)
+        assert response.status_code == 200
+        precos += [p["preco_unidade"] for p in response.json()]
+        if "x-proximo-cursor" not in response.headers:
+            break
+        params["apos"] = response.headers["x-proximo-cursor"]
+
+    assert precos == [9.0, 5.0, 5.0]
+
+
+def test_pedidos_e_vendas_filtrados(cliente_id):
+    with SessionLocal() as db:
+        pedidos = [
+            PedidoModel(cliente_id=cliente_id, quantidade=0, preco_total=Decimal(total))
+            for total in (1, 2)
+        ]
+        db.add_all(pedidos)
+        db.flush()
+        status_venda = f"teste-{uuid.uuid4().hex[:8]}"
+        db.add(
+            VendaModel(
+                pedido_id=pedidos[0].id,
+                forma_pagamento="pix",
+                status_venda=status_venda,
+            )
+        )
+        db.commit()
+
+    response = client.get(
+        "/pedidos",
+        params={"cliente_id": cliente_id, "ordem": "-id", "fields": "preco_total"},
+    )
+    assert [float(p["preco_total"]) for p in response.json()] == [2, 1]
+
+    vendas = client.get("/vendas", params={"status_venda": status_venda})
+    assert [v["forma_pagamento"] for v in vendas.json()] == ["pix"]
+
+
+def _paginar(params: dict) -> list[float]:
+    totais = []
+    for _ in range(10):
+        response = client.get("/pedidos", params=params)
+        assert response.status_code == 200
+        totais += [float(p["preco_total"]) for p in response.json()]
+        if "x-proximo-cursor" not in response.headers:
+            return totais
+        params = {**params, "apos": response.headers["x-proximo-cursor"]}
+    raise AssertionError("O cursor não avançou.")
+
+
+def test_cursor_por_criado_em(cliente_id):
+    with SessionLocal() as db:
+        pedidos = [
+            PedidoModel(cliente_id=cliente_id, quantidade=0, preco_total=Decimal(t))
+            for t in (1, 2, 3, 4, 5)
+        ]
+        db.add_all(pedidos)
+        db.commit()
+        # 1 e 2 ficam com o CURRENT_TIMESTAMP do banco; 4 e 5 empatam.
+        momentos = {3: "2020-01-01 10:00:00", 4: "2020-01-01 09:00:00"}
+        momentos[5] = momentos[4]
+        for pedido in pedidos[2:]:
+            momento = datetime.fromisoformat(momentos[int(pedido.preco_total)])
+            db.execute(
+                update(PedidoModel)
+                .where(PedidoModel.id == pedido.id)
+                .values(criado_em=momento)
+            )
+        db.commit()
+
+    params = {"cliente_id": cliente_id, "page_size": 2, "fields": "preco_total"}
+    assert _paginar({**params, "ordem": "criado_em"}) == [4, 5, 3, 1, 2]
+    assert _paginar({**params, "ordem": "-criado_em"}) == [2, 1, 3, 5, 4]
+
+    limite = {"criado_de": "2020-01-01T09:00:00", "criado_ate": "2020-01-01T10:00:00"}
+    assert _paginar({**params, **limite, "ordem": "criado_em"}) == [4, 5]
+
+
+def test_ordem_e_cursor_invalidos():
+    assert client.get("/vendas", params={"ordem": "status_venda"}).status_code == 400
+    assert client.get("/pedidos", params={"apos": "lixo"}).status_code == 400
@@ -0,0 +1,101 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from config.database import SessionLocal
+from src.main import app
+from src.models.pedido_model import PedidoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def _pedido(cliente_id: int, produto_id: int) -> dict:
+    item = {
+        "produto_id": produto_id,
+        "pedido_id": 0,
+        "quantidade": 2,
+        "preco_unitario": 4.5,
+    }
+    return {"cliente_id": cliente_id, "itens_pedido": [item], "preco_total": 0}
+
+
+def _contar_pedidos(cliente_id: int) -> int:
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.count()).where(PedidoModel.cliente_id == cliente_id)
+        )
+
+
+def test_repeticao_devolve_resposta_original(cliente_id, produto_id):
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+
+    body = _pedido(cliente_id, produto_id)
+    first = client.post("/pedidos", json=body, headers=headers)
+    retry = client.post("/pedidos", json=body, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert _contar_pedidos(cliente_id) == 1
+
+
+def test_chave_reutilizada_com_outro_corpo(cliente_id, produto_id):
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    primeiro = _pedido(cliente_id, produto_id)
+    outro = {**primeiro, "preco_total": 1}
+    assert client.post("/pedidos", json=primeiro, headers=headers).status_code == 201
+    assert client.post("/pedidos", json=outro, headers=headers).status_code == 422
+
+
+def test_submissoes_concorrentes_criam_um_pedido(cliente_id, produto_id):
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    body = _pedido(cliente_id, produto_id)
+
+    def enviar(_):
+        return client.post("/pedidos", json=body, headers=headers)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(enviar, range(16)))
+
+    assert {r.status_code for r in responses} == {201}
+    assert len({r.text for r in responses}) == 1
+    assert _contar_pedidos(cliente_id) == 1
+
+
+def _pedido_id(cliente_id: int, produto_id: int) -> int:
+    response = client.post("/pedidos", json=_pedido(cliente_id, produto_id))
+    assert response.status_code == 201
+    with SessionLocal() as db:
+        return db.scalar(
+            select(func.max(PedidoModel.id)).where(PedidoModel.cliente_id == cliente_id)
+        )
+
+
+def test_submissoes_concorrentes_criam_uma_venda(cliente_id, produto_id):
+    pedido_id = _pedido_id(cliente_id, produto_id)
+    headers = {"Idempotency-Key": uuid.uuid4().hex}
+    body = {"pedido_id": pedido_id, "forma_pagamento": "pix", "status_venda": "pago"}
+
+    def enviar(_):
+        return client.post("/vendas", json=body, headers=headers)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(enviar, range(16)))
+
+    assert {r.status_code for r in responses} == {201}
+    assert len({r.text for r in responses}) == 1
+    assert responses[0].json()["pedido"]["cliente_id"] == cliente_id
+    with SessionLocal() as db:
+        vendas = select(func.count()).where(VendaModel.pedido_id == pedido_id)
+        assert db.scalar(vendas) == 1
+
+
+def test_segunda_venda_do_pedido_sem_chave(cliente_id, produto_id):
+    pedido_id = _pedido_id(cliente_id, produto_id)
+    body = {"pedido_id": pedido_id, "forma_pagamento": "pix", "status_venda": "pago"}
+
+    assert client.post("/vendas", json=body).status_code == 201
+    assert client.post("/vendas", json=body).status_code == 409
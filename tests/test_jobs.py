@@ -0,0 +1,68 @@
+import sys
+
+import pytest
+from sqlalchemy import text
+
+from config.database import SessionLocal
+from src.jobs import MemoryBackend, enqueue, enqueue_after_commit, run_pending, task
+from src.jobs import queue as job_queue
+
+executados: list[dict] = []
+tentativas = {"n": 0}
+
+
+@task("teste_registrar")
+def registrar(payload: dict) -> None:
+    executados.append(payload)
+
+
+@task("teste_instavel")
+def instavel(payload: dict) -> None:
+    tentativas["n"] += 1
+    if tentativas["n"] < 3:
+        raise RuntimeError("falha temporária")
+
+
+def test_idempotency_key_ignora_duplicado():
+    backend = MemoryBackend()
+    assert enqueue("teste_registrar", {"a": 1}, idempotency_key="k1", backend=backend)
+    duplicado = enqueue(
+        "teste_registrar", {"a": 1}, idempotency_key="k1", backend=backend
+    )
+    assert duplicado is None
+    assert run_pending(backend) == 1
+
+
+def test_retry_ate_sucesso():
+    backend = MemoryBackend()
+    enqueue("teste_instavel", backend=backend, max_retries=3)
+    assert run_pending(backend) == 3
+    assert tentativas["n"] == 3
+
+
+def test_enqueue_after_commit(monkeypatch):
+    backend = MemoryBackend()
+    monkeypatch.setattr(job_queue, "get_backend", lambda: backend)
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+        enqueue_after_commit(db, "teste_registrar", {"descartado": True})
+        db.rollback()
+        enqueue_after_commit(db, "teste_registrar", {"commit": True})
+        db.commit()
+    finally:
+        db.close()
+    executados.clear()
+    run_pending(backend)
+    assert executados == [{"commit": True}]
+
+
+def test_redis_url_sem_pacote_impede_a_subida(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setitem(sys.modules, "redis", None)
+    job_queue.get_backend.cache_clear()
+    try:
+        with pytest.raises(RuntimeError, match="REDIS_URL"):
+            job_queue.get_backend()
+    finally:
+        job_queue.get_backend.cache_clear()
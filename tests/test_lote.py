@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from config.database import SessionLocal
+from src.main import app
+from src.models.cliente_model import ClienteModel
+from src.models.pedido_model import PedidoModel
+from src.models.produto_model import ProdutoModel
+
+client = TestClient(app)
+
+INEXISTENTE = 999_999
+
+
+def test_produtos_e_categorias_por_ids(produto_id):
+    with SessionLocal() as db:
+        categoria_id = db.get(ProdutoModel, produto_id).categoria_id
+
+    response = client.get("/produtos", params={"ids": f"{INEXISTENTE},{produto_id}"})
+
+    assert response.status_code == 200
+    assert response.headers["x-ids-nao-encontrados"] == str(INEXISTENTE)
+    assert [p["categoria_id"] for p in response.json()] == [categoria_id]
+
+    categorias = client.get("/categorias", params={"ids": f"{categoria_id}"})
+    assert "x-ids-nao-encontrados" not in categorias.headers
+    assert len(categorias.json()) == 1
+
+
+def test_clientes_e_pedidos_por_ids(cliente_id):
+    with SessionLocal() as db:
+        segundo = ClienteModel(nome="Zé", telefone="11911112222", endereco="Rua Z")
+        db.add(segundo)
+        db.flush()
+        pedidos = [
+            PedidoModel(cliente_id=c, quantidade=0, preco_total=Decimal("1.00"))
+            for c in (cliente_id, segundo.id)
+        ]
+        db.add_all(pedidos)
+        db.commit()
+        segundo_id = segundo.id
+        pedido_ids = [p.id for p in pedidos]
+
+    clientes = client.get("/clientes", params={"ids": f"{segundo_id},{cliente_id}"})
+    assert [c["nome"] for c in clientes.json()] == ["Zé", "Teste"]
+
+    resposta = client.get(
+        "/pedidos",
+        params={
+            "ids": f"{pedido_ids[1]},{INEXISTENTE},{pedido_ids[0]}",
+            "fields": "cliente_id",
+        },
+    )
+    assert resposta.json() == [{"cliente_id": segundo_id}, {"cliente_id": cliente_id}]
+    assert resposta.headers["x-ids-nao-encontrados"] == str(INEXISTENTE)
+
+
+def test_ids_invalidos():
+    assert client.get("/clientes", params={"ids": "1,a"}).status_code == 400
@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+
+from config import dependencies
+from src.main import app
+
+client = TestClient(app)
+
+
+def test_memoria_reporta_identity_map_por_rota(produto_id, admin_headers):
+    assert client.get("/categorias").status_code == 200
+
+    dados = client.get("/diagnostico/memoria", headers=admin_headers).json()
+
+    assert dados["processo"]
+    assert "listar_categorias" in dados["identity_map"]["por_rota"]
+
+
+def test_diff_desde_referencia(admin_headers):
+    assert (
+        client.get("/diagnostico/memoria/diff", headers=admin_headers).status_code
+        == 409
+    )
+    assert client.post(
+        "/diagnostico/memoria/tracemalloc?frames=1", headers=admin_headers
+    ).json()["ativo"]
+    try:
+        assert (
+            client.post(
+                "/diagnostico/memoria/referencia", headers=admin_headers
+            ).status_code
+            == 204
+        )
+        retido = [bytearray(1024) for _ in range(1000)]
+        diff = client.get("/diagnostico/memoria/diff", headers=admin_headers).json()
+        assert sum(item["bytes_diff"] for item in diff) > 0
+        assert len(retido) == 1000
+    finally:
+        client.post("/diagnostico/memoria/tracemalloc?frames=0", headers=admin_headers)
+
+
+def test_diagnostico_exige_token(admin_headers):
+    assert client.get("/diagnostico/memoria").status_code == 403
+    errado = {"X-Admin-Token": "outro"}
+    assert client.get("/diagnostico/memoria", headers=errado).status_code == 403
+
+
+def test_diagnostico_fechado_sem_token_configurado(monkeypatch):
+    monkeypatch.setattr(dependencies, "ADMIN_TOKEN", "")
+    assert client.get("/diagnostico/memoria").status_code == 403
@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from config.database import SessionLocal
+from src.main import app
+from src.models.pedido_model import PedidoModel
+
+client = TestClient(app)
+
+
+def test_preco_total_sem_erro_de_ponto_flutuante(cliente_id, produto_id):
+    item = {
+        "produto_id": produto_id,
+        "pedido_id": 0,
+        "quantidade": 3,
+        "preco_unitario": 0.1,
+    }
+    response = client.post(
+        "/pedidos",
+        json={"cliente_id": cliente_id, "itens_pedido": [item], "preco_total": 0},
+    )
+    assert response.status_code == 201
+    assert response.json()["preco_total"] == 0.3
+    assert response.json()["itens_pedido"][0]["preco_unitario"] == 0.1
+
+
+def test_soma_no_banco_retorna_decimal_exato():
+    with SessionLocal() as db:
+        total = db.scalar(select(func.sum(PedidoModel.preco_total)))
+    assert isinstance(total, Decimal)
+    assert total == total.quantize(Decimal("0.01"))
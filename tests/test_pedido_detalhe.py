@@ -0,0 +1,61 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from config.database import SessionLocal, engine
+from src.main import app
+from src.models.item_model import ItemModel
+from src.models.pedido_model import PedidoModel
+from src.models.venda_model import VendaModel
+
+client = TestClient(app)
+
+
+def _pedido(cliente_id: int, produto_id: int) -> int:
+    with SessionLocal() as db:
+        pedido = PedidoModel(
+            cliente_id=cliente_id, quantidade=2, preco_total=Decimal("7.50")
+        )
+        db.add(pedido)
+        db.flush()
+        for quantidade in (1, 2):
+            db.add(
+                ItemModel(
+                    produto_id=produto_id,
+                    pedido_id=pedido.id,
+                    quantidade=quantidade,
+                    preco_unitario=Decimal("2.50"),
+                )
+            )
+        db.add(
+            VendaModel(pedido_id=pedido.id, forma_pagamento="pix", status_venda="pago")
+        )
+        db.commit()
+        return pedido.id
+
+
+def test_detalhe_em_uma_unica_consulta(cliente_id, produto_id):
+    pedido_id = _pedido(cliente_id, produto_id)
+    comandos = []
+
+    def registrar(_conn, _cursor, statement, *_args):
+        comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        response = client.get(f"/pedidos/{pedido_id}/detalhe")
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert response.status_code == 200
+    assert len(comandos) == 1
+    body = response.json()
+    assert body["cliente"]["id"] == cliente_id
+    assert [i["quantidade"] for i in body["itens"]] == [1, 2]
+    assert body["itens"][0]["nome_produto"] == "Brigadeiro"
+    assert body["venda"]["status_venda"] == "pago"
+
+
+def test_detalhe_inexistente():
+    assert client.get("/pedidos/999999/detalhe").status_code == 404
@@ -0,0 +1,11 @@
+from config.processos import workers_recomendados
+
+
+def test_sqlite_usa_um_worker():
+    assert workers_recomendados(cpus=8, backend="sqlite") == 1
+
+
+def test_workers_limitados_por_cpu_e_conexoes():
+    assert workers_recomendados(4, "postgresql", pool_por_worker=15) == 6
+    assert workers_recomendados(2, "postgresql", pool_por_worker=15) == 5
+    assert workers_recomendados(4, "postgresql", 15, max_conexoes=10) == 1
@@ -0,0 +1,68 @@
+import uuid
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from config.database import SessionLocal
+from src.main import app
+from src.models.produto_model import ProdutoModel
+
+client = TestClient(app)
+
+
+def _produto(db, categoria_id: int, validade: date, quantidade: float) -> int:
+    produto = ProdutoModel(
+        nome_produto="Bombom",
+        data_validade=validade,
+        marca="Casa",
+        codigo_barras=uuid.uuid4().hex,
+        preco_unidade=1,
+        unidade="un",
+        quantidade=quantidade,
+        categoria_id=categoria_id,
+    )
+    db.add(produto)
+    db.flush()
+    return produto.id
+
+
+def test_vencendo_filtra_estoque_e_pagina_por_validade(produto_id):
+    hoje = date.today()
+    with SessionLocal() as db:
+        categoria_id = db.get(ProdutoModel, produto_id).categoria_id
+        amanha = _produto(db, categoria_id, hoje + timedelta(days=1), 3)
+        depois = _produto(db, categoria_id, hoje + timedelta(days=2), 3)
+        sem_estoque = _produto(db, categoria_id, hoje + timedelta(days=1), 0)
+        distante = _produto(db, categoria_id, hoje + timedelta(days=60), 3)
+        vencido = _produto(db, categoria_id, hoje - timedelta(days=1), 3)
+        db.commit()
+
+    ids, params = [], {"dias": 7, "limit": 1}
+    while True:
+        pagina = client.get("/produtos/vencendo", params=params).json()
+        ids += [p["id"] for p in pagina["produtos"]]
+        if pagina["proximo_cursor"] is None:
+            break
+        cursor = pagina["proximo_cursor"]
+        params.update(apos_data=cursor["data_validade"], apos_id=cursor["id"])
+
+    assert ids.index(amanha) < ids.index(depois)
+    assert not {sem_estoque, distante, vencido} & set(ids)
+
+    todos = client.get(
+        "/produtos/vencendo", params={"dias": 7, "incluir_vencidos": True}
+    ).json()
+    assert vencido in [p["id"] for p in todos["produtos"]]
+
+
+def test_vencendo_usa_indice_de_validade():
+    with SessionLocal() as db:
+        plano = db.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM produtos "
+                "WHERE data_validade BETWEEN :de AND :ate AND quantidade > 0"
+            ),
+            {"de": date.today(), "ate": date.today() + timedelta(days=7)},
+        ).all()
+    assert "ix_produtos_validade_quantidade" in " ".join(str(r[-1]) for r in plano)
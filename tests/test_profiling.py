@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config.profiling import ProfilerMiddleware
+
+
+def _client(tmp_path, **kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/calculo")
+    def calculo_lento():
+        return {"total": sum(i * i for i in range(10_000))}
+
+    app.add_middleware(ProfilerMiddleware, destino=tmp_path, **kwargs)
+    return TestClient(app)
+
+
+def test_header_com_token_devolve_relatorio(tmp_path):
+    client = _client(tmp_path, token="segredo")
+
+    response = client.get("/calculo", headers={"X-Profile": "segredo"})
+
+    assert response.status_code == 200
+    arquivo = tmp_path / response.headers["x-profile-arquivo"]
+    assert arquivo.exists()
+    assert arquivo.name.startswith("calculo_lento-")
+    assert "total" not in response.text
+
+
+def test_token_errado_nao_perfila(tmp_path):
+    client = _client(tmp_path, token="segredo")
+
+    response = client.get("/calculo", headers={"X-Profile": "outro"})
+
+    assert response.json()["total"] > 0
+    assert not list(tmp_path.iterdir())
+
+
+def test_amostragem_grava_sem_alterar_resposta(tmp_path):
+    client = _client(tmp_path, amostragem=1.0)
+
+    assert client.get("/calculo").json()["total"] > 0
+    assert [p.name.split("-")[0] for p in tmp_path.iterdir()] == ["calculo_lento"]
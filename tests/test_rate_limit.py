@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from config.load_shedding import ConcurrencyLimitMiddleware, pool_timeout_handler
+from config.rate_limit import MemoryTokenBucket, RateLimitMiddleware, RedisTokenBucket
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/lento")
+    async def lento():
+        await asyncio.sleep(0.3)
+        return {"ok": True}
+
+    @app.get("/rapido")
+    async def rapido():
+        return {"ok": True}
+
+    @app.get("/pool")
+    async def pool():
+        raise PoolTimeoutError("QueuePool limit reached")
+
+    app.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+    return app
+
+
+def test_token_bucket_libera_rajada_e_calcula_espera():
+    bucket = MemoryTokenBucket(rate=1, burst=2)
+    esperas = [asyncio.run(bucket.consume("ip:1")) for _ in range(3)]
+    assert esperas[:2] == [0, 0]
+    assert 0 < esperas[2] <= 1
+
+
+def test_redis_indisponivel_limita_no_processo():
+    # Nada escuta na porta 1: a conexão é recusada na hora.
+    bucket = RedisTokenBucket("redis://127.0.0.1:1/0", rate=1, burst=2)
+
+    async def consumir():
+        return [await bucket.consume("ip:1") for _ in range(3)]
+
+    esperas = asyncio.run(consumir())
+    assert esperas[:2] == [0, 0]
+    assert 0 < esperas[2] <= 1
+
+
+def test_rate_limit_por_api_key():
+    app = _app()
+    app.add_middleware(RateLimitMiddleware, bucket=MemoryTokenBucket(0.01, 2))
+    client = TestClient(app)
+
+    respostas = [
+        client.get("/rapido", headers={"X-API-Key": "a"}).status_code for _ in range(3)
+    ]
+    assert respostas == [200, 200, 429]
+    bloqueada = client.get("/rapido", headers={"X-API-Key": "a"})
+    assert int(bloqueada.headers["retry-after"]) >= 1
+    assert client.get("/rapido", headers={"X-API-Key": "b"}).status_code == 200
+
+
+def test_excesso_de_concorrencia_recebe_503():
+    app = _app()
+    app.add_middleware(ConcurrencyLimitMiddleware, limite=1, espera=0.05)
+
+    async def disparar():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            return await asyncio.gather(c.get("/lento"), c.get("/lento"))
+
+    respostas = asyncio.run(disparar())
+    assert sorted(r.status_code for r in respostas) == [200, 503]
+    recusada = next(r for r in respostas if r.status_code == 503)
+    assert recusada.headers["retry-after"] == "1"
+
+
+def test_timeout_do_pool_vira_503():
+    response = TestClient(_app()).get("/pool")
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
@@ -0,0 +1,111 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+
+from config.database import SessionLocal, engine
+from src import receitas
+from src.main import app
+from src.models.ingrediente_model import IngredienteModel
+from src.models.receita_model import ReceitaModel
+
+client = TestClient(app)
+
+
+def _receita(nome: str, ingredientes: dict[str, float]) -> dict:
+    return {
+        "nome_receita": nome,
+        "porcao_rendimento": "10 porções",
+        "ingrediente": list(ingredientes),
+        "quantidade": list(ingredientes.values()),
+        "modo_preparo": "Misturar.",
+        "margem_lucro": 0.3,
+        "preco_sugerido": 10,
+        "preco_venda": 12,
+        "custo_porcao": 1,
+        "custo_total": 10,
+        "lucro_sugerido": 2,
+    }
+
+
+def _contar(nome: str) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).where(IngredienteModel.nome == nome))
+
+
+def test_cria_receita_com_ingredientes_pelo_nome():
+    leite = f"leite {uuid.uuid4().hex}"
+    resposta = client.post(
+        "/receitas", json=_receita(leite, {leite: 1, "chocolate": 0.2})
+    )
+
+    assert resposta.status_code == 201
+    dados = resposta.json()
+    # Fora da ordem alfabética: a resposta mantém a ordem enviada.
+    assert dados["ingrediente"] == [leite, "chocolate"]
+    assert dados["quantidade"] == [1, 0.2]
+    with SessionLocal() as db:
+        id_ = db.scalar(
+            select(ReceitaModel.id).where(ReceitaModel.nome_receita == leite)
+        )
+    mostrada = client.get(f"/receita/{id_}?id_={id_}")
+    assert mostrada.json()["ingrediente"] == [leite, "chocolate"]
+    assert mostrada.json()["quantidade"] == [1, 0.2]
+
+
+def test_lote_resolve_ingredientes_de_uma_vez():
+    acucar = f"açúcar {uuid.uuid4().hex}"
+    lote = [
+        _receita(f"Receita {i}", {acucar: i, f"extra {uuid.uuid4().hex}": 1})
+        for i in range(1, 21)
+    ]
+    comandos = []
+
+    def registrar(_conn, _cursor, statement, *_args):
+        if "ingredientes" in statement:
+            comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        resposta = client.post("/receitas/lote", json=lote)
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert resposta.status_code == 201
+    assert len(resposta.json()) == 20
+    assert _contar(acucar) == 1
+    # Busca, INSERT dos novos, busca dos novos e leitura da resposta.
+    assert len(comandos) == 4
+
+
+def test_quantidade_por_ingrediente_obrigatoria():
+    receita = _receita("Bolo", {"farinha": 1})
+    receita["quantidade"] = []
+
+    assert client.post("/receitas", json=receita).status_code == 422
+
+
+def test_ingrediente_gravado_por_outra_transacao(monkeypatch):
+    canela = f"canela {uuid.uuid4().hex}"
+    with SessionLocal() as db:
+        db.add(IngredienteModel(nome=canela))
+        db.commit()
+        existente = db.scalar(
+            select(IngredienteModel.id).where(IngredienteModel.nome == canela)
+        )
+
+    # A primeira busca não enxerga o ingrediente, como se ele tivesse sido
+    # gravado logo depois dela; o INSERT então esbarra no índice único.
+    buscar = receitas._buscar_ingredientes
+    chamadas = iter([lambda db, nomes: {}])
+    monkeypatch.setattr(
+        receitas,
+        "_buscar_ingredientes",
+        lambda db, nomes: next(chamadas, buscar)(db, nomes),
+    )
+    with SessionLocal() as db:
+        ids = receitas.resolver_ingredientes(db, [canela])
+        db.commit()
+
+    assert ids == {canela: existente}
+    assert _contar(canela) == 1
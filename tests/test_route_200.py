@@ -45,3 +45,45 @@ def test_venda_index():
     response = client.get("/vendas")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+def test_pedido_index_fields():
+    response = client.get("/pedidos?fields=cliente_id,preco_total")
+    assert response.status_code == 200
+    for pedido in response.json():
+        assert set(pedido) == {"cliente_id", "preco_total"}
+
+
+def test_pedido_index_fields_invalido():
+    response = client.get("/pedidos?fields=senha")
+    assert response.status_code == 400
+
+
+def test_categoria_update_parcial():
+    client.post("/categorias", json={"categoria": "Tortas"})
+    response = client.patch("/categoria/1", params={"id_": 1}, json={})
+    assert response.status_code == 200
+    assert "categoria" in response.json()
+
+
+def test_categoria_update_inexistente():
+    response = client.patch(
+        "/categoria/0", params={"id_": 10**9}, json={"categoria": "Nada"}
+    )
+    assert response.status_code == 404
+
+
+def test_produto_update_limpa_coluna_anulavel(produto_id):
+    url = f"/produtos/{produto_id}"
+    response = client.patch(
+        url, params={"id_": produto_id}, json={"data_validade": None}
+    )
+    assert response.status_code == 200
+    assert response.json()["data_validade"] is None
+    assert response.json()["marca"] == "Casa"
+
+
+def test_produto_update_nulo_em_coluna_obrigatoria(produto_id):
+    url = f"/produtos/{produto_id}"
+    response = client.patch(url, params={"id_": produto_id}, json={"marca": None})
+    assert response.status_code == 422
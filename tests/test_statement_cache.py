@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+from config.queries import select_by_id
+from src.main import app
+from src.models.cliente_model import ClienteModel
+
+client = TestClient(app)
+
+
+def test_show_reaproveita_comando_compilado(cliente_id, admin_headers):
+    assert client.get(f"/clientes/{cliente_id}?id_={cliente_id}").status_code == 200
+    antes = client.get("/diagnostico/sql", headers=admin_headers).json()
+
+    for _ in range(3):
+        assert client.get(f"/clientes/{cliente_id}?id_={cliente_id}").status_code == 200
+
+    depois = client.get("/diagnostico/sql", headers=admin_headers).json()
+    assert depois["hits"] >= antes["hits"] + 3
+    assert depois["entradas"] <= depois["capacidade"]
+
+
+def test_select_by_id_montado_uma_vez():
+    assert select_by_id(ClienteModel) is select_by_id(ClienteModel)
@@ -0,0 +1,47 @@
+import asyncio
+import inspect
+import threading
+
+from fastapi.testclient import TestClient
+
+from config.threadpool import THREADPOOL_TOKENS, metricas, run_in_threadpool
+from src.main import app
+
+
+def test_run_in_threadpool_executa_fora_do_loop():
+    async def executar():
+        antes = metricas()["offload"]["chamadas"]
+        thread = await run_in_threadpool(threading.current_thread)
+        return thread, metricas()["offload"]["chamadas"] - antes
+
+    thread, chamadas = asyncio.run(executar())
+    assert thread is not threading.main_thread()
+    assert chamadas == 1
+
+
+def test_diagnostico_reflete_limite_configurado(admin_headers):
+    with TestClient(app) as client:
+        assert client.get("/pedidos").status_code == 200
+        dados = client.get("/diagnostico/pool", headers=admin_headers).json()
+    assert dados["threadpool"]["vagas"] == THREADPOOL_TOKENS
+    assert dados["offload"]["chamadas"] >= 1
+    assert dados["banco"]["capacidade"] == THREADPOOL_TOKENS
+
+
+def test_rotas_de_pedido_e_venda_nao_bloqueiam_o_loop():
+    # Só as listagens são async, e elas levam a sessão para o thread pool.
+    async_ok = {"pedido_index", "pedido_stream", "venda_index"}
+    rotas = [r for r in app.routes if r.path.startswith(("/pedido", "/venda"))]
+    assert rotas
+    for rota in rotas:
+        if rota.name not in async_ok:
+            assert not inspect.iscoroutinefunction(rota.endpoint), rota.name
+
+
+def test_rotas_do_cadastro_nao_bloqueiam_o_loop():
+    # Todas usam a sessão, então rodam no thread pool.
+    prefixos = ("/produto", "/categoria", "/receita")
+    rotas = [r for r in app.routes if r.path.startswith(prefixos)]
+    assert rotas
+    for rota in rotas:
+        assert not inspect.iscoroutinefunction(rota.endpoint), rota.name